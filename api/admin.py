@@ -54,6 +54,7 @@ class PlanInline(admin.StackedInline):
 class BNBInline(admin.StackedInline):
     model = BNB
     extra = 1
+    readonly_fields = ("rating_count", "rating_sum")
 
 
 @admin.register(Trip)
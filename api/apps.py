@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from django.conf import settings
+        from backend.ml import weather_client
+
+        weather_client.configure(**settings.WEATHER_CLIENT)
+
+        # connect the Destination page and cached User invalidation signals
+        from . import auth_cache, destinations  # noqa: F401
@@ -0,0 +1,286 @@
+"""
+Async weather endpoints for the ASGI application (backend.asgi).
+
+Upstream HTTP goes through the non-blocking weather client, so a single
+process can keep hundreds of weather requests in flight while they wait
+on Open-Meteo. Model inference is CPU-bound and runs on a small bounded
+thread pool so it never blocks the event loop.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from backend.ml.pipeline import predict_comfort_batch
+from backend.ml.model_store import ModelNotAvailableError
+from backend.ml.climatology import ClimatologyNotAvailableError, get_climatology
+from .forecast_cache import aget_forecast
+from .geocoding import acached_geocode_city, normalize_city_key
+from .views import (
+    CURRENT_WEATHER_PARAMS, climatology_results, climatology_station, comfort_forecast_params,
+    comfort_features, comfort_results, current_weather_payload, split_comfort_range,
+)
+
+_inference_executor = ThreadPoolExecutor(
+    max_workers=settings.COMFORT_INFERENCE_WORKERS, thread_name_prefix="comfort-inference"
+)
+
+
+async def run_inference(rows):
+    """Score feature rows on the inference pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_inference_executor, predict_comfort_batch, rows)
+
+
+def _request_data(request):
+    """JSON body or form fields, like DRF's request.data for the sync views."""
+    if request.content_type == "application/json":
+        return json.loads(request.body or "{}")
+    return request.POST
+
+
+### Current Weather (async) ###
+@require_http_methods(["GET"])
+async def current_weather_async(request):
+    """Get current weather temperature for a city"""
+    try:
+        city = request.GET.get("city")
+        if not city:
+            return JsonResponse({"error": "City parameter required"}, status=400)
+
+        geo = await acached_geocode_city(city)
+        if not geo:
+            return JsonResponse({"error": f"Could not find city: {city}"}, status=404)
+
+        api_resp = await aget_forecast(
+            float(geo["lat"]), float(geo["lon"]), CURRENT_WEATHER_PARAMS,
+            kind="current", required=("current",),
+        )
+        if "current" not in api_resp:
+            return JsonResponse({"error": "Weather fetch failed"}, status=500)
+
+        return JsonResponse(current_weather_payload(city, api_resp))
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+
+### Comfort by City (async) ###
+@csrf_exempt
+@require_http_methods(["POST"])
+async def comfort_by_city_async(request):
+    """Same contract as comfort_by_city, served without holding a worker."""
+    try:
+        try:
+            data = _request_data(request)
+        except json.JSONDecodeError:
+            return JsonResponse({"error": "Invalid JSON."}, status=400)
+
+        city = data.get("city")
+        start = data.get("start_date")
+        end = data.get("end_date")
+
+        if not city or not start or not end:
+            return JsonResponse({"error": "Missing required fields"}, status=400)
+
+        try:
+            forecast_range, climatology_range = split_comfort_range(start, end)
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid date range: {e}"}, status=400)
+
+        # days past the forecast horizon are table lookups; only unknown
+        # cities need a geocode to find their nearest station
+        results, geo = [], None
+        if climatology_range:
+            climatology = get_climatology()
+            if climatology.city_index(city) is None:
+                geo = await acached_geocode_city(city)
+            city_idx, distance_km = climatology_station(climatology, city, geo)
+            if city_idx is None:
+                return JsonResponse({"error": f"No climatology available for {city}"}, status=404)
+            results = climatology_results(city, climatology, city_idx, *climatology_range, distance_km)
+
+        if not forecast_range:
+            return JsonResponse({"results": results}, status=200)
+
+        # the forecast needs the coordinates, so these two calls are inherently sequential
+        geo = geo or await acached_geocode_city(city)
+        if not geo:
+            return JsonResponse({"error": "Geocoding failed"}, status=500)
+
+        lat = float(geo["lat"])
+        lon = float(geo["lon"])
+        api_resp = await aget_forecast(
+            lat, lon, comfort_forecast_params(*forecast_range),
+            kind="daily", required=("daily", "hourly"),
+        )
+
+        if "daily" not in api_resp or "hourly" not in api_resp:
+            return JsonResponse({"error": "Weather fetch failed", "raw": api_resp}, status=500)
+
+        X = comfort_features(api_resp, lat, lon)
+        scores = await run_inference(X)
+
+        results = comfort_results(city, api_resp, X, scores) + results
+        return JsonResponse({"results": results}, status=200)
+
+    except (ModelNotAvailableError, ClimatologyNotAvailableError) as e:
+        return JsonResponse({"error": str(e)}, status=503)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+
+async def _fetch_city(city, forecast_range, climatology, climatology_range, semaphore):
+    """
+    Geocode + forecast one city under the shared concurrency cap, and look up
+    its days past the forecast horizon in the climatology table.
+    """
+    async with semaphore:
+        # no geocode needed when every day comes from a dataset city's own row
+        # (without a forecast range there always is a climatology range)
+        geo = None
+        if forecast_range or climatology.city_index(city) is None:
+            geo = await acached_geocode_city(city)
+            if not geo and forecast_range:
+                return {"city": city, "error": "Geocoding failed"}
+
+        entry = {"city": city, "api_resp": None, "climatology": []}
+        if climatology_range:
+            city_idx, distance_km = climatology_station(climatology, city, geo)
+            if city_idx is None:
+                return {"city": city, "error": f"No climatology available for {city}"}
+            entry["climatology"] = climatology_results(city, climatology, city_idx, *climatology_range, distance_km)
+            geo = geo or {"lat": climatology.lat[city_idx], "lon": climatology.lon[city_idx]}
+
+        entry["lat"], entry["lon"] = float(geo["lat"]), float(geo["lon"])
+        if forecast_range:
+            api_resp = await aget_forecast(
+                entry["lat"], entry["lon"], comfort_forecast_params(*forecast_range),
+                kind="daily", required=("daily", "hourly"),
+            )
+            if "daily" not in api_resp or "hourly" not in api_resp:
+                return {"city": city, "error": "Weather fetch failed"}
+            entry["api_resp"] = api_resp
+
+        return entry
+
+
+### Compare Comfort Across Cities (async) ###
+@csrf_exempt
+@require_http_methods(["POST"])
+async def compare_comfort_async(request):
+    """
+    Score several cities over one date range and rank them.
+
+    Body: {"cities": [...], "start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD"}
+    All cities are fetched concurrently (capped by COMFORT_COMPARE_CONCURRENCY)
+    and every forecast city-day is scored in a single model batch. Days past
+    the forecast horizon come from the climatology table, as for comfort_by_city.
+    """
+    try:
+        try:
+            data = _request_data(request)
+        except json.JSONDecodeError:
+            return JsonResponse({"error": "Invalid JSON."}, status=400)
+
+        cities = data.get("cities")
+        start = data.get("start_date")
+        end = data.get("end_date")
+
+        if not isinstance(cities, list) or not cities or not start or not end:
+            return JsonResponse({"error": "cities (list), start_date and end_date are required"}, status=400)
+
+        # drop blanks and duplicates that only differ in case/whitespace
+        unique = {}
+        for city in cities:
+            key = normalize_city_key(city) if isinstance(city, str) else ""
+            if key and key not in unique:
+                unique[key] = city.strip()
+        cities = list(unique.values())
+
+        if not cities:
+            return JsonResponse({"error": "cities (list), start_date and end_date are required"}, status=400)
+        if len(cities) > settings.COMFORT_COMPARE_MAX_CITIES:
+            return JsonResponse(
+                {"error": f"At most {settings.COMFORT_COMPARE_MAX_CITIES} cities can be compared"}, status=400
+            )
+
+        try:
+            forecast_range, climatology_range = split_comfort_range(start, end)
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid date range: {e}"}, status=400)
+        climatology = get_climatology() if climatology_range else None
+
+        # -----------------------------
+        # 1. Geocode + forecast every city concurrently
+        # -----------------------------
+        semaphore = asyncio.Semaphore(settings.COMFORT_COMPARE_CONCURRENCY)
+        fetched = await asyncio.gather(
+            *(_fetch_city(city, forecast_range, climatology, climatology_range, semaphore) for city in cities),
+            return_exceptions=True,
+        )
+
+        ok, errors = [], []
+        for city, result in zip(cities, fetched):
+            if isinstance(result, Exception):
+                errors.append({"city": city, "error": str(result)})
+            elif "error" in result:
+                errors.append(result)
+            else:
+                ok.append(result)
+
+        # -----------------------------
+        # 2. Score every forecast city-day in one batch
+        # -----------------------------
+        features, total = [], 0
+        for entry in ok:
+            X = comfort_features(entry["api_resp"], entry["lat"], entry["lon"]) if entry["api_resp"] else None
+            features.append((X, total))
+            total += len(X) if X is not None else 0
+
+        scores = await run_inference(np.vstack([X for X, _ in features if X is not None])) if total else []
+
+        # -----------------------------
+        # 3. Per-city results + ranking by average comfort
+        # -----------------------------
+        city_results = []
+        for entry, (X, lo) in zip(ok, features):
+            results = []
+            if X is not None:
+                results = comfort_results(entry["city"], entry["api_resp"], X, scores[lo:lo + len(X)])
+            results += entry["climatology"]
+            comfort = [r["comfort_score"] for r in results]
+            city_results.append({
+                "city": entry["city"],
+                "lat": entry["lat"],
+                "lon": entry["lon"],
+                "average_comfort": float(sum(comfort) / len(comfort)) if comfort else None,
+                "results": results,
+            })
+
+        ranked = sorted(
+            (c for c in city_results if c["average_comfort"] is not None),
+            key=lambda c: c["average_comfort"], reverse=True,
+        )
+        ranking = [
+            {"rank": i + 1, "city": c["city"], "average_comfort": c["average_comfort"]}
+            for i, c in enumerate(ranked)
+        ]
+
+        return JsonResponse({
+            "start_date": start,
+            "end_date": end,
+            "cities": city_results,
+            "ranking": ranking,
+            "errors": errors,
+        }, status=200)
+
+    except (ModelNotAvailableError, ClimatologyNotAvailableError) as e:
+        return JsonResponse({"error": str(e)}, status=503)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
@@ -0,0 +1,83 @@
+"""
+Authentication hot path: cached user lookups and lazy session refresh.
+
+CachedModelBackend serves the per-request User lookup from Django's cache
+(entries are dropped whenever the User row is saved or deleted), and
+SessionRefreshMiddleware only rewrites a session when it is within
+SESSION_REFRESH_WINDOW of expiring. Together with the cached_db session
+engine, an authenticated request that doesn't change the session (such as
+/api/check-auth/) needs no database access once the caches are warm.
+
+The cached backend and session engine are only configured with a
+SHARED_CACHE: invalidation has to reach every worker. Note that:
+- cached entries are whole User instances, password hash included, so the
+  shared cache must be as private as the database;
+- queryset .update() (and bulk_update) on users sends no post_save, so
+  such changes (e.g. deactivating users in bulk) only apply once the
+  entries expire after AUTH_USER_CACHE_TTL, unless the caller deletes
+  user_cache_key(user_id) itself.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Session key holding when the session (and its cookie) last got a full lifetime
+ISSUED_AT_KEY = "_issued_at"
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose get_user() is served from the cache for AUTH_USER_CACHE_TTL seconds."""
+
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(key, user, timeout=settings.AUTH_USER_CACHE_TTL)
+        return user if self.user_can_authenticate(user) else None
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    cache.delete(user_cache_key(instance.pk))
+
+
+class SessionRefreshMiddleware:
+    """
+    Re-save an authenticated session (renewing its expiry and cookie) only
+    when less than SESSION_REFRESH_WINDOW seconds of it are left, instead of
+    writing it on every request. Must come after SessionMiddleware and
+    AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        session = getattr(request, "session", None)
+        user = getattr(request, "user", None)
+        if session is None or user is None or not user.is_authenticated:
+            return response
+
+        now = int(time.time())
+        if session.modified:
+            # being saved anyway (login, data change): restart the clock for free
+            session[ISSUED_AT_KEY] = now
+        else:
+            issued_at = session.get(ISSUED_AT_KEY, 0)
+            if issued_at + settings.SESSION_COOKIE_AGE - now < settings.SESSION_REFRESH_WINDOW:
+                session[ISSUED_AT_KEY] = now
+        return response
@@ -0,0 +1,169 @@
+"""
+Browsing and searching the Destination catalogue.
+
+Pages are ordered by id and fetched with an id > cursor seek on the
+(region_key, category_key, id) / (category_key, id) indexes, selecting only
+the serialized columns. Text search over name and description uses the
+full-text index built by migration 0013 (SQLite FTS5 or a Postgres GIN
+tsvector index), falling back to icontains elsewhere.
+
+Pages are cached under a version number that every Destination save or
+delete bumps, so a write invalidates all cached pages at once. Bulk writes
+skip signals and must call invalidate_destinations_cache() themselves.
+The version only reaches other workers through a shared cache, so pages
+are only cached when SHARED_CACHE is set (REDIS_URL); with per-process
+caches each worker would keep serving pages another worker invalidated.
+"""
+import hashlib
+import json
+import re
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Destination, normalize_label
+
+DESTINATION_FIELDS = ("id", "slug", "name", "image_url", "price", "category", "region", "link", "description")
+
+FTS_TABLE = "api_destination_fts"
+# must match the expression of the GIN index in migration 0013
+POSTGRES_DOCUMENT = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+VERSION_KEY = "destinations:version"
+
+_search_backends = {}
+
+
+# -------------------------------------------------------------------
+# Search
+# -------------------------------------------------------------------
+def search_backend():
+    """'fts5', 'postgres' or 'icontains' for the default database."""
+    key = (connection.alias, str(connection.settings_dict["NAME"]))
+    if key not in _search_backends:
+        if connection.vendor == "postgresql":
+            _search_backends[key] = "postgres"
+        elif connection.vendor == "sqlite" and FTS_TABLE in connection.introspection.table_names():
+            _search_backends[key] = "fts5"
+        else:
+            _search_backends[key] = "icontains"
+    return _search_backends[key]
+
+
+def search_terms(query):
+    return re.findall(r"\w+", query or "")
+
+
+def search_destinations(qs, query):
+    """Restrict qs to destinations whose name or description contain every word of query (as a prefix)."""
+    terms = search_terms(query)
+    if not terms:
+        return qs.none()
+
+    backend = search_backend()
+    if backend == "fts5":
+        # quoted prefix terms, implicitly ANDed; quoting keeps FTS5 syntax out of user input
+        match = " ".join(f'"{term}"*' for term in terms)
+        return qs.filter(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,)))
+    if backend == "postgres":
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        matches = RawSQL(f"{POSTGRES_DOCUMENT} @@ to_tsquery('english', %s)", (tsquery,), output_field=BooleanField())
+        return qs.annotate(search_match=matches).filter(search_match=True)
+
+    for term in terms:
+        qs = qs.filter(Q(name__icontains=term) | Q(description__icontains=term))
+    return qs
+
+
+# -------------------------------------------------------------------
+# Pages
+# -------------------------------------------------------------------
+def destinations_page(region=None, category=None, query=None, cursor=None, limit=None):
+    """
+    returns: {"results": [...], "next_cursor": str or None}; next_cursor is
+             the last id on the page when another page follows
+    """
+    limit = limit or settings.DESTINATIONS_PAGE_SIZE
+    qs = Destination.objects.all()
+    if region:
+        qs = qs.filter(region_key=normalize_label(region))
+    if category:
+        qs = qs.filter(category_key=normalize_label(category))
+    if query:
+        qs = search_destinations(qs, query)
+    if cursor is not None:
+        qs = qs.filter(id__gt=cursor)
+
+    rows = list(qs.order_by("id").values(*DESTINATION_FIELDS)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "results": [{
+            "id": row["slug"],
+            "name": row["name"],
+            "image": row["image_url"],
+            "price": row["price"],
+            "category": row["category"],
+            "region": row["region"],
+            "link": row["link"],
+            "description": row["description"],
+        } for row in rows],
+        "next_cursor": str(rows[-1]["id"]) if has_more else None,
+    }
+
+
+# -------------------------------------------------------------------
+# Cache
+# -------------------------------------------------------------------
+def _cache_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # a fresh, never-before-used version, in case the counter was evicted
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_destinations_cache():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def cached_destinations_page(**params):
+    """
+    destinations_page(), cached until the next Destination write or
+    DESTINATIONS_CACHE_TTL. Not cached without a SHARED_CACHE.
+    """
+    if not settings.SHARED_CACHE:
+        return destinations_page(**params)
+
+    canonical = {
+        "region": normalize_label(params.get("region")),
+        "category": normalize_label(params.get("category")),
+        "q": " ".join(search_terms(params.get("query"))).casefold(),
+        "cursor": params.get("cursor"),
+        "limit": params.get("limit") or settings.DESTINATIONS_PAGE_SIZE,
+    }
+    digest = hashlib.sha1(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+    key = f"destinations:{_cache_version()}:{digest}"
+
+    page = cache.get(key)
+    if page is None:
+        page = destinations_page(**params)
+        cache.set(key, page, timeout=settings.DESTINATIONS_CACHE_TTL)
+    return page
+
+
+@receiver(post_save, sender=Destination)
+@receiver(post_delete, sender=Destination)
+def _destination_changed(sender, **kwargs):
+    invalidate_destinations_cache()
@@ -0,0 +1,152 @@
+"""
+TTL cache with stale-while-revalidate for Open-Meteo forecast calls.
+
+Entries are keyed by rounded lat/lon plus the requested variables and
+date range, and live in Django's cache so a shared backend (see CACHES)
+is reused by every worker. Fresh entries are served as-is; stale ones
+are served immediately while a single background refresh repopulates
+them; expired or missing ones are fetched inline.
+"""
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from backend.ml.weather_client import get_async_client, get_client
+
+# Parameters holding comma-separated variable lists (order doesn't matter)
+VARIABLE_PARAMS = ("current", "daily", "hourly")
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="forecast-refresh")
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stale": 0, "refreshes": 0, "refresh_errors": 0}
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def forecast_cache_stats():
+    """Snapshot of this process's hit/miss/staleness counters."""
+    with _stats_lock:
+        snapshot = dict(_stats)
+    lookups = snapshot["hits"] + snapshot["stale"] + snapshot["misses"]
+    snapshot["hit_ratio"] = (snapshot["hits"] + snapshot["stale"]) / lookups if lookups else None
+    return snapshot
+
+
+def reset_forecast_cache_stats():
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def _ttls(kind):
+    """(fresh, stale) lifetimes in seconds for an endpoint kind."""
+    fresh = settings.FORECAST_CACHE_TTLS.get(kind, settings.FORECAST_CACHE_TTLS["default"])
+    stale = settings.FORECAST_CACHE_STALE_TTLS.get(kind, settings.FORECAST_CACHE_STALE_TTLS["default"])
+    return fresh, stale
+
+
+def build_forecast_params(lat, lon, params):
+    """Round coordinates and canonicalize variable lists so equal requests share a key."""
+    precision = settings.FORECAST_CACHE_COORD_PRECISION
+    canonical = {"latitude": round(float(lat), precision), "longitude": round(float(lon), precision)}
+    for name, value in params.items():
+        if name in VARIABLE_PARAMS:
+            value = ",".join(sorted(v.strip() for v in str(value).split(",") if v.strip()))
+        canonical[name] = str(value)
+    return canonical
+
+
+def forecast_cache_key(kind, params):
+    raw = "&".join(f"{k}={params[k]}" for k in sorted(params))
+    return f"forecast:{kind}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def fetch_forecast(params):
+    """Fetch a forecast from Open-Meteo (uncached)."""
+    return get_client().forecast(params)
+
+
+def _store(key, kind, data):
+    fresh, stale = _ttls(kind)
+    cache.set(key, {"data": data, "fetched_at": time.time()}, timeout=fresh + stale)
+
+
+def _refresh(key, kind, params, required):
+    try:
+        data = fetch_forecast(params)
+        if all(field in data for field in required):
+            _store(key, kind, data)
+            _count("refreshes")
+        else:
+            _count("refresh_errors")
+    except Exception:
+        _count("refresh_errors")
+    finally:
+        cache.delete(f"{key}:refreshing")
+
+
+def _lookup(key, kind, params, required):
+    """Return cached data (scheduling a refresh if stale), or None on a miss."""
+    fresh, _ = _ttls(kind)
+
+    entry = cache.get(key)
+    if entry is None:
+        _count("misses")
+        return None
+
+    if time.time() - entry["fetched_at"] < fresh:
+        _count("hits")
+    else:
+        _count("stale")
+        # only the first caller to take the lock schedules a refresh
+        if cache.add(f"{key}:refreshing", True, timeout=settings.FORECAST_CACHE_REFRESH_TIMEOUT):
+            _refresh_executor.submit(_refresh, key, kind, params, required)
+    return entry["data"]
+
+
+def get_forecast(lat, lon, params, kind="default", required=()):
+    """
+    lat, lon: location to forecast (rounded before fetching and keying)
+    params: remaining Open-Meteo query parameters (variables, dates, timezone)
+    kind: endpoint name selecting the TTLs in FORECAST_CACHE_TTLS
+    required: response fields that must be present for the answer to be cached
+    returns: the decoded Open-Meteo response
+    """
+    params = build_forecast_params(lat, lon, params)
+    key = forecast_cache_key(kind, params)
+
+    data = _lookup(key, kind, params, required)
+    if data is not None:
+        return data
+
+    data = fetch_forecast(params)
+    if all(field in data for field in required):
+        _store(key, kind, data)
+    return data
+
+
+async def aget_forecast(lat, lon, params, kind="default", required=()):
+    """
+    Async get_forecast. Misses are fetched with the non-blocking client;
+    stale refreshes still run on the background thread pool.
+    """
+    params = build_forecast_params(lat, lon, params)
+    key = forecast_cache_key(kind, params)
+
+    data = await sync_to_async(_lookup, thread_sensitive=False)(key, kind, params, required)
+    if data is not None:
+        return data
+
+    data = await get_async_client().forecast(params)
+    if all(field in data for field in required):
+        await sync_to_async(_store, thread_sensitive=False)(key, kind, data)
+    return data
@@ -0,0 +1,154 @@
+"""
+Two-tier cache in front of backend.ml.weather_utils.geocode_city.
+
+Tier 1 is an in-process LRU, tier 2 is the GeocodeCache table shared by
+every worker and instance. Only a miss in both tiers goes upstream.
+Unknown names (a 200 answer without results) are cached too (negative
+caching), but expire after GEOCODE_NEGATIVE_TTL so newly indexed places
+eventually resolve. Failed lookups raise WeatherClientError and are not
+cached at all.
+"""
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+from backend.ml.weather_client import get_async_client
+from backend.ml.weather_utils import geocode_city
+from .models import GeocodeCache
+
+# Marks a cached "not found" answer so it can be told apart from a cache miss
+NOT_FOUND = object()
+
+
+def normalize_city_key(city_name):
+    """Fold case and collapse whitespace so '  new   YORK ' == 'New York'."""
+    return " ".join(str(city_name).split()).casefold()
+
+
+class _LRUCache:
+    """Small thread-safe LRU; values are (result, expires_at) pairs."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            result, expires_at = entry
+            if expires_at is not None and expires_at <= timezone.now():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return result
+
+    def set(self, key, result, expires_at=None):
+        with self._lock:
+            self._data[key] = (result, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_memory_cache = _LRUCache(getattr(settings, "GEOCODE_CACHE_SIZE", 2048))
+
+
+def _negative_ttl():
+    return timedelta(seconds=getattr(settings, "GEOCODE_NEGATIVE_TTL", 24 * 60 * 60))
+
+
+def _entry_result(entry):
+    """Convert a GeocodeCache row into (result, expires_at) for the LRU."""
+    if entry.found:
+        return {"lat": entry.lat, "lon": entry.lon}, None
+    return NOT_FOUND, entry.updated_at + _negative_ttl()
+
+
+def lookup_cached(key):
+    """
+    Check both cache tiers for a normalized key.
+    returns: coordinate dict, NOT_FOUND, or None on a miss
+    """
+    result = _memory_cache.get(key)
+    if result is not None:
+        return result
+
+    entry = GeocodeCache.objects.filter(key=key).first()
+    if entry is None:
+        return None
+
+    result, expires_at = _entry_result(entry)
+    if expires_at is not None and expires_at <= timezone.now():
+        return None
+
+    _memory_cache.set(key, result, expires_at)
+    return result
+
+
+def store(key, query, geo):
+    """Record an upstream answer (coordinate dict or None) in both tiers."""
+    defaults = {
+        "query": query,
+        "lat": geo["lat"] if geo else None,
+        "lon": geo["lon"] if geo else None,
+        "found": geo is not None,
+    }
+    try:
+        entry, _ = GeocodeCache.objects.update_or_create(key=key, defaults=defaults)
+    except IntegrityError:
+        # another worker stored the same key first; its answer is as good as ours
+        entry = GeocodeCache.objects.get(key=key)
+
+    result, expires_at = _entry_result(entry)
+    _memory_cache.set(key, result, expires_at)
+    return result
+
+
+def cached_geocode_city(city_name):
+    """
+    Drop-in replacement for geocode_city that consults the caches first.
+    returns: {"lat": ..., "lon": ...} or None if the city is unknown
+    """
+    key = normalize_city_key(city_name)
+    if not key:
+        return None
+
+    result = lookup_cached(key)
+    if result is None:
+        result = store(key, city_name, geocode_city(city_name))
+
+    return None if result is NOT_FOUND else dict(result)
+
+
+async def acached_geocode_city(city_name):
+    """Async cached_geocode_city: the upstream call is non-blocking, DB access runs in a thread."""
+    key = normalize_city_key(city_name)
+    if not key:
+        return None
+
+    # the in-process tier needs no I/O, so check it on the event loop
+    result = _memory_cache.get(key)
+    if result is None:
+        result = await sync_to_async(lookup_cached)(key)
+    if result is None:
+        geo = await get_async_client().geocode(city_name)
+        result = await sync_to_async(store)(key, city_name, geo)
+
+    return None if result is NOT_FOUND else dict(result)
+
+
+def clear_memory_cache():
+    """Drop the in-process tier (the shared table is left untouched)."""
+    _memory_cache.clear()
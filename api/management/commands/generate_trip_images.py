@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from api.models import Trip
+from api.trip_images import generate_trip_image_variants
+
+
+class Command(BaseCommand):
+    help = "Render the resized image variants of trips uploaded before they existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--refresh", action="store_true",
+            help="Re-render trips that already have variants (e.g. after changing TRIP_IMAGE_VARIANTS).",
+        )
+
+    def handle(self, *args, **options):
+        trips = Trip.objects.exclude(image="").exclude(image__isnull=True)
+        if not options["refresh"]:
+            trips = trips.filter(image_variants={})
+
+        rendered = failed = 0
+        for trip_id in trips.values_list("id", flat=True).iterator():
+            try:
+                generate_trip_image_variants(trip_id)
+                rendered += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Trip {trip_id}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(f"Trip images rendered: {rendered}, failed: {failed}."))
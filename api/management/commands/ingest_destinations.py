@@ -0,0 +1,144 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.text import slugify
+
+from api.destinations import invalidate_destinations_cache
+from api.models import Destination
+
+# Columns written on conflict (everything but the slug itself)
+UPDATE_FIELDS = ["name", "image_url", "price", "category", "region", "link", "description", "region_key", "category_key"]
+
+
+def _read_json(f):
+    """
+    A JSON array of records, or a SerpAPI-style {"results": {region: [records]}}
+    dump such as frontend/public/practice_results.json (the region comes from the key).
+    """
+    data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get("results"), dict):
+        for region, records in data["results"].items():
+            for record in records:
+                yield {"region": region, **record}
+    elif isinstance(data, dict) and isinstance(data.get("results"), list):
+        yield from data["results"]
+    elif isinstance(data, list):
+        yield from data
+    else:
+        raise CommandError("JSON input must be a list of destinations or have a 'results' key.")
+
+
+def _read_jsonl(f):
+    for line_no, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f"Line {line_no}: {e}")
+
+
+READERS = {"json": _read_json, "jsonl": _read_jsonl, "csv": csv.DictReader}
+
+
+def to_destination(record):
+    """
+    Destination for one input record (SerpAPI or model field names), or
+    None if the record isn't an object or has no name/slug.
+    """
+    if not isinstance(record, dict):
+        return None
+    name = str(record.get("name") or record.get("title") or "").strip()
+    # ids may be numbers, and neither they nor given slugs are guaranteed URL-safe
+    slug = slugify(str(record.get("slug") or record.get("id") or name))[:255]
+    if not name or not slug:
+        return None
+
+    price = record.get("price")
+    if not price and record.get("flight_price"):
+        price = f"From {record['flight_price']}"
+    elif not price and record.get("extracted_flight_price"):
+        price = f"From ${record['extracted_flight_price']}"
+
+    destination = Destination(
+        slug=slug,
+        name=name[:400],
+        image_url=record.get("image_url") or record.get("image") or record.get("thumbnail") or None,
+        price=str(price)[:100] if price else None,
+        category=(record.get("category") or None),
+        region=(record.get("region") or None),
+        link=record.get("link") or None,
+        description=record.get("description") or None,
+    )
+    # bulk_create skips save(), which normally fills these in
+    destination.set_keys()
+    return destination
+
+
+def batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = "Upsert destinations (by slug) from a JSON, JSONL or CSV dump in batched bulk writes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Dump to load.")
+        parser.add_argument(
+            "--format", choices=sorted(READERS),
+            help="Input format (default: from the file extension). JSONL and CSV are streamed; "
+                 "JSON is parsed whole.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT ... ON CONFLICT statement.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+        fmt = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in READERS:
+            raise CommandError(f"Unknown format {fmt!r}; pass --format {{{','.join(sorted(READERS))}}}.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        read = upserted = skipped = 0
+        start = time.perf_counter()
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                for batch in batches(READERS[fmt](f), options["batch_size"]):
+                    read += len(batch)
+                    # one row per slug per statement (the last one wins), as
+                    # ON CONFLICT can't update the same row twice
+                    by_slug = {}
+                    for record in batch:
+                        destination = to_destination(record)
+                        if destination is None:
+                            skipped += 1
+                        else:
+                            by_slug[destination.slug] = destination
+
+                    with transaction.atomic():
+                        Destination.objects.bulk_create(
+                            by_slug.values(),
+                            update_conflicts=True,
+                            unique_fields=["slug"],
+                            update_fields=UPDATE_FIELDS,
+                        )
+                    upserted += len(by_slug)
+        finally:
+            # bulk writes don't send the signals that normally invalidate cached pages
+            if upserted:
+                invalidate_destinations_cache()
+
+        elapsed = time.perf_counter() - start
+        rate = read / elapsed if elapsed else float("inf")
+        self.stdout.write(self.style.SUCCESS(
+            f"Destinations ingested: {upserted} upserted, {skipped} skipped (not an object, or no name or slug), "
+            f"{read} rows read in {elapsed:.2f}s ({rate:,.0f} rows/s)."
+        ))
@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.geocoding import normalize_city_key, store
+from api.models import GeocodeCache
+
+DEFAULT_CSV = os.path.join(settings.BASE_DIR, "backend", "ml", "data", "historical_weather_master.csv")
+
+
+class Command(BaseCommand):
+    help = "Prewarm the shared geocode cache with the cities in the historical weather dataset."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--csv", default=DEFAULT_CSV, help="Dataset with city, lat and lon columns.")
+        parser.add_argument(
+            "--refresh", action="store_true",
+            help="Overwrite cities that are already cached instead of skipping them.",
+        )
+
+    def handle(self, *args, **options):
+        csv_path = options["csv"]
+        if not os.path.exists(csv_path):
+            raise CommandError(f"Dataset not found: {csv_path}")
+
+        # The dataset already carries coordinates, so no upstream calls are needed
+        cities = (
+            pd.read_csv(csv_path, usecols=["city", "lat", "lon"])
+            .drop_duplicates("city")
+            .itertuples(index=False)
+        )
+
+        existing = set(GeocodeCache.objects.values_list("key", flat=True))
+        added = skipped = 0
+        for city, lat, lon in cities:
+            key = normalize_city_key(city)
+            if key in existing and not options["refresh"]:
+                skipped += 1
+                continue
+            store(key, city, {"lat": float(lat), "lon": float(lon)})
+            added += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Geocode cache prewarmed: {added} stored, {skipped} already cached."))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, Q, Sum
+
+from api.models import BNB, recompute_bnb_rating_totals
+
+
+class Command(BaseCommand):
+    help = "Recompute every BNB's rating_count / rating_sum from its ratings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Only report BNBs whose totals have drifted; don't fix them.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = (
+            BNB.objects.annotate(n=Count("ratings"), s=Sum("ratings__value", default=0))
+            .filter(~Q(rating_count=F("n")) | ~Q(rating_sum=F("s")))
+            .count()
+        )
+        if options["check"]:
+            self.stdout.write(f"BNBs with drifted rating totals: {drifted}.")
+            return
+
+        updated = recompute_bnb_rating_totals()
+        self.stdout.write(self.style.SUCCESS(f"Rating totals recomputed for {updated} BNBs ({drifted} had drifted)."))
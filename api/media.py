@@ -0,0 +1,143 @@
+"""
+Serving of user-uploaded media (MEDIA_ROOT).
+
+Responses carry a strong ETag (size + mtime) and Last-Modified, so
+revalidations are answered with 304 without touching the file. Single
+byte ranges are honoured (206/416), and names under MEDIA_IMMUTABLE_PREFIXES
+(content-hashed derivatives, see api.trip_images) are cached for a year.
+With MEDIA_SERVE_OFFLOAD set, the app only checks the request and sets
+headers. The front proxy then sends the file itself, via nginx
+X-Accel-Redirect or Apache/lighttpd X-Sendfile.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def media_etag(stat):
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def cache_control(path):
+    if path.startswith(tuple(settings.MEDIA_IMMUTABLE_PREFIXES)):
+        return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    return f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}"
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive byte positions for a single-range Range header,
+    None to serve the whole file (no header, or one we don't handle such as
+    multiple ranges), or ValueError when the range can't be satisfied.
+    """
+    match = _RANGE_RE.match(header.replace(" ", "")) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def _range_applies(request, etag, mtime):
+    """If-Range: only serve a partial response if the client's copy is current."""
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(mtime) <= since
+
+
+def _file_chunks(full_path, start, length):
+    with open(full_path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _offload_headers(response, full_path, path):
+    if settings.MEDIA_SERVE_OFFLOAD == "x-accel-redirect":
+        response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + quote(path)
+    elif settings.MEDIA_SERVE_OFFLOAD == "x-sendfile":
+        response["X-Sendfile"] = full_path
+    else:
+        raise ValueError(f"Unknown MEDIA_SERVE_OFFLOAD {settings.MEDIA_SERVE_OFFLOAD!r}")
+
+
+@require_safe
+def serve_media(request, path):
+    """GET/HEAD a file under MEDIA_ROOT."""
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404("Media file not found.")
+    if not os.path.isfile(full_path):
+        raise Http404("Media file not found.")
+
+    etag = media_etag(stat)
+    content_type, encoding = mimetypes.guess_type(full_path)
+    headers = HttpResponse(content_type=content_type or "application/octet-stream")
+    headers["ETag"] = etag
+    headers["Last-Modified"] = http_date(stat.st_mtime)
+    headers["Cache-Control"] = cache_control(path)
+    headers["Accept-Ranges"] = "bytes"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime), response=headers)
+    if conditional is not headers:
+        return conditional
+
+    if settings.MEDIA_SERVE_OFFLOAD:
+        # the proxy serves the body and handles Range itself
+        _offload_headers(headers, full_path, path)
+        return headers
+
+    size = stat.st_size
+    try:
+        byte_range = parse_range(request.headers.get("Range"), size) if _range_applies(request, etag, stat.st_mtime) else None
+    except ValueError:
+        headers.status_code = 416
+        headers["Content-Range"] = f"bytes */{size}"
+        return headers
+
+    start, end = byte_range or (0, size - 1)
+    length = end - start + 1 if size else 0
+    response = StreamingHttpResponse(_file_chunks(full_path, start, length), status=206 if byte_range else 200)
+    for name, value in headers.items():
+        response[name] = value
+    response["Content-Length"] = str(length)
+    if byte_range:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
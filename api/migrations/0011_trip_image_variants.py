@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_geocodecache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trip',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-17 19:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_rating_totals(apps, schema_editor):
+    BNB = apps.get_model("api", "BNB")
+    Rating = apps.get_model("api", "Rating")
+    per_bnb = Rating.objects.filter(bnb=OuterRef("pk")).order_by().values("bnb")
+    BNB.objects.update(
+        rating_count=Coalesce(Subquery(per_bnb.annotate(n=Count("id")).values("n")), Value(0)),
+        rating_sum=Coalesce(Subquery(per_bnb.annotate(s=Sum("value")).values("s")), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_trip_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bnb',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='bnb',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_rating_totals, migrations.RunPython.noop),
+    ]
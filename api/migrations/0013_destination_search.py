@@ -0,0 +1,103 @@
+# Generated by Django 5.2.6 on 2026-10-17 19:46
+
+from django.db import migrations, models
+
+# Full-text index over name + description (queried by api.destinations.search_destinations).
+# SQLite: an external-content FTS5 table kept in sync by triggers, so bulk
+# writes are indexed too. Note that Django drops these triggers whenever it
+# rebuilds api_destination on SQLite (most AlterField/RemoveField operations);
+# such a migration must re-run create_search_index afterwards.
+SQLITE_FTS = [
+    "CREATE VIRTUAL TABLE api_destination_fts USING fts5("
+    "name, description, content='api_destination', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER api_destination_fts_ai AFTER INSERT ON api_destination BEGIN "
+    "INSERT INTO api_destination_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER api_destination_fts_ad AFTER DELETE ON api_destination BEGIN "
+    "INSERT INTO api_destination_fts(api_destination_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER api_destination_fts_au AFTER UPDATE OF name, description ON api_destination BEGIN "
+    "INSERT INTO api_destination_fts(api_destination_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO api_destination_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "INSERT INTO api_destination_fts(api_destination_fts) VALUES ('rebuild')",
+]
+SQLITE_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS api_destination_fts_ai",
+    "DROP TRIGGER IF EXISTS api_destination_fts_ad",
+    "DROP TRIGGER IF EXISTS api_destination_fts_au",
+    "DROP TABLE IF EXISTS api_destination_fts",
+]
+# Postgres: a GIN expression index; the expression must match the query's exactly
+POSTGRES_FTS = [
+    "CREATE INDEX destination_search_idx ON api_destination USING GIN "
+    "(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')))",
+]
+POSTGRES_FTS_DROP = ["DROP INDEX IF EXISTS destination_search_idx"]
+
+
+def _sqlite_has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any(row[0] == "ENABLE_FTS5" for row in cursor.fetchall())
+
+
+def _run(schema_editor, statements):
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite" and _sqlite_has_fts5(connection):
+        _run(schema_editor, SQLITE_FTS_DROP + SQLITE_FTS)
+    elif connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FTS)
+    # other databases fall back to icontains search
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        _run(schema_editor, SQLITE_FTS_DROP)
+    elif vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FTS_DROP)
+
+
+def fill_keys(apps, schema_editor):
+    Destination = apps.get_model("api", "Destination")
+    rows = list(Destination.objects.only("id", "region", "category"))
+    for d in rows:
+        d.region_key = " ".join(str(d.region).split()).casefold() if d.region else ""
+        d.category_key = " ".join(str(d.category).split()).casefold() if d.category else ""
+    Destination.objects.bulk_update(rows, ["region_key", "category_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_bnb_rating_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='destination',
+            name='category_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='destination',
+            name='region_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(fill_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(fields=['region_key', 'category_key', 'id'], name='destination_region_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(fields=['category_key', 'id'], name='destination_category_idx'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -3,12 +3,21 @@ from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
 
 class Rating(models.Model):
     bnb = models.ForeignKey("BNB", on_delete=models.CASCADE, related_name="ratings", null=True, blank=True)
     value = models.IntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # what the BNB totals currently include for this row (see update_bnb_rating_totals)
+        instance._counted = (instance.__dict__.get("bnb_id"), instance.__dict__.get("value"))
+        return instance
+
     def __str__(self):
         return f"{self.value}/5 for {self.trip.location if self.trip else 'No Trip'}"
 
@@ -26,6 +35,28 @@ class BNB(models.Model):
     name = models.CharField(max_length=200)
     address = models.CharField(max_length=400)
     availability = models.BooleanField(default=True)
+    # Running totals of this BNB's ratings, kept in step by the Rating signals below
+    # (rebuild with `manage.py repair_rating_totals`)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+
+    RATING_TOTALS = ("rating_count", "rating_sum")
+
+    def save(self, *args, update_fields=None, **kwargs):
+        # Saving a loaded BNB would write back the totals as they were read,
+        # undoing any signal increment committed since; only the F() updates
+        # below (and recompute_bnb_rating_totals) may write them
+        if update_fields is None and not self._state.adding:
+            update_fields = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.RATING_TOTALS
+            ]
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
     def __str__(self):
         return f"{self.name} ({self.trip.location if self.trip else 'No Trip'})"
 
@@ -43,6 +74,8 @@ class Trip(models.Model):
     location = models.CharField(max_length=250)
     date = models.DateField(auto_now_add=False)
     image = models.ImageField(upload_to='trip_images/', null=True, blank=True)
+    # Resized copies of `image`: {variant: {"name", "width", "height"}} (see api.trip_images)
+    image_variants = models.JSONField(default=dict, blank=True)
     def __str__(self):
         return self.location
 
@@ -62,6 +95,11 @@ class BucketList(models.Model):
         return f"{self.user.username}'s Bucket List"
 
 
+def normalize_label(value):
+    """Fold case and collapse whitespace so ' North   AMERICA' == 'north america'."""
+    return " ".join(str(value).split()).casefold() if value else ""
+
+
 class Destination(models.Model):
     """Simple model to store popular destination data from SerpAPI or other sources.
     Fields chosen to match front-end needs: slug `id`, `name`, `image_url`, `price`, `category`, `region`, `link`, `description`.
@@ -74,14 +112,96 @@ class Destination(models.Model):
     region = models.CharField(max_length=100, blank=True, null=True)
     link = models.URLField(max_length=1000, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
+    # normalize_label(region/category), so filters are indexed equality lookups
+    # rather than unindexable iexact scans; kept in step by save()
+    region_key = models.CharField(max_length=100, blank=True, default="", editable=False)
+    category_key = models.CharField(max_length=100, blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            # filter + keyset order (see api.destinations)
+            models.Index(fields=["region_key", "category_key", "id"], name="destination_region_idx"),
+            models.Index(fields=["category_key", "id"], name="destination_category_idx"),
+        ]
+
+    def set_keys(self):
+        self.region_key = normalize_label(self.region)
+        self.category_key = normalize_label(self.category)
+
+    def save(self, *args, **kwargs):
+        self.set_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"region", "category"} & set(update_fields):
+            kwargs["update_fields"] = set(update_fields) | {"region_key", "category_key"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name} ({self.slug})"
 
 
+class GeocodeCache(models.Model):
+    """Shared, persistent cache of geocoding lookups (see api.geocoding).
+    `key` is the normalized city name; rows with `found=False` cache names the geocoder did not know.
+    """
+    key = models.CharField(max_length=255, unique=True)
+    query = models.CharField(max_length=255)
+    lat = models.FloatField(null=True, blank=True)
+    lon = models.FloatField(null=True, blank=True)
+    found = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.query} ({self.lat}, {self.lon})" if self.found else f"{self.query} (not found)"
+
+
 # Auto-create both lists for every user
 @receiver(post_save, sender=User)
 def create_user_lists(sender, instance, created, **kwargs):
     if created:
         BucketList.objects.get_or_create(user=instance)
-        MyTrips.objects.get_or_create(user=instance)
\ No newline at end of file
+        MyTrips.objects.get_or_create(user=instance)
+
+
+# Keep BNB.rating_count / rating_sum in step with its ratings. The UPDATEs
+# use F() so concurrent writers can't lose each other's increments.
+def _adjust_bnb_rating_totals(bnb_id, count, total):
+    if bnb_id is not None:
+        BNB.objects.filter(pk=bnb_id).update(
+            rating_count=F("rating_count") + count,
+            rating_sum=F("rating_sum") + total,
+        )
+
+
+@receiver(post_save, sender=Rating)
+def update_bnb_rating_totals(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    old_bnb, old_value = (None, None) if created else getattr(instance, "_counted", (None, None))
+    new = (instance.bnb_id, instance.value)
+    if (old_bnb, old_value) == new:
+        return
+    _adjust_bnb_rating_totals(old_bnb, -1, -(old_value or 0))
+    _adjust_bnb_rating_totals(instance.bnb_id, 1, instance.value)
+    instance._counted = new
+
+
+@receiver(post_delete, sender=Rating)
+def remove_from_bnb_rating_totals(sender, instance, **kwargs):
+    bnb_id, value = getattr(instance, "_counted", (instance.bnb_id, instance.value))
+    _adjust_bnb_rating_totals(bnb_id, -1, -(value or 0))
+
+
+def recompute_bnb_rating_totals(bnbs=None):
+    """
+    Rebuild rating_count / rating_sum from the Rating table in one UPDATE.
+
+    bnbs: BNB queryset to repair (default: all)
+    returns: number of BNB rows updated
+    """
+    per_bnb = Rating.objects.filter(bnb=OuterRef("pk")).order_by().values("bnb")
+    count = per_bnb.annotate(n=Count("id")).values("n")
+    total = per_bnb.annotate(s=Sum("value")).values("s")
+    return (BNB.objects.all() if bnbs is None else bnbs).update(
+        rating_count=Coalesce(Subquery(count), Value(0)),
+        rating_sum=Coalesce(Subquery(total), Value(0)),
+    )
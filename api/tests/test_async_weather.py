@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from unittest.mock import patch
+
+from api import geocoding
+from backend.asgi import application
+
+GEOCODE_RESP = {"results": [{"latitude": 25.77, "longitude": -80.19}]}
+FORECAST_RESP = {
+    "daily": {
+        "time": ["2025-04-01", "2025-04-02"],
+        "temperature_2m_max": [28.0, 29.0],
+        "temperature_2m_min": [22.0, 23.0],
+        "precipitation_sum": [0.0, 1.0],
+        "wind_speed_10m_max": [10.0, 12.0],
+        "cloudcover_mean": [40, 60],
+    },
+    "hourly": {
+        "time": ["2025-04-01T00:00", "2025-04-02T00:00"],
+        "relativehumidity_2m": [65, 70],
+    },
+    "current": {"temperature_2m": 27.5, "weather_code": 2},
+}
+
+
+def fake_upstream(delay=0.0):
+    """Async stand-in for AsyncWeatherClient.get_json that records every call."""
+    calls = []
+
+    async def get_json(base_url, params=None, require_ok=False):
+        calls.append(base_url)
+        await asyncio.sleep(delay)
+        return GEOCODE_RESP if "search" in base_url else FORECAST_RESP
+
+    return get_json, calls
+
+
+class AsyncWeatherViewTests(TestCase):
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        cache.clear()
+
+    @patch("api.async_views.predict_comfort_batch", return_value=[75.5, 72.1])
+    async def test_comfort_by_city_async(self, mock_predict):
+        get_json, calls = fake_upstream()
+        with patch("backend.ml.weather_client.AsyncWeatherClient.get_json", side_effect=get_json):
+            response = await self.async_client.post(
+                "/api/async/comfort-by-city/",
+                {"city": "Miami", "start_date": "2025-04-01", "end_date": "2025-04-02"},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["comfort_score"] for r in results], [75.5, 72.1])
+        self.assertEqual([r["humidity_max"] for r in results], [65.0, 70.0])
+        self.assertEqual(len(calls), 2)
+        mock_predict.assert_called_once()
+
+    async def test_missing_fields(self):
+        response = await self.async_client.post(
+            "/api/async/comfort-by-city/", {"city": "Miami"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_overlong_range_rejected(self):
+        response = await self.async_client.post(
+            "/api/async/comfort-by-city/",
+            {"city": "Tokyo", "start_date": "2030-01-01", "end_date": "9999-12-31"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_current_weather_async(self):
+        get_json, calls = fake_upstream()
+        with patch("backend.ml.weather_client.AsyncWeatherClient.get_json", side_effect=get_json):
+            response = await self.async_client.get("/api/async/weather/current/", {"city": "Miami"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["temperature"], 27.5)
+
+
+class AsyncWeatherConcurrencyTests(SimpleTestCase):
+    """Drives the real ASGI application from its own event loop, as uvicorn would."""
+
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        cache.clear()
+        # the geocode result is shared, so each request only waits on its forecast
+        geocoding._memory_cache.set("miami", {"lat": 25.77, "lon": -80.19})
+        self.addCleanup(geocoding.clear_memory_cache)
+
+    @patch("api.async_views.predict_comfort_batch", return_value=[75.5, 72.1])
+    def test_requests_wait_on_upstream_concurrently(self, mock_predict):
+        get_json, calls = fake_upstream(delay=0.2)
+
+        async def serve_concurrently():
+            transport = httpx.ASGITransport(app=application)
+            async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+                async def one_request(i):
+                    # distinct date ranges so every request misses the forecast cache
+                    return await client.post("/api/async/comfort-by-city/", json={
+                        "city": "Miami", "start_date": f"2025-04-{i + 1:02d}", "end_date": "2025-04-30",
+                    })
+                return await asyncio.gather(*(one_request(i) for i in range(20)))
+
+        with patch("backend.ml.weather_client.AsyncWeatherClient.get_json", side_effect=get_json):
+            start = time.perf_counter()
+            # a top-level event loop, like uvicorn's
+            responses = asyncio.run(serve_concurrently())
+            elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        self.assertEqual(len(calls), 20)
+        # handling them one at a time would take 20 x 0.2s
+        self.assertLess(elapsed, 2.0)
@@ -0,0 +1,91 @@
+import json
+import time
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.auth_cache import ISSUED_AT_KEY, user_cache_key
+
+
+@override_settings(
+    SHARED_CACHE=True,
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+    AUTHENTICATION_BACKENDS=["api.auth_cache.CachedModelBackend", "django.contrib.auth.backends.ModelBackend"],
+)
+class CheckAuthHotPathTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="traveller", password="securepass123")
+        response = self.client.post("/api/login/", json.dumps({"username": "traveller", "password": "securepass123"}),
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def check_auth(self):
+        return self.client.get("/api/check-auth/").json()
+
+    def test_login_stamps_session(self):
+        session = Session.objects.get(session_key=self.session_key).get_decoded()
+        self.assertAlmostEqual(session[ISSUED_AT_KEY], time.time(), delta=5)
+
+    def test_steady_state_needs_no_queries(self):
+        self.check_auth()  # warms the user cache
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/check-auth/")
+
+        self.assertTrue(response.json()["is_authenticated"])
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+    def test_session_renewed_near_expiry(self):
+        expires = Session.objects.get(session_key=self.session_key).expire_date
+        later = time.time() + settings.SESSION_COOKIE_AGE - settings.SESSION_REFRESH_WINDOW + 60
+
+        with patch("api.auth_cache.time.time", return_value=later):
+            response = self.client.get("/api/check-auth/")
+
+        self.assertIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertGreater(Session.objects.get(session_key=self.session_key).expire_date, expires)
+
+    def test_user_changes_invalidate_cache(self):
+        self.check_auth()
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+
+        self.user.first_name = "Ada"
+        self.user.save()
+
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertEqual(self.check_auth()["first_name"], "Ada")
+
+    def test_deactivated_user_logged_out(self):
+        self.check_auth()
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertFalse(self.check_auth()["is_authenticated"])
+
+    def test_password_change_ends_session(self):
+        self.check_auth()
+        self.user.set_password("another-pass-456")
+        self.user.save()
+
+        self.assertFalse(self.check_auth()["is_authenticated"])
+
+    def test_register_logs_in_with_cached_backend(self):
+        self.client.logout()
+        response = self.client.post("/api/register/", json.dumps({"username": "newbie", "password": "pw-12345"}),
+                                    content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.session["_auth_user_backend"], "api.auth_cache.CachedModelBackend")
+
+    def test_session_details_not_exposed(self):
+        authenticated = self.check_auth()
+        self.client.logout()
+        anonymous = self.check_auth()
+
+        self.assertNotIn(self.session_key, json.dumps(authenticated))
+        self.assertEqual(anonymous, {"is_authenticated": False})
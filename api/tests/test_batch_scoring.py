@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from backend.ml.batch_scoring import score_chunk, score_dataset, score_stream
+from backend.ml.dataset_store import read_table, write_table
+
+
+def weather_frame(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.date_range("2018-01-01", periods=n).strftime("%Y-%m-%d"),
+        "temp_max": rng.uniform(40, 95, n).round(1),
+        "temp_min": rng.uniform(20, 60, n).round(1),
+        "precipitation": rng.choice([0.0, 0.5, 3.0, 12.0], n),
+        "wind_max": rng.uniform(0, 50, n).round(1),
+        "humidity_max": rng.integers(20, 100, n),
+        "cloudcover": rng.integers(0, 100, n),
+        "city": rng.choice(["Miami", "Denver", "Tokyo"], n),
+        "lat": 25.7617,
+        "lon": -80.1918,
+    })
+
+
+def tag_chunk(df):
+    return df.assign(tagged=True)
+
+
+class BatchScoringTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.df = weather_frame()
+        self.expected = score_chunk(self.df)
+
+    def test_parallel_csv_scoring_preserves_order(self):
+        source = os.path.join(self.tmp.name, "master.csv")
+        output = os.path.join(self.tmp.name, "scored.csv")
+        self.df.to_csv(source, index=False)
+
+        rows = score_dataset(source, output, chunk_rows=97, workers=2)
+
+        self.assertEqual(rows, len(self.df))
+        scored = pd.read_csv(output)
+        self.assertEqual(scored["date"].tolist(), self.expected["date"].dt.strftime("%Y-%m-%d").tolist())
+        np.testing.assert_allclose(scored["comfort_index"], self.expected["comfort_index"])
+        self.assertEqual(scored["month"].tolist(), self.expected["month"].tolist())
+
+    def test_columnar_input_and_output(self):
+        source = os.path.join(self.tmp.name, "master.cols")
+        output = os.path.join(self.tmp.name, "scored.cols")
+        write_table(self.df, source)
+
+        score_dataset(source, output, chunk_rows=250, workers=2)
+
+        scored = read_table(output)
+        self.assertEqual(scored["city"].astype(str).tolist(), self.df["city"].tolist())
+        np.testing.assert_allclose(scored["comfort_index"], self.expected["comfort_index"], rtol=1e-5, atol=1e-4)
+
+    def test_pending_chunks_are_bounded(self):
+        pulled = []
+
+        def chunks():
+            for i in range(20):
+                pulled.append(i)
+                yield pd.DataFrame({"i": [i]})
+
+        results = score_stream(chunks(), func=tag_chunk, workers=2, max_pending=3)
+        first = next(results)
+        self.assertEqual(first["i"].tolist(), [0])
+        self.assertLessEqual(len(pulled), 3)
+
+        rest = list(results)
+        self.assertEqual([r["i"].iloc[0] for r in rest], list(range(1, 20)))
+
+    def test_inline_mode_and_empty_input(self):
+        source = os.path.join(self.tmp.name, "empty.csv")
+        output = os.path.join(self.tmp.name, "out.csv")
+        self.df.iloc[:0].to_csv(source, index=False)
+
+        self.assertEqual(score_dataset(source, output, workers=1), 0)
+        self.assertTrue(os.path.exists(output))
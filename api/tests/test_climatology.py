@@ -0,0 +1,144 @@
+import os
+import tempfile
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from unittest.mock import patch
+
+from api import geocoding
+from backend.ml.climatology import Climatology, build_climatology, day_of_year_index
+from backend.ml.pipeline import add_comfort_scores
+
+
+def history(years=(2019, 2020, 2021)):
+    rng = np.random.default_rng(0)
+    frames = []
+    for city, lat, lon in [("Miami", 25.76, -80.19), ("Denver", 39.74, -104.99)]:
+        dates = pd.date_range(f"{years[0]}-01-01", f"{years[-1]}-12-31", freq="D")
+        n = len(dates)
+        frames.append(pd.DataFrame({
+            "date": dates.strftime("%Y-%m-%d"),
+            "temp_max": rng.uniform(40, 95, n),
+            "temp_min": rng.uniform(20, 60, n),
+            "precipitation": rng.choice([0.0, 0.5, 3.0, 12.0], n),
+            "wind_max": rng.uniform(0, 50, n),
+            "humidity_max": rng.uniform(20, 100, n),
+            "cloudcover": rng.uniform(0, 100, n),
+            "city": city, "lat": lat, "lon": lon,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+class ClimatologyBuildTests(SimpleTestCase):
+    def test_day_of_year_uses_leap_calendar(self):
+        idx = day_of_year_index(["2021-01-01", "2021-02-28", "2021-03-01", "2024-02-29", "2024-03-01", "2023-12-31"])
+        np.testing.assert_array_equal(idx, [0, 58, 60, 59, 60, 365])
+
+    def test_statistics_match_direct_computation(self):
+        df = history()
+        climatology = build_climatology(df, window=3, rain_threshold=1.0)
+        self.assertEqual(climatology.cities, ["Denver", "Miami"])
+
+        scored = add_comfort_scores(df)
+        miami = scored[scored["city"] == "Miami"]
+        slots = day_of_year_index(miami["date"].to_numpy(dtype=str))
+        for slot in (0, 59, 180, 365):
+            distance = np.minimum((slots - slot) % 366, (slot - slots) % 366)
+            window = miami[distance <= 3]
+
+            stats = climatology.stats[climatology.city_index("miami"), slot]
+            self.assertAlmostEqual(stats[0], window["comfort_index"].mean(), places=3)
+            np.testing.assert_allclose(stats[1:4], np.percentile(window["comfort_index"], [10, 50, 90]), rtol=1e-5)
+            self.assertAlmostEqual(stats[4], (window["precipitation"] >= 1.0).mean(), places=5)
+            self.assertEqual(climatology.samples[climatology.city_index("Miami"), slot], len(window))
+
+    def test_save_load_and_lookup(self):
+        climatology = build_climatology(history())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "climatology.npz")
+            climatology.save(path)
+            loaded = Climatology.load(path)
+
+        self.assertEqual(loaded.cities, climatology.cities)
+        idx = loaded.city_index("  denver ")
+        looked_up = loaded.lookup(idx, ["2031-07-04", "2032-02-29"])
+        self.assertEqual(len(looked_up), 2)
+        self.assertAlmostEqual(looked_up[0]["mean"], float(climatology.stats[idx, 185, 0]))
+        self.assertIsNone(loaded.city_index("Atlantis"))
+
+
+class FarFutureComfortTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        geocoding.clear_memory_cache()
+        cache.clear()
+
+    def post(self, city, start, end):
+        return self.client.post("/api/comfort-by-city/", {
+            "city": city, "start_date": start.isoformat(), "end_date": end.isoformat(),
+        }, format="json")
+
+    @patch("backend.ml.weather_client.WeatherClient.get_json", side_effect=AssertionError("no network"))
+    def test_far_future_range_uses_climatology_only(self, mock_get):
+        start = timezone.localdate() + timedelta(days=120)
+        response = self.post("Tokyo", start, start + timedelta(days=2))
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 3)
+        self.assertEqual({r["source"] for r in results}, {"climatology"})
+        self.assertEqual(results[0]["date"], start.isoformat())
+        self.assertEqual(results[0]["station"], "Tokyo")
+        self.assertLessEqual(results[0]["comfort_p10"], results[0]["comfort_p90"])
+        self.assertTrue(0 <= results[0]["rain_probability"] <= 1)
+        mock_get.assert_not_called()
+
+    @patch("api.views.predict_comfort_batch", return_value=[70.0, 71.0])
+    @patch("api.views.get_forecast")
+    @patch("api.views.cached_geocode_city", return_value={"lat": 25.77, "lon": -80.19})
+    def test_range_straddling_horizon_is_split(self, mock_geo, mock_forecast, mock_predict):
+        last_forecast_day = timezone.localdate() + timedelta(days=15)
+        days = [last_forecast_day - timedelta(days=1), last_forecast_day]
+        mock_forecast.return_value = {
+            "daily": {
+                "time": [d.isoformat() for d in days],
+                "temperature_2m_max": [28.0, 29.0], "temperature_2m_min": [22.0, 23.0],
+                "precipitation_sum": [0.0, 1.0], "wind_speed_10m_max": [10.0, 12.0],
+                "cloudcover_mean": [40, 50],
+            },
+            "hourly": {"time": [f"{days[0].isoformat()}T00:00"], "relativehumidity_2m": [65]},
+        }
+
+        response = self.post("Miami", days[0], last_forecast_day + timedelta(days=3))
+
+        self.assertEqual(response.status_code, 200)
+        sources = [r["source"] for r in response.json()["results"]]
+        self.assertEqual(sources, ["forecast"] * 2 + ["climatology"] * 3)
+        params = mock_forecast.call_args[0][2]
+        self.assertEqual((params["start_date"], params["end_date"]), (days[0].isoformat(), days[1].isoformat()))
+
+    @patch("api.views.cached_geocode_city", return_value=None)
+    def test_unknown_city_beyond_horizon(self, mock_geo):
+        start = timezone.localdate() + timedelta(days=60)
+        response = self.post("Atlantis", start, start)
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_date(self):
+        response = self.client.post("/api/comfort-by-city/", {
+            "city": "Tokyo", "start_date": "next week", "end_date": "2030-01-01",
+        }, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(COMFORT_MAX_RANGE_DAYS=30)
+    def test_overlong_range_rejected(self):
+        start = timezone.localdate() + timedelta(days=60)
+
+        self.assertEqual(self.post("Tokyo", start, start + timedelta(days=29)).status_code, 200)
+        response = self.post("Tokyo", start, start + timedelta(days=30))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("at most 30 days", response.json()["error"])
@@ -0,0 +1,62 @@
+import numpy as np
+from django.test import SimpleTestCase
+from unittest.mock import patch
+
+from backend.ml import pipeline
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+
+class FakeModel:
+    """Stands in for the booster and records how often it is called."""
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return X[:, XGBoostComfortScoreModel.FEATURES.index("temp_max")] * 2
+
+
+def make_row(temp_max=25.0, **overrides):
+    row = {
+        "temp_min": 15.0, "temp_max": temp_max, "precipitation": 0.0,
+        "humidity_max": 60, "wind_max": 10.0, "cloudcover": 40,
+        "lat": 25.77, "lon": -80.19, "month": 4,
+    }
+    row.update(overrides)
+    return row
+
+
+class PredictComfortBatchTests(SimpleTestCase):
+    def setUp(self):
+        self.fake = FakeModel()
+        patcher = patch.object(pipeline, "get_model", return_value=self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rows_scored_in_one_call(self):
+        rows = [make_row(temp_max=t) for t in (20.0, 25.0, "30")]
+        scores = pipeline.predict_comfort_batch(rows)
+        np.testing.assert_array_equal(scores, [40.0, 50.0, 60.0])
+        self.assertEqual(self.fake.calls, 1)
+
+    def test_matrix_input_in_feature_order(self):
+        rows = [make_row(temp_max=t) for t in (10.0, 12.5)]
+        X = np.array([[r[f] for f in XGBoostComfortScoreModel.FEATURES] for r in rows])
+        np.testing.assert_array_equal(pipeline.predict_comfort_batch(X), [20.0, 25.0])
+
+    def test_single_row_wrapper(self):
+        self.assertEqual(pipeline.predict_comfort(make_row(temp_max=21.0)), 42.0)
+
+    def test_nan_rows_reported_together(self):
+        rows = [make_row(), make_row(wind_max=None), make_row(), make_row(lat=float("nan"))]
+        with self.assertRaisesRegex(ValueError, r"\[1, 3\]"):
+            pipeline.predict_comfort_batch(rows)
+        self.assertEqual(self.fake.calls, 0)
+
+    def test_wrong_shape_rejected(self):
+        with self.assertRaises(ValueError):
+            pipeline.predict_comfort_batch(np.zeros((2, 3)))
+
+    def test_empty_batch(self):
+        self.assertEqual(len(pipeline.predict_comfort_batch([])), 0)
+        self.assertEqual(self.fake.calls, 0)
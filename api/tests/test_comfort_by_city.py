@@ -1,29 +1,35 @@
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 from unittest.mock import patch
 
+from api import geocoding
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
 class ComfortByCityTest(TestCase):
     def setUp(self):
         self.client = APIClient()
+        geocoding.clear_memory_cache()
+        cache.clear()
 
-    @patch("api.views.requests.get")          # for forecast + geocode
-    @patch("api.views.predict_comfort")       # ML model predict
+    @patch("backend.ml.weather_client.WeatherClient.get_json")  # for forecast + geocode
+    @patch("api.views.predict_comfort_batch") # ML model predict
     def test_comfort_by_city(self, mock_predict, mock_requests):
         # -------------------------------------------
         # Mock geocoding API response
         # -------------------------------------------
         mock_requests.side_effect = [
             # Geocoding call
-            type("Resp", (), {"json": lambda: {
+            {
                 "results": [{
                     "latitude": 25.77,
                     "longitude": -80.19,
                     "name": "Miami",
                     "country": "United States"
                 }]
-            }}),
+            },
             # Forecast call
-            type("Resp", (), {"json": lambda: {
+            {
                 "daily": {
                     "time": ["2025-04-01", "2025-04-02"],
                     "temperature_2m_max": [28.0, 29.0],
@@ -32,14 +38,19 @@ class ComfortByCityTest(TestCase):
                     "wind_speed_10m_max": [10.0, 12.0],
                     "relativehumidity_2m_max": [65, 70],
                     "cloudcover_mean": [40, 60]
+                },
+                "hourly": {
+                    "time": ["2025-04-01T00:00", "2025-04-01T12:00",
+                             "2025-04-02T00:00", "2025-04-02T12:00"],
+                    "relativehumidity_2m": [60, 65, 70, 55]
                 }
-            }}),
+            },
         ]
 
         # -------------------------------------------
-        # Mock ML model predict_comfort return values
+        # Mock ML model batch prediction (one call for all days)
         # -------------------------------------------
-        mock_predict.side_effect = [75.5, 72.1]
+        mock_predict.return_value = [75.5, 72.1]
 
         # -------------------------------------------
         # Make POST request
@@ -57,8 +68,15 @@ class ComfortByCityTest(TestCase):
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
-        self.assertEqual(data["city"], "Miami")
-        self.assertEqual(len(data["daily_scores"]), 2)
+        results = data["results"]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["city"], "Miami")
+
+        self.assertEqual(results[0]["comfort_score"], 75.5)
+        self.assertEqual(results[1]["comfort_score"], 72.1)
 
-        self.assertEqual(data["daily_scores"][0]["comfort_score"], 75.5)
-        self.assertEqual(data["daily_scores"][1]["comfort_score"], 72.1)
+        # every forecast day is scored in a single model call
+        mock_predict.assert_called_once()
+        X = mock_predict.call_args[0][0]
+        humidity = X[:, XGBoostComfortScoreModel.FEATURES.index("humidity_max")]
+        self.assertEqual(humidity.tolist(), [65.0, 70.0])
@@ -0,0 +1,40 @@
+import os
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from backend.ml.utils import (
+    compute_comfort_index, compute_comfort_index_frame,
+    temp_comfort_score, rain_comfort_score, humidity_comfort_score,
+    wind_comfort_score, cloud_comfort_score,
+    temp_comfort_scores, rain_comfort_scores, humidity_comfort_scores,
+    wind_comfort_scores, cloud_comfort_scores,
+)
+
+DATA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "backend", "ml", "data", "historical_weather_master.csv"
+)
+
+
+class VectorizedComfortIndexTests(SimpleTestCase):
+    """The array engine must reproduce the scalar reference bit for bit."""
+
+    def assertBitIdentical(self, vectorized, scalar_fn, values):
+        expected = np.array([scalar_fn(v) for v in values], dtype=np.float64)
+        self.assertEqual(vectorized(values).tobytes(), expected.tobytes())
+
+    def test_sub_scores_at_boundaries(self):
+        grid = np.concatenate([
+            np.arange(-50, 150, 0.1),
+            [0, 2, 10, 24, 30, 48, 50, 60, 65, 78, 100, -0.0, 1e-12],
+        ])
+        self.assertBitIdentical(temp_comfort_scores, temp_comfort_score, grid)
+        self.assertBitIdentical(rain_comfort_scores, rain_comfort_score, grid)
+        self.assertBitIdentical(humidity_comfort_scores, humidity_comfort_score, grid)
+        self.assertBitIdentical(wind_comfort_scores, wind_comfort_score, grid)
+        self.assertBitIdentical(cloud_comfort_scores, cloud_comfort_score, grid)
+
+    def test_matches_row_apply_on_historical_dataset(self):
+        df = pd.read_csv(DATA_PATH)
+        expected = df.apply(compute_comfort_index, axis=1).to_numpy(dtype=np.float64)
+        self.assertEqual(compute_comfort_index_frame(df).tobytes(), expected.tobytes())
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.utils import timezone
+from unittest.mock import patch
+
+from api import geocoding
+from backend.asgi import application
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+CITIES = {
+    "miami": {"lat": 25.77, "lon": -80.19},
+    "denver": {"lat": 39.74, "lon": -104.99},
+    "seattle": {"lat": 47.61, "lon": -122.33},
+}
+# daily max temperature per city, so the expected ranking is obvious
+TEMPS = {25.77: 30.0, 39.74: 20.0, 47.61: 10.0}
+TEMP_MAX = XGBoostComfortScoreModel.FEATURES.index("temp_max")
+
+
+def fake_forecast(delay):
+    calls = []
+
+    async def get_json(base_url, params=None, require_ok=False):
+        calls.append(params["latitude"])
+        await asyncio.sleep(delay)
+        temp = TEMPS[params["latitude"]]
+        return {
+            "daily": {
+                "time": ["2025-04-01", "2025-04-02"],
+                "temperature_2m_max": [temp, temp + 1],
+                "temperature_2m_min": [temp - 8, temp - 7],
+                "precipitation_sum": [0.0, 0.0],
+                "wind_speed_10m_max": [10.0, 10.0],
+                "cloudcover_mean": [40, 40],
+            },
+            "hourly": {"time": ["2025-04-01T00:00", "2025-04-02T00:00"], "relativehumidity_2m": [50, 55]},
+        }
+
+    return get_json, calls
+
+
+class CompareComfortTests(SimpleTestCase):
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        cache.clear()
+        for key, geo in CITIES.items():
+            geocoding._memory_cache.set(key, geo)
+        geocoding._memory_cache.set("atlantis", geocoding.NOT_FOUND)
+        self.addCleanup(geocoding.clear_memory_cache)
+
+    def post(self, payload):
+        async def send():
+            transport = httpx.ASGITransport(app=application)
+            async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+                return await client.post("/api/comfort-compare/", json=payload)
+        return asyncio.run(send())
+
+    @patch("api.async_views.predict_comfort_batch", side_effect=lambda X: X[:, TEMP_MAX])
+    def test_cities_fetched_concurrently_and_scored_in_one_batch(self, mock_predict):
+        get_json, calls = fake_forecast(delay=0.3)
+        with patch("backend.ml.weather_client.AsyncWeatherClient.get_json", side_effect=get_json):
+            start = time.perf_counter()
+            response = self.post({
+                "cities": ["Seattle", "Miami", "  denver ", "MIAMI", "Atlantis"],
+                "start_date": "2025-04-01", "end_date": "2025-04-02",
+            })
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(calls), 3)  # duplicate Miami collapsed, Atlantis never fetched
+        self.assertLess(elapsed, 0.3 * 3)  # close to one city's latency, not the sum
+
+        mock_predict.assert_called_once()
+        self.assertEqual(len(mock_predict.call_args[0][0]), 6)  # 3 cities x 2 days
+
+        self.assertEqual([r["city"] for r in data["ranking"]], ["Miami", "denver", "Seattle"])
+        self.assertEqual(data["ranking"][0], {"rank": 1, "city": "Miami", "average_comfort": 30.5})
+        seattle = next(c for c in data["cities"] if c["city"] == "Seattle")
+        self.assertEqual([d["comfort_score"] for d in seattle["results"]], [10.0, 11.0])
+        self.assertEqual(data["errors"], [{"city": "Atlantis", "error": "Geocoding failed"}])
+
+    @patch("backend.ml.weather_client.AsyncWeatherClient.get_json", side_effect=AssertionError("no network"))
+    def test_far_future_comparison_uses_climatology(self, mock_get):
+        start = timezone.localdate() + timedelta(days=120)
+
+        response = self.post({
+            "cities": ["Tokyo", "Miami", "Atlantis"],
+            "start_date": start.isoformat(), "end_date": (start + timedelta(days=2)).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual({r["city"] for r in data["ranking"]}, {"Tokyo", "Miami"})
+        for city in data["cities"]:
+            self.assertEqual([r["source"] for r in city["results"]], ["climatology"] * 3)
+            self.assertAlmostEqual(city["average_comfort"], sum(r["comfort_score"] for r in city["results"]) / 3)
+        self.assertEqual(data["errors"], [{"city": "Atlantis", "error": "No climatology available for Atlantis"}])
+        mock_get.assert_not_called()
+
+    def test_validation(self):
+        self.assertEqual(self.post({"cities": "Miami", "start_date": "a", "end_date": "b"}).status_code, 400)
+        self.assertEqual(self.post({"cities": ["Miami"]}).status_code, 400)
+        response = self.post({"cities": ["Miami"], "start_date": "2030-01-01", "end_date": "9999-12-31"})
+        self.assertEqual(response.status_code, 400)
+        with self.settings(COMFORT_COMPARE_MAX_CITIES=2):
+            response = self.post({"cities": ["Miami", "Denver", "Seattle"], "start_date": "a", "end_date": "b"})
+        self.assertEqual(response.status_code, 400)
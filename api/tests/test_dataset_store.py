@@ -0,0 +1,104 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from backend.ml import dataset_store
+from backend.ml.dataset_store import ColumnStoreWriter, open_columns, read_schema, read_table, write_table
+
+
+def weather_frame(cities=("Miami", "Denver"), start="2020-01-01", days=5):
+    frames = []
+    for i, city in enumerate(cities):
+        frames.append(pd.DataFrame({
+            "date": pd.date_range(start, periods=days).strftime("%Y-%m-%d"),
+            "temp_max": np.linspace(20.5, 30.5, days) + i,
+            "humidity_max": np.arange(days, dtype=np.int64) * 10 + 40,
+            "city": city,
+            "lat": 25.7617 + i,
+            "lon": -80.1918,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+class DatasetStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "weather.cols")
+
+    def test_round_trip_uses_compact_types(self):
+        df = weather_frame()
+        write_table(df, self.path)
+        loaded = read_table(self.path)
+
+        self.assertEqual(list(loaded.columns), list(df.columns))
+        self.assertEqual(loaded["temp_max"].dtype, np.float32)
+        self.assertEqual(loaded["humidity_max"].dtype, np.float32)
+        self.assertIsInstance(loaded["city"].dtype, pd.CategoricalDtype)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(loaded["date"]))
+
+        self.assertEqual(loaded["city"].astype(str).tolist(), df["city"].tolist())
+        self.assertEqual(loaded["date"].dt.strftime("%Y-%m-%d").tolist(), df["date"].tolist())
+        np.testing.assert_allclose(loaded["temp_max"], df["temp_max"], rtol=1e-6)
+
+    def test_column_selective_memory_mapped_reads(self):
+        write_table(weather_frame(), self.path)
+
+        columns = open_columns(self.path, ["temp_max", "city"])
+        self.assertEqual(set(columns), {"temp_max", "city"})
+        self.assertIsInstance(columns["temp_max"], np.memmap)
+        self.assertEqual(columns["city"].dtype, np.int32)
+
+        loaded = read_table(self.path, columns=["lat"])
+        self.assertEqual(list(loaded.columns), ["lat"])
+        with self.assertRaises(KeyError):
+            open_columns(self.path, ["nope"])
+
+    def test_appends_extend_rows_and_categories(self):
+        with ColumnStoreWriter(self.path) as writer:
+            writer.append(weather_frame(cities=("Miami",)))
+        with ColumnStoreWriter(self.path, mode="a") as writer:
+            writer.append(weather_frame(cities=("Tokyo", "Miami"), start="2021-01-01"))
+
+        schema = read_schema(self.path)
+        self.assertEqual(schema["rows"], 15)
+        self.assertEqual(schema["columns"]["city"]["categories"], ["Miami", "Tokyo"])
+
+        loaded = read_table(self.path)
+        self.assertEqual(loaded["city"].astype(str).tolist(), ["Miami"] * 5 + ["Tokyo"] * 5 + ["Miami"] * 5)
+        self.assertEqual(str(loaded["date"].iloc[-1].date()), "2021-01-05")
+
+    def test_append_to_missing_table_creates_it(self):
+        with ColumnStoreWriter(self.path, mode="a") as writer:
+            writer.append(weather_frame(cities=("Miami",)))
+
+        self.assertEqual(read_schema(self.path)["rows"], 5)
+        with self.assertRaises(ValueError):
+            ColumnStoreWriter(self.path, mode="x")
+
+    def test_rewrite_replaces_table(self):
+        write_table(weather_frame(), self.path)
+        write_table(weather_frame(cities=("Paris",), days=2)[["temp_max", "city"]], self.path)
+
+        self.assertEqual(sorted(os.listdir(self.path)), ["_schema.json", "city.bin", "temp_max.bin"])
+        self.assertEqual(len(read_table(self.path)), 2)
+
+    def test_load_dataset_converts_csv_once(self):
+        csv_path = os.path.join(self.tmp.name, "historical_weather_master.csv")
+        weather_frame().to_csv(csv_path, index=False)
+
+        loaded = dataset_store.load_dataset("master", data_dir=self.tmp.name)
+        store = dataset_store.dataset_path("master", data_dir=self.tmp.name)
+        self.assertEqual(len(loaded), 10)
+        self.assertTrue(os.path.exists(os.path.join(store, "_schema.json")))
+
+        # a fresh store is reused rather than re-parsed
+        os.remove(csv_path)
+        self.assertEqual(len(dataset_store.load_dataset("master", ["city"], data_dir=self.tmp.name)), 10)
+
+    def test_empty_table(self):
+        write_table(weather_frame().iloc[:0], self.path)
+        self.assertEqual(len(read_table(self.path)), 0)
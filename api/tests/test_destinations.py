@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.destinations import search_backend
+from api.models import Destination
+
+CATALOGUE = [
+    ("kyoto", "Kyoto", "Asia", "Cities", "Temples, gardens and traditional tea houses."),
+    ("banff", "Banff", " north  AMERICA", "Mountains", "Glacier lakes in the Canadian Rockies."),
+    ("tulum", "Tulum", "North America", "Beaches", "Mayan ruins above turquoise beaches."),
+    ("queenstown", "Queenstown", "Oceania", "Adventure", "Bungee jumping and alpine lakes."),
+    ("zermatt", "Zermatt", "Europe", "Mountains", "Car-free village below the Matterhorn."),
+]
+
+
+class DestinationsApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for slug, name, region, category, description in CATALOGUE:
+            Destination.objects.create(slug=slug, name=name, region=region, category=category, description=description)
+
+    def get(self, **params):
+        response = self.client.get("/api/destinations/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def slugs(self, **params):
+        return [d["id"] for d in self.get(**params)["results"]]
+
+    def test_filters_use_normalized_keys(self):
+        self.assertEqual(self.slugs(region="NORTH america"), ["banff", "tulum"])
+        self.assertEqual(self.slugs(region="north america", category=" mountains"), ["banff"])
+        self.assertEqual(Destination.objects.get(slug="banff").region_key, "north america")
+
+    def test_filters_are_index_lookups(self):
+        plan = Destination.objects.filter(region_key="europe", category_key="mountains", id__gt=0).order_by("id").explain()
+        self.assertIn("destination_region_idx", plan)
+
+    def test_keyset_pages(self):
+        slugs, cursor = [], None
+        while True:
+            page = self.get(limit=2, **({"cursor": cursor} if cursor else {}))
+            slugs += [d["id"] for d in page["results"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(slugs, [c[0] for c in CATALOGUE])
+
+    def test_invalid_page_params(self):
+        for params in ({"limit": 0}, {"limit": 10_000}, {"cursor": "x"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/destinations/", params).status_code, 400)
+
+    def test_full_text_search(self):
+        self.assertEqual(search_backend(), "fts5")
+        self.assertEqual(self.slugs(q="lakes"), ["banff", "queenstown"])
+        self.assertEqual(self.slugs(q="alpine LAKE"), ["queenstown"])
+        self.assertEqual(self.slugs(q="kyo"), ["kyoto"])
+        self.assertEqual(self.slugs(q="lakes", category="mountains"), ["banff"])
+
+    def test_search_input_is_not_fts_syntax(self):
+        for q in ('"', "lakes OR", "NEAR(x y)", "*", "gardens AND -temples"):
+            with self.subTest(q=q):
+                self.get(q=q)
+        self.assertEqual(self.slugs(q="***"), [])
+
+    def test_search_index_follows_writes(self):
+        Destination.objects.filter(slug="zermatt").update(description="Ski slopes below the Matterhorn.")
+        Destination.objects.filter(slug="kyoto").delete()
+        Destination.objects.bulk_create([Destination(slug="lisbon", name="Lisbon", description="Trams and ski-free hills")])
+
+        self.assertEqual(self.slugs(q="ski"), ["zermatt", "lisbon"])
+        self.assertEqual(self.slugs(q="temples"), [])
+
+    def test_icontains_fallback_matches(self):
+        with patch("api.destinations.search_backend", return_value="icontains"):
+            self.assertEqual(self.slugs(q="alpine lake"), ["queenstown"])
+
+    @override_settings(SHARED_CACHE=True)
+    def test_pages_cached_until_destination_changes(self):
+        self.get(region="europe")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.slugs(region="  EUROPE"), ["zermatt"])
+
+        Destination.objects.create(slug="porto", name="Porto", region="Europe", category="Cities")
+        self.assertEqual(self.slugs(region="europe"), ["zermatt", "porto"])
+
+        Destination.objects.get(slug="zermatt").delete()
+        self.assertEqual(self.slugs(region="europe"), ["porto"])
+
+    @override_settings(SHARED_CACHE=False)
+    def test_pages_not_cached_without_shared_cache(self):
+        self.get(region="europe")
+        with self.assertNumQueries(1):
+            self.get(region="europe")
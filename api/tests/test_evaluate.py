@@ -0,0 +1,87 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+from unittest.mock import patch
+
+from backend.ml import model_store
+from backend.ml.dataset_store import write_table
+from backend.ml.training import evaluate
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+
+class EvaluateTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        import xgboost as xgb
+
+        cls.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        n = 300
+        df = pd.DataFrame({name: rng.normal(size=n) for name in XGBoostComfortScoreModel.FEATURES})
+        df["month"] = rng.integers(1, 13, n)
+        df["city"] = rng.choice(["Miami", "Tokyo", "Paris"], n)
+        df["comfort_index"] = 50 + 10 * df["temp_max"]
+        cls.store = os.path.join(cls.tmp.name, "scored.cols")
+        write_table(df, cls.store)
+
+        model = xgb.XGBRegressor(n_estimators=20, max_depth=3)
+        model.fit(df[XGBoostComfortScoreModel.FEATURES].to_numpy(), df["comfort_index"].to_numpy())
+        cls.models_dir = os.path.join(cls.tmp.name, "models")
+        model_store.save_model(model, "hash", models_dir=cls.models_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        patcher = patch.object(evaluate, "ensure_dataset", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_main(self, *extra):
+        report_path = os.path.join(self.tmp.name, "report.json")
+        with redirect_stdout(io.StringIO()):
+            code = evaluate.main([
+                "--models-dir", self.models_dir, "--report", report_path, "--batch-sizes", "1", "16", *extra,
+            ])
+        with open(report_path) as f:
+            return code, json.load(f)
+
+    def test_report_contents(self):
+        code, report = self.run_main()
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["model_class"], "TreeEnsemble")
+        self.assertEqual(report["accuracy"]["overall"]["rows"], 60)
+        self.assertEqual(set(report["accuracy"]["by_city"]), {"Miami", "Tokyo", "Paris"})
+        self.assertEqual(sum(m["rows"] for m in report["accuracy"]["by_month"].values()), 60)
+        self.assertEqual(set(report["latency"]), {"1", "16"})
+        latency = report["latency"]["16"]
+        self.assertLessEqual(latency["p50_ms"], latency["p99_ms"])
+        self.assertIn("trees", report["resources"]["artifact_bytes"])
+        self.assertTrue(report["slo"]["passed"])
+
+    def test_slo_gate_rejects_slow_or_inaccurate_models(self):
+        code, report = self.run_main("--slo-p99-ms", "0")
+        self.assertEqual(code, 1)
+        self.assertFalse(report["slo"]["checks"][0]["passed"])
+
+        code, report = self.run_main("--max-rmse", "0")
+        self.assertEqual(code, 1)
+        self.assertEqual([c["passed"] for c in report["slo"]["checks"]], [True, False])
+
+    def test_grouped_metrics(self):
+        y = np.array([1.0, 2.0, 3.0, 4.0])
+        pred = np.array([1.0, 3.0, 3.0, 6.0])
+        metrics = evaluate.grouped_metrics(y, pred, np.array(["a", "a", "b", "b"]))
+        self.assertAlmostEqual(metrics["a"]["rmse"], np.sqrt(0.5))
+        self.assertAlmostEqual(metrics["b"]["mae"], 1.0)
+        self.assertEqual(evaluate.error_metrics(y, pred)["mae"], 0.75)
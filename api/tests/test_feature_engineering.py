@@ -0,0 +1,67 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from backend.ml.training.feature_engineering import (
+    FEATURES,
+    build_feature_matrix,
+    feature_records,
+    rows_to_columns,
+)
+
+
+def weather_columns(n=3):
+    columns = {name: np.arange(n, dtype=float) + 10 for name in FEATURES if name not in ("month", "lat", "lon")}
+    columns.update({"lat": 40.0, "lon": -3.7, "date": ["2024-01-31", "2024-02-01", "2024-12-15"][:n]})
+    return columns
+
+
+class BuildFeatureMatrixTests(SimpleTestCase):
+    def test_month_derived_and_scalars_broadcast(self):
+        X = build_feature_matrix(weather_columns())
+
+        self.assertEqual(X.shape, (3, len(FEATURES)))
+        self.assertEqual(X[:, FEATURES.index("month")].tolist(), [1, 2, 12])
+        self.assertEqual(X[:, FEATURES.index("lat")].tolist(), [40.0] * 3)
+
+    def test_missing_values_reported_together(self):
+        columns = weather_columns()
+        columns["temp_max"] = [1.0, None, 3.0]
+        columns["precipitation"] = [None, 1.0, 2.0]
+
+        with self.assertRaises(ValueError) as ctx:
+            build_feature_matrix(columns)
+
+        message = str(ctx.exception)
+        self.assertIn("rows [0, 1]", message)
+        self.assertIn("temp_max", message)
+        self.assertIn("precipitation", message)
+
+    def test_allow_nan_keeps_missing_values(self):
+        columns = weather_columns()
+        columns["temp_max"] = [1.0, None, 3.0]
+
+        X = build_feature_matrix(columns, dtype=np.float32, allow_nan=True)
+
+        self.assertEqual(X.dtype, np.float32)
+        self.assertTrue(np.isnan(X[1, FEATURES.index("temp_max")]))
+
+    def test_non_numeric_column_rejected(self):
+        columns = weather_columns()
+        columns["humidity_max"] = ["dry", 1.0, 2.0]
+
+        with self.assertRaisesMessage(ValueError, "'humidity_max'"):
+            build_feature_matrix(columns)
+
+    def test_length_mismatch_rejected(self):
+        columns = weather_columns()
+        columns["wind_max"] = [1.0, 2.0]
+
+        with self.assertRaisesMessage(ValueError, "different lengths"):
+            build_feature_matrix(columns)
+
+    def test_rows_round_trip(self):
+        X = build_feature_matrix(weather_columns())
+        records = feature_records(X)
+
+        self.assertIsInstance(records[0]["month"], int)
+        np.testing.assert_array_equal(build_feature_matrix(rows_to_columns(records)), X)
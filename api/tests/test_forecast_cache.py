@@ -0,0 +1,75 @@
+import time
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from unittest.mock import patch
+
+from api import forecast_cache
+from api.forecast_cache import get_forecast, forecast_cache_stats, build_forecast_params
+
+DAILY_PARAMS = {
+    "daily": "temperature_2m_max,temperature_2m_min",
+    "start_date": "2025-04-01",
+    "end_date": "2025-04-02",
+    "timezone": "auto",
+}
+
+
+class ForecastCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        forecast_cache.reset_forecast_cache_stats()
+        self.addCleanup(cache.clear)
+
+    def test_key_normalizes_coordinates_and_variable_order(self):
+        a = build_forecast_params(25.7617, -80.1918, {"daily": "b,a", "timezone": "auto"})
+        b = build_forecast_params(25.7649, -80.1922, {"daily": "a, b", "timezone": "auto"})
+        self.assertEqual(a, b)
+        self.assertEqual(
+            forecast_cache.forecast_cache_key("daily", a), forecast_cache.forecast_cache_key("daily", b)
+        )
+
+    @patch("api.forecast_cache.fetch_forecast", return_value={"daily": {"time": []}})
+    def test_repeat_requests_are_served_from_cache(self, mock_fetch):
+        for lat in (25.7617, 25.7621, 25.7633):
+            get_forecast(lat, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+        self.assertEqual(mock_fetch.call_count, 1)
+        stats = forecast_cache_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 2))
+
+    @patch("api.forecast_cache.fetch_forecast", return_value={"error": True, "reason": "bad"})
+    def test_failed_responses_are_not_cached(self, mock_fetch):
+        get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+        get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    def test_stale_entry_served_while_one_refresh_runs(self):
+        with patch("api.forecast_cache.fetch_forecast", return_value={"daily": "old"}):
+            get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+
+        refreshed = []
+
+        def slow_fetch(params):
+            time.sleep(0.05)
+            refreshed.append(params)
+            return {"daily": "new"}
+
+        ttls = {"default": 0, "daily": 0}
+        with self.settings(FORECAST_CACHE_TTLS=ttls), \
+                patch("api.forecast_cache.fetch_forecast", side_effect=slow_fetch):
+            # both callers get the stale copy; only one refresh is scheduled
+            first = get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+            second = get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",))
+            self.assertEqual((first, second), ({"daily": "old"}, {"daily": "old"}))
+            deadline = time.time() + 2
+            while forecast_cache_stats()["refreshes"] == 0 and time.time() < deadline:
+                time.sleep(0.01)
+
+        self.assertEqual(len(refreshed), 1)
+        stats = forecast_cache_stats()
+        self.assertEqual((stats["stale"], stats["refreshes"]), (2, 1))
+        with patch("api.forecast_cache.fetch_forecast") as mock_fetch:
+            self.assertEqual(
+                get_forecast(25.76, -80.19, DAILY_PARAMS, kind="daily", required=("daily",)),
+                {"daily": "new"},
+            )
+            mock_fetch.assert_not_called()
@@ -0,0 +1,65 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from unittest.mock import patch
+
+from api import geocoding
+from api.geocoding import cached_geocode_city, normalize_city_key
+from api.models import GeocodeCache
+from backend.ml.weather_client import WeatherClientError
+
+
+class GeocodeCacheTests(TestCase):
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        self.addCleanup(geocoding.clear_memory_cache)
+
+    def test_normalized_keys(self):
+        self.assertEqual(normalize_city_key("  new   YORK "), "new york")
+        self.assertEqual(normalize_city_key("New York"), normalize_city_key("new\tyork"))
+
+    @patch("api.geocoding.geocode_city", return_value={"lat": 25.77, "lon": -80.19})
+    def test_repeat_lookups_stay_local(self, mock_geocode):
+        self.assertEqual(cached_geocode_city("Miami"), {"lat": 25.77, "lon": -80.19})
+        self.assertEqual(cached_geocode_city("  MIAMI "), {"lat": 25.77, "lon": -80.19})
+        self.assertEqual(mock_geocode.call_count, 1)
+
+        # a fresh worker (empty LRU) is served from the shared table
+        geocoding.clear_memory_cache()
+        with self.assertNumQueries(1):
+            self.assertEqual(cached_geocode_city("miami"), {"lat": 25.77, "lon": -80.19})
+        # ... and then from its own LRU without touching the database
+        with self.assertNumQueries(0):
+            cached_geocode_city("miami")
+        self.assertEqual(mock_geocode.call_count, 1)
+
+    @patch("api.geocoding.geocode_city", return_value=None)
+    def test_unknown_names_are_negatively_cached(self, mock_geocode):
+        self.assertIsNone(cached_geocode_city("Atlantis"))
+        geocoding.clear_memory_cache()
+        self.assertIsNone(cached_geocode_city("atlantis"))
+        self.assertEqual(mock_geocode.call_count, 1)
+        self.assertFalse(GeocodeCache.objects.get(key="atlantis").found)
+
+    @patch("api.geocoding.geocode_city", side_effect=WeatherClientError("429 from upstream"))
+    def test_failed_lookups_are_not_cached(self, mock_geocode):
+        for _ in range(2):
+            with self.assertRaises(WeatherClientError):
+                cached_geocode_city("Miami")
+        self.assertEqual(mock_geocode.call_count, 2)
+        self.assertFalse(GeocodeCache.objects.exists())
+
+    @patch("api.geocoding.geocode_city", return_value=None)
+    def test_negative_entries_expire(self, mock_geocode):
+        with self.settings(GEOCODE_NEGATIVE_TTL=0):
+            cached_geocode_city("Atlantis")
+            cached_geocode_city("Atlantis")
+        self.assertEqual(mock_geocode.call_count, 2)
+
+    @patch("api.geocoding.geocode_city")
+    def test_prewarm_command_loads_dataset_cities(self, mock_geocode):
+        call_command("prewarm_geocode_cache", stdout=StringIO())
+        self.assertGreater(GeocodeCache.objects.count(), 0)
+        self.assertTrue(GeocodeCache.objects.filter(key="miami").exists())
+        self.assertEqual(cached_geocode_city("Miami"), {"lat": 25.7617, "lon": -80.1918})
+        mock_geocode.assert_not_called()
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from backend.ml.weather_utils import aggregate_hourly_to_daily
+
+
+def hourly_block(days, seed=0):
+    rng = np.random.default_rng(seed)
+    times = pd.date_range(days[0], periods=24 * len(days), freq="h")
+    return {
+        "time": [t.strftime("%Y-%m-%dT%H:%M") for t in times],
+        "relativehumidity_2m": rng.integers(10, 100, len(times)).tolist(),
+        "temperature_2m": rng.normal(20, 5, len(times)).round(1).tolist(),
+    }
+
+
+class HourlyAggregationTests(SimpleTestCase):
+    def test_matches_per_day_mask(self):
+        days = [d.strftime("%Y-%m-%d") for d in pd.date_range("2025-04-01", periods=16)]
+        hourly = hourly_block(days)
+        out = aggregate_hourly_to_daily(
+            hourly, days,
+            [("relativehumidity_2m", "max"), ("temperature_2m", "min"), ("temperature_2m", "mean")],
+        )
+
+        # the per-day boolean mask the view used to build
+        hourly_df = pd.DataFrame({
+            "time": pd.to_datetime(hourly["time"]),
+            "humidity": hourly["relativehumidity_2m"],
+            "temp": hourly["temperature_2m"],
+        })
+        for i, date in enumerate(days):
+            day = hourly_df[hourly_df["time"].dt.date == pd.to_datetime(date).date()]
+            self.assertEqual(out[i, 0], day["humidity"].max())
+            self.assertEqual(out[i, 1], day["temp"].min())
+            self.assertAlmostEqual(out[i, 2], day["temp"].mean())
+
+    def test_rows_align_with_daily_times(self):
+        hourly = {
+            "time": ["2025-03-31T23:00", "2025-04-01T00:00", "2025-04-01T12:00", "2025-04-03T06:00"],
+            "relativehumidity_2m": [99, 60, None, 70],
+        }
+        out = aggregate_hourly_to_daily(
+            hourly, ["2025-04-01", "2025-04-02", "2025-04-03"],
+            [("relativehumidity_2m", "max"), ("relativehumidity_2m", "sum")],
+        )
+        # hour outside the range ignored, null hour skipped, day without hours is NaN
+        np.testing.assert_array_equal(out[:, 0], [60.0, np.nan, 70.0])
+        np.testing.assert_array_equal(out[:, 1], [60.0, np.nan, 70.0])
+
+    def test_empty_inputs(self):
+        self.assertEqual(aggregate_hourly_to_daily({"time": []}, [], [("x", "max")]).shape, (0, 1))
+        out = aggregate_hourly_to_daily({"time": []}, ["2025-04-01"], [("x", "max")])
+        self.assertTrue(np.isnan(out).all())
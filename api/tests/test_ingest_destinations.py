@@ -0,0 +1,111 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from api.models import Destination
+
+PRACTICE_RESULTS = os.path.join(settings.BASE_DIR, "frontend", "public", "practice_results.json")
+
+
+class IngestDestinationsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def ingest(self, path, *args):
+        out = io.StringIO()
+        call_command("ingest_destinations", path, *args, stdout=out)
+        return out.getvalue()
+
+    def test_jsonl_upserts_by_slug_in_batches(self):
+        Destination.objects.create(slug="kyoto", name="Old name", region="Asia")
+        rows = [{"slug": f"city-{i}", "name": f"City {i}", "region": "Europe"} for i in range(5)]
+        rows += [{"slug": "kyoto", "name": "Kyoto", "region": " ASIA ", "category": "Cities"},
+                 {"name": ""}]
+        path = self.write("dump.jsonl", "\n".join(json.dumps(r) for r in rows) + "\n")
+
+        output = self.ingest(path, "--batch-size", "2")
+
+        self.assertIn("6 upserted, 1 skipped", output)
+        self.assertIn("rows/s", output)
+        self.assertEqual(Destination.objects.count(), 6)
+        kyoto = Destination.objects.get(slug="kyoto")
+        self.assertEqual((kyoto.name, kyoto.region_key, kyoto.category_key), ("Kyoto", "asia", "cities"))
+
+    def test_duplicate_slugs_in_one_batch_keep_last(self):
+        path = self.write("dump.json", json.dumps([
+            {"slug": "rome", "name": "Rome v1"},
+            {"slug": "rome", "name": "Rome v2"},
+        ]))
+
+        self.ingest(path)
+
+        self.assertEqual(Destination.objects.get(slug="rome").name, "Rome v2")
+
+    def test_csv(self):
+        path = self.write("dump.csv", "slug,name,region,category,description\n"
+                                      "oslo,Oslo,Europe,Cities,Fjords and saunas\n")
+
+        self.ingest(path)
+
+        oslo = Destination.objects.get(slug="oslo")
+        self.assertEqual((oslo.region_key, oslo.description), ("europe", "Fjords and saunas"))
+
+    def test_ids_and_slugs_are_slugified(self):
+        path = self.write("dump.jsonl", "\n".join(json.dumps(r) for r in [
+            {"id": 42, "name": "Answer Island"},
+            {"slug": "Cape Town", "name": "Cape Town"},
+            {"name": "São Paulo"},
+        ]))
+
+        self.ingest(path)
+
+        self.assertEqual(set(Destination.objects.values_list("slug", flat=True)), {"42", "cape-town", "sao-paulo"})
+
+    def test_non_object_records_skipped(self):
+        path = self.write("dump.jsonl", '["x"]\n"y"\n{"slug": "nice", "name": "Nice"}\n')
+
+        output = self.ingest(path)
+
+        self.assertIn("1 upserted, 2 skipped", output)
+        self.assertTrue(Destination.objects.filter(slug="nice").exists())
+
+    def test_serpapi_results_dump(self):
+        self.ingest(PRACTICE_RESULTS)
+
+        lisbon = Destination.objects.get(slug="lisbon")
+        self.assertEqual(lisbon.region_key, "europe")
+        self.assertTrue(lisbon.price.startswith("From $"))
+        self.assertTrue(lisbon.image_url.startswith("https://"))
+
+    @override_settings(SHARED_CACHE=True)
+    def test_ingest_invalidates_cache_and_search_index(self):
+        self.assertEqual(self.client.get("/api/destinations/", {"q": "fjords"}).json()["results"], [])
+        path = self.write("dump.jsonl", json.dumps({"slug": "bergen", "name": "Bergen", "description": "Fjords"}))
+
+        self.ingest(path)
+
+        results = self.client.get("/api/destinations/", {"q": "fjords"}).json()["results"]
+        self.assertEqual([d["id"] for d in results], ["bergen"])
+
+    def test_bad_input(self):
+        with self.assertRaises(CommandError):
+            self.ingest(os.path.join(self.tmp, "missing.jsonl"))
+        with self.assertRaises(CommandError):
+            self.ingest(self.write("dump.xml", "<x/>"))
+        with self.assertRaises(CommandError):
+            self.ingest(self.write("dump.jsonl", "{not json}\n"))
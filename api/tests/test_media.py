@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.http import http_date
+
+from api.media import parse_range
+
+BODY = bytes(range(256)) * 4  # 1024 bytes
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = {
+            "bytes=0-9": (0, 9),
+            "bytes=1000-": (1000, 1023),
+            "bytes=-24": (1000, 1023),
+            "bytes=-5000": (0, 1023),
+            "bytes=1000-5000": (1000, 1023),
+            "bytes=0-1,5-9": None,
+            "items=0-9": None,
+            None: None,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 1024), expected)
+
+    def test_unsatisfiable(self):
+        for header in ("bytes=1024-", "bytes=9-5", "bytes=-0"):
+            with self.subTest(header=header), self.assertRaises(ValueError):
+                parse_range(header, 1024)
+
+
+class ServeMediaTests(SimpleTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=self.media_root, MEDIA_SERVE_OFFLOAD="")
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        for name in ("trip_images/photo.jpg", "trip_images/derived/abc123_card.jpg"):
+            path = os.path.join(self.media_root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(BODY)
+
+    def get(self, path="trip_images/photo.jpg", **headers):
+        return self.client.get(f"/media/{path}", headers=headers)
+
+    def test_full_response_headers(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), BODY)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Content-Length"], "1024")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertNotIn("immutable", response["Cache-Control"])
+
+    def test_content_hashed_files_are_immutable(self):
+        response = self.get("trip_images/derived/abc123_card.jpg")
+
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_conditional_requests_return_304(self):
+        first = self.get()
+
+        by_etag = self.get(If_None_Match=first["ETag"])
+        by_date = self.get(If_Modified_Since=first["Last-Modified"])
+
+        self.assertEqual(by_etag.status_code, 304)
+        self.assertEqual(by_etag["ETag"], first["ETag"])
+        self.assertEqual(by_date.status_code, 304)
+
+    def test_changed_file_is_resent(self):
+        etag = self.get()["ETag"]
+        path = os.path.join(self.media_root, "trip_images/photo.jpg")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+
+        self.assertEqual(self.get(If_None_Match=etag).status_code, 200)
+
+    def test_byte_range(self):
+        response = self.get(Range="bytes=10-19")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), BODY[10:20])
+        self.assertEqual(response["Content-Range"], "bytes 10-19/1024")
+        self.assertEqual(response["Content-Length"], "10")
+
+    def test_unsatisfiable_range(self):
+        response = self.get(Range="bytes=5000-")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+    def test_if_range_mismatch_sends_whole_file(self):
+        response = self.get(Range="bytes=10-19", If_Range='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Length"], "1024")
+
+    def test_if_range_date(self):
+        path = os.path.join(self.media_root, "trip_images/photo.jpg")
+        response = self.get(Range="bytes=0-0", If_Range=http_date(os.stat(path).st_mtime))
+
+        self.assertEqual(response.status_code, 206)
+
+    def test_missing_and_escaping_paths_404(self):
+        for path in ("trip_images/missing.jpg", "trip_images", "../manage.py", "%2e%2e/manage.py"):
+            with self.subTest(path=path):
+                self.assertEqual(self.get(path).status_code, 404)
+
+    def test_only_safe_methods(self):
+        self.assertEqual(self.client.post("/media/trip_images/photo.jpg").status_code, 405)
+        self.assertEqual(self.client.head("/media/trip_images/photo.jpg").status_code, 200)
+
+    @override_settings(MEDIA_SERVE_OFFLOAD="x-accel-redirect", MEDIA_ACCEL_REDIRECT_PREFIX="/protected-media/")
+    def test_x_accel_redirect(self):
+        response = self.get("trip_images/derived/abc123_card.jpg")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/trip_images/derived/abc123_card.jpg")
+        self.assertEqual(response.content, b"")
+        self.assertIn("immutable", response["Cache-Control"])
+
+    @override_settings(MEDIA_SERVE_OFFLOAD="x-sendfile")
+    def test_x_sendfile(self):
+        response = self.get()
+
+        self.assertEqual(response["X-Sendfile"], os.path.join(self.media_root, "trip_images/photo.jpg"))
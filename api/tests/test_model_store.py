@@ -0,0 +1,119 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from unittest.mock import patch
+
+from api import geocoding
+from backend.ml import model_store
+from backend.ml.model_store import ModelNotAvailableError
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+
+def tiny_model():
+    import xgboost as xgb
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, len(XGBoostComfortScoreModel.FEATURES)))
+    y = X[:, 1] * 10 + 50
+    model = xgb.XGBRegressor(n_estimators=20, max_depth=3)
+    model.fit(X, y)
+    return model, X, y
+
+
+class ModelStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_importing_views_does_not_load_xgboost(self):
+        code = "import django; django.setup(); import api.views, sys; print('xgboost' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "backend.settings"},
+        )
+        self.assertEqual(out.stdout.strip(), "False", out.stderr)
+
+    def test_native_round_trip_with_metadata(self):
+        model, X, y = tiny_model()
+        data_hash = model_store.training_data_hash(X, y)
+        metadata = model_store.save_model(model, data_hash, models_dir=self.tmp.name)
+
+        with open(model_store.model_paths(self.tmp.name)["metadata"]) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk, metadata)
+        self.assertEqual(on_disk["features"], XGBoostComfortScoreModel.FEATURES)
+        self.assertEqual(on_disk["training_data_sha256"], data_hash)
+
+        loaded = model_store.load_model(self.tmp.name, engine="xgboost")
+        np.testing.assert_allclose(loaded.predict(X), model.predict(X), rtol=1e-6)
+
+    def test_corrupt_artifact_is_rejected(self):
+        model, X, y = tiny_model()
+        model_store.save_model(model, "hash", models_dir=self.tmp.name)
+        with open(model_store.model_paths(self.tmp.name)["native"], "ab") as f:
+            f.write(b"garbage")
+        with self.assertRaisesRegex(ModelNotAvailableError, "Checksum"):
+            model_store.load_model(self.tmp.name, engine="xgboost")
+
+    def test_corrupt_tree_export_is_rejected(self):
+        model, X, y = tiny_model()
+        model_store.save_model(model, "hash", models_dir=self.tmp.name)
+        with open(model_store.model_paths(self.tmp.name)["trees"], "ab") as f:
+            f.write(b"garbage")
+        with self.assertRaisesRegex(ModelNotAvailableError, "Checksum"):
+            model_store.load_model(self.tmp.name)
+
+    def test_missing_model(self):
+        with self.assertRaises(ModelNotAvailableError):
+            model_store.load_model(self.tmp.name)
+
+    def test_get_model_loads_once_across_threads(self):
+        calls = []
+
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        model_store.reset_model()
+        self.addCleanup(model_store.reset_model)
+        with patch.object(model_store, "load_model", side_effect=slow_load):
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(model_store.get_model())) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+
+class MissingModelViewTests(TestCase):
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        cache.clear()
+
+    @patch("backend.ml.pipeline.get_model", side_effect=ModelNotAvailableError("no model"))
+    @patch("api.views.cached_geocode_city", return_value={"lat": 25.77, "lon": -80.19})
+    @patch("api.views.get_forecast", return_value={
+        "daily": {
+            "time": ["2025-04-01"], "temperature_2m_max": [28.0], "temperature_2m_min": [22.0],
+            "precipitation_sum": [0.0], "wind_speed_10m_max": [10.0], "cloudcover_mean": [40],
+        },
+        "hourly": {"time": ["2025-04-01T00:00"], "relativehumidity_2m": [65]},
+    })
+    def test_comfort_by_city_returns_503(self, *mocks):
+        response = APIClient().post("/api/comfort-by-city/", {
+            "city": "Miami", "start_date": "2025-04-01", "end_date": "2025-04-01",
+        }, format="json")
+        self.assertEqual(response.status_code, 503)
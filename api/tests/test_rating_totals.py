@@ -0,0 +1,94 @@
+import io
+import json
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.models import BNB, MyTrips, Rating, Trip
+
+
+class BNBRatingTotalsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="traveller", password="pw")
+        self.client.force_login(self.user)
+        self.trip = Trip.objects.create(user=self.user, name="Spring", location="Lisbon", date=date(2025, 4, 1))
+        self.bnb = BNB.objects.create(trip=self.trip, name="Casa", address="Rua 1")
+        MyTrips.objects.get(user=self.user).trips.add(self.trip)
+
+    def totals(self, bnb=None):
+        bnb = bnb or self.bnb
+        bnb.refresh_from_db()
+        return bnb.rating_count, bnb.rating_sum
+
+    def test_rating_view_updates_totals(self):
+        for value in (4, 5):
+            response = self.client.post(f"/api/bnb/{self.bnb.id}/ratings/", json.dumps({"value": value}),
+                                        content_type="application/json")
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.totals(), (2, 9))
+        self.assertEqual(self.bnb.average_rating, 4.5)
+
+    def test_delete_updates_totals(self):
+        ratings = [Rating.objects.create(bnb=self.bnb, value=v) for v in (1, 3, 5)]
+
+        ratings[0].delete()
+        Rating.objects.filter(pk=ratings[1].pk).delete()
+
+        self.assertEqual(self.totals(), (1, 5))
+
+    def test_edit_and_move_rating(self):
+        other = BNB.objects.create(name="Hostel", address="Rua 2")
+        rating = Rating.objects.create(bnb=self.bnb, value=2)
+
+        rating = Rating.objects.get(pk=rating.pk)
+        rating.value = 5
+        rating.save()
+        self.assertEqual(self.totals(), (1, 5))
+
+        rating.bnb = other
+        rating.save()
+        rating.save()
+        self.assertEqual(self.totals(), (0, 0))
+        self.assertEqual(self.totals(other), (1, 5))
+        self.assertIsNone(self.bnb.average_rating)
+
+    def test_bnb_saves_keep_concurrent_totals(self):
+        stale = BNB.objects.get(pk=self.bnb.pk)
+        Rating.objects.create(bnb=self.bnb, value=4)
+
+        stale.name = "Casa Azul"
+        stale.save()
+        response = self.client.put(f"/api/bnb/{self.bnb.id}/", json.dumps({"address": "Rua 3"}),
+                                   content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.totals(), (1, 4))
+        self.assertEqual((self.bnb.name, self.bnb.address), ("Casa Azul", "Rua 3"))
+
+    def test_trip_detail_reads_totals(self):
+        Rating.objects.create(bnb=self.bnb, value=4)
+        # totals are what the endpoint reports, not a recount of the ratings
+        BNB.objects.filter(pk=self.bnb.pk).update(rating_count=3, rating_sum=10)
+
+        trip = self.client.get(f"/api/trips/{self.trip.id}/").json()["trip"]
+
+        self.assertEqual(trip["bnb"]["average_rating"], 3.3)
+
+    def test_repair_command(self):
+        for value in (2, 4):
+            Rating.objects.create(bnb=self.bnb, value=value)
+        empty = BNB.objects.create(name="Hostel", address="Rua 2", rating_count=7, rating_sum=7)
+        # bulk updates bypass the signals
+        Rating.objects.filter(bnb=self.bnb).update(value=5)
+
+        out = io.StringIO()
+        call_command("repair_rating_totals", "--check", stdout=out)
+        self.assertIn("2.", out.getvalue())
+        self.assertEqual(self.totals(), (2, 6))
+
+        call_command("repair_rating_totals", stdout=io.StringIO())
+        self.assertEqual(self.totals(), (2, 10))
+        self.assertEqual(self.totals(empty), (0, 0))
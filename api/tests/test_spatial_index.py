@@ -0,0 +1,99 @@
+import os
+import tempfile
+from datetime import timedelta
+
+import numpy as np
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from unittest.mock import patch
+
+from api import geocoding
+from backend.ml.spatial_index import EARTH_RADIUS_KM, StationIndex
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class StationIndexTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.lat = rng.uniform(-80, 80, 500)
+        self.lon = rng.uniform(-180, 180, 500)
+        self.index = StationIndex([f"s{i}" for i in range(500)], self.lat, self.lon)
+
+    def test_k_nearest_matches_brute_force(self):
+        for lat, lon in [(40.7, -74.0), (-33.9, 151.2), (0.0, 179.9), (89.0, 10.0)]:
+            distances = haversine_km(lat, lon, self.lat, self.lon)
+            expected = np.argsort(distances)[:5]
+
+            matches = self.index.nearest(lat, lon, k=5)
+            self.assertEqual([m["index"] for m in matches], expected.tolist())
+            np.testing.assert_allclose([m["distance_km"] for m in matches], distances[expected], rtol=1e-9)
+
+    def test_radius_query_matches_brute_force(self):
+        distances = haversine_km(51.5, -0.1, self.lat, self.lon)
+        matches = self.index.within(51.5, -0.1, 2000)
+
+        expected = np.flatnonzero(distances <= 2000)
+        self.assertEqual(sorted(m["index"] for m in matches), sorted(expected.tolist()))
+        self.assertEqual([m["distance_km"] for m in matches], sorted(m["distance_km"] for m in matches))
+
+    def test_antimeridian_neighbours(self):
+        index = StationIndex(["west", "east", "far"], [0.0, 0.0, 0.0], [179.9, -179.9, 90.0])
+        names = [m["name"] for m in index.nearest(0.0, -179.95, k=2)]
+        self.assertEqual(set(names), {"west", "east"})
+
+    def test_max_distance_filters_results(self):
+        index = StationIndex(["a", "b"], [0.0, 0.0], [0.0, 10.0])
+        self.assertEqual([m["name"] for m in index.nearest(0.0, 1.0, k=2, max_distance_km=500)], ["a"])
+        self.assertEqual(index.nearest(50.0, 50.0, max_distance_km=100), [])
+
+    def test_save_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stations.npz")
+            self.index.save(path)
+            loaded = StationIndex.load(path)
+        self.assertEqual(loaded.nearest(10, 10, k=3), self.index.nearest(10, 10, k=3))
+
+
+class NearestStationComfortTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        geocoding.clear_memory_cache()
+        cache.clear()
+
+    def post(self, city, start, end):
+        return self.client.post("/api/comfort-by-city/", {
+            "city": city, "start_date": start.isoformat(), "end_date": end.isoformat(),
+        }, format="json")
+
+    @patch("api.views.cached_geocode_city", return_value={"lat": 42.37, "lon": -71.11})
+    def test_unseen_city_uses_nearest_station(self, mock_geo):
+        start = timezone.localdate() + timedelta(days=90)
+        response = self.post("Cambridge", start, start)
+
+        self.assertEqual(response.status_code, 200)
+        result = response.json()["results"][0]
+        self.assertEqual(result["station"], "Boston")
+        self.assertLess(result["station_distance_km"], 10)
+        self.assertEqual(result["source"], "climatology")
+
+    @patch("api.views.cached_geocode_city", return_value={"lat": -41.29, "lon": 174.78})
+    def test_no_station_in_range(self, mock_geo):
+        start = timezone.localdate() + timedelta(days=90)
+        response = self.post("Wellington", start, start)
+        self.assertEqual(response.status_code, 404)
+
+    @patch("api.views.cached_geocode_city")
+    def test_known_city_skips_geocoding(self, mock_geo):
+        start = timezone.localdate() + timedelta(days=90)
+        response = self.post("Seattle", start, start)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["station_distance_km"], 0.0)
+        mock_geo.assert_not_called()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+from unittest.mock import patch
+
+from backend.ml.dataset_store import write_table
+from backend.ml.training import train_xgboost
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+
+class ComfortModelParamsTests(SimpleTestCase):
+    def test_overrides_and_defaults(self):
+        model = XGBoostComfortScoreModel(n_estimators=10, tree_method="approx", n_jobs=2)
+        params = model.xgb_model.get_params()
+        self.assertEqual((params["n_estimators"], params["tree_method"], params["n_jobs"]), (10, "approx", 2))
+        self.assertEqual(params["max_depth"], XGBoostComfortScoreModel.PARAMS["max_depth"])
+
+    def test_unknown_parameter_is_rejected(self):
+        with self.assertRaises(ValueError):
+            XGBoostComfortScoreModel(n_trees=10)
+
+    def test_cli_overrides(self):
+        args = train_xgboost.parse_args(["--threads", "4", "--tree-method", "hist", "--early-stopping-rounds", "0"])
+        self.assertEqual(train_xgboost.model_overrides(args), {
+            "tree_method": "hist", "n_jobs": 4, "early_stopping_rounds": None,
+        })
+        self.assertIsNone(train_xgboost.parse_args([]).warm_start)
+
+
+class TrainingMatrixCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+        rng = np.random.default_rng(0)
+        n = 200
+        df = pd.DataFrame({name: rng.normal(size=n) for name in XGBoostComfortScoreModel.FEATURES})
+        df["month"] = rng.integers(1, 13, n)
+        df["comfort_index"] = rng.uniform(0, 100, n)
+        self.store = os.path.join(self.tmp.name, "scored.cols")
+        write_table(df, self.store)
+
+        patcher = patch.object(train_xgboost, "ensure_dataset", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_split_is_cached_and_reused(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        first = train_xgboost.load_training_matrix(cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        with patch.object(train_xgboost, "train_test_split", side_effect=AssertionError("rebuilt")):
+            second = train_xgboost.load_training_matrix(cache_dir=cache_dir)
+
+        self.assertIsInstance(second[0], np.memmap)
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+        self.assertEqual(first[0].shape, (160, len(XGBoostComfortScoreModel.FEATURES)))
+
+    def test_split_settings_change_the_cache_key(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        train_xgboost.load_training_matrix(cache_dir=cache_dir)
+        train_xgboost.load_training_matrix(test_size=0.3, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_no_cache(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        train_xgboost.load_training_matrix(cache_dir=cache_dir, use_cache=False)
+        self.assertFalse(os.path.exists(cache_dir))
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from unittest.mock import patch
+
+from backend.ml import model_store, tree_engine
+from backend.ml.tree_engine import TreeEnsemble
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+
+def training_data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, len(XGBoostComfortScoreModel.FEATURES)))
+    y = 40 + 10 * X[:, 1] - 5 * np.abs(X[:, 2]) + 3 * X[:, 0] * X[:, 4]
+    return X, y
+
+
+class TreeEngineTests(SimpleTestCase):
+    def setUp(self):
+        import xgboost as xgb
+        self.xgb = xgb
+        self.X, self.y = training_data()
+
+    def assertMatches(self, model, engine, X):
+        np.testing.assert_allclose(engine.predict(X), model.predict(X), rtol=1e-5, atol=1e-4)
+
+    def test_matches_xgboost(self):
+        model = self.xgb.XGBRegressor(n_estimators=50, max_depth=3, learning_rate=0.2)
+        model.fit(self.X, self.y)
+        engine = TreeEnsemble.from_xgboost(model)
+
+        self.assertEqual(engine.n_trees, 50)
+        self.assertEqual(engine.depth, 3)
+        self.assertMatches(model, engine, training_data(n=500, seed=1)[0])
+
+    def test_missing_values_follow_default_direction(self):
+        X = self.X.copy()
+        X[::3, 1] = np.nan
+        X[::5, 2] = np.nan
+        model = self.xgb.XGBRegressor(n_estimators=30, max_depth=3)
+        model.fit(X, self.y)
+
+        test = training_data(n=200, seed=2)[0]
+        test[::2, 1] = np.nan
+        test[::7, :] = np.nan
+        self.assertMatches(model, TreeEnsemble.from_xgboost(model), test)
+
+    def test_unbalanced_trees_are_padded(self):
+        # large min_child_weight stops some branches early
+        model = self.xgb.XGBRegressor(n_estimators=20, max_depth=5, min_child_weight=60)
+        model.fit(self.X, self.y)
+        engine = TreeEnsemble.from_xgboost(model)
+
+        self.assertEqual(engine.depth, 5)
+        self.assertMatches(model, engine, self.X)
+
+    def test_early_stopping_keeps_best_iteration(self):
+        model = self.xgb.XGBRegressor(n_estimators=500, learning_rate=0.5, early_stopping_rounds=5)
+        model.fit(self.X[:300], self.y[:300], eval_set=[(self.X[300:], self.y[300:])], verbose=False)
+        engine = TreeEnsemble.from_xgboost(model)
+
+        self.assertEqual(engine.n_trees, model.best_iteration + 1)
+        self.assertMatches(model, engine, self.X)
+
+    def test_chunked_prediction(self):
+        model = self.xgb.XGBRegressor(n_estimators=10, max_depth=2)
+        model.fit(self.X, self.y)
+        engine = TreeEnsemble.from_xgboost(model)
+
+        with patch.object(tree_engine, "_CHUNK_ELEMENTS", 25):
+            self.assertMatches(model, engine, self.X)
+
+    def test_save_load_round_trip(self):
+        model = self.xgb.XGBRegressor(n_estimators=10, max_depth=3)
+        model.fit(self.X, self.y)
+        engine = TreeEnsemble.from_xgboost(model)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trees.npz")
+            engine.save(path)
+            loaded = TreeEnsemble.load(path)
+
+        np.testing.assert_array_equal(loaded.predict(self.X), engine.predict(self.X))
+        self.assertEqual(loaded.base_score, engine.base_score)
+
+
+class TreeEngineServingTests(SimpleTestCase):
+    def test_serving_loads_trees_without_xgboost(self):
+        import xgboost as xgb
+        X, y = training_data()
+        model = xgb.XGBRegressor(n_estimators=20, max_depth=3)
+        model.fit(X, y)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            model_store.save_model(model, "hash", models_dir=tmp)
+            np.save(os.path.join(tmp, "X.npy"), X)
+            code = (
+                "import sys, numpy as np; from backend.ml import model_store; "
+                f"m = model_store.load_model({tmp!r}); "
+                f"p = m.predict(np.load({tmp!r} + '/X.npy')); "
+                f"np.save({tmp!r} + '/p.npy', p); "
+                "print(type(m).__name__, 'xgboost' in sys.modules)"
+            )
+            out = subprocess.run(
+                [sys.executable, "-c", code], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            )
+            self.assertEqual(out.stdout.strip(), "TreeEnsemble False", out.stderr)
+            predictions = np.load(os.path.join(tmp, "p.npy"))
+
+        np.testing.assert_allclose(predictions, model.predict(X), rtol=1e-5, atol=1e-4)
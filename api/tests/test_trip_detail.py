@@ -0,0 +1,89 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from api.models import BNB, MyTrips, Plan, Rating, Review, Trip
+
+# Session + user lookups made by the auth middleware on every request
+AUTH_QUERIES = 2
+
+
+class GetTripViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="traveller", password="pw")
+        self.client.force_login(self.user)
+        # the first request stamps the session (see api.auth_cache.SessionRefreshMiddleware)
+        self.client.get("/api/check-auth/")
+        self.trip = Trip.objects.create(user=self.user, name="Spring", location="Lisbon", date=date(2025, 4, 1))
+        self.bnb = BNB.objects.create(trip=self.trip, name="Casa", address="Rua 1")
+
+    def add_reviews(self, values):
+        for value in values:
+            rating = Rating.objects.create(bnb=self.bnb, value=value)
+            Review.objects.create(bnb=self.bnb, statement=f"{value} stars", rating=rating)
+
+    def complete(self):
+        MyTrips.objects.get(user=self.user).trips.add(self.trip)
+
+    def get_trip(self):
+        response = self.client.get(f"/api/trips/{self.trip.id}/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["trip"]
+
+    def test_completed_trip_includes_ratings_and_reviews(self):
+        Plan.objects.create(trip=self.trip, name="Tram 28", activity="ride")
+        self.add_reviews([4, 5, 5])
+        self.complete()
+
+        trip = self.get_trip()
+
+        self.assertTrue(trip["is_completed"])
+        self.assertEqual([p["name"] for p in trip["plans"]], ["Tram 28"])
+        self.assertEqual(trip["bnb"]["average_rating"], 4.7)
+        self.assertEqual([r["value"] for r in trip["bnb"]["ratings"]], [4, 5, 5])
+        reviews = trip["bnb"]["reviews"]
+        self.assertEqual([r["rating_id"] for r in reviews], [r["id"] for r in trip["bnb"]["ratings"]])
+
+    def test_uncompleted_trip_hides_ratings_but_keeps_average(self):
+        self.add_reviews([2, 3])
+
+        trip = self.get_trip()
+
+        self.assertFalse(trip["is_completed"])
+        self.assertEqual(trip["bnb"]["average_rating"], 2.5)
+        self.assertEqual(trip["bnb"]["ratings"], [])
+        self.assertEqual(trip["bnb"]["reviews"], [])
+
+    def test_trip_without_bnb_or_ratings(self):
+        self.bnb.delete()
+
+        trip = self.get_trip()
+
+        self.assertIsNone(trip["bnb"])
+
+    def test_other_users_trip_not_found(self):
+        other = User.objects.create_user(username="other", password="pw")
+        self.client.force_login(other)
+
+        response = self.client.get(f"/api/trips/{self.trip.id}/")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_completed_trip_query_count_is_fixed(self):
+        # trip + bnb + average + completion, plans, ratings, reviews
+        self.add_reviews([3])
+        self.complete()
+        with self.assertNumQueries(AUTH_QUERIES + 4):
+            self.get_trip()
+
+        for i in range(10):
+            Plan.objects.create(trip=self.trip, name=f"plan {i}")
+        self.add_reviews([1, 2, 3, 4, 5] * 4)
+        with self.assertNumQueries(AUTH_QUERIES + 4):
+            self.get_trip()
+
+    def test_uncompleted_trip_skips_rating_queries(self):
+        self.add_reviews([3, 4, 5])
+        with self.assertNumQueries(AUTH_QUERIES + 2):
+            self.get_trip()
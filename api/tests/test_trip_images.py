@@ -0,0 +1,119 @@
+import io
+import shutil
+import tempfile
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from api.models import Trip
+from api.trip_images import render_variants
+
+SIZES = {"thumb": 50, "card": 100, "full": 300}
+
+
+def jpeg_bytes(size=(800, 400), orientation=None):
+    img = Image.new("RGB", size, "teal")
+    exif = Image.Exif()
+    exif[0x010F] = "CameraMaker"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    out = io.BytesIO()
+    img.save(out, "JPEG", exif=exif.tobytes())
+    return out.getvalue()
+
+
+class TripImageTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=self.media_root, TRIP_IMAGE_VARIANTS=SIZES, TRIP_IMAGE_WORKERS=0)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = User.objects.create_user(username="traveller", password="pw")
+        self.client.force_login(self.user)
+
+    def upload(self, data, name="photo.jpg"):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/trips/create-for-bucket-list/", {
+                "name": "Coast", "location": "Porto", "date": "2025-05-01",
+                "image": SimpleUploadedFile(name, data, content_type="image/jpeg"),
+            })
+        self.assertEqual(response.status_code, 200)
+        return Trip.objects.get(id=response.json()["trip"]["id"])
+
+
+class RenderVariantsTests(TripImageTestCase):
+    def test_variants_fit_their_size_and_keep_aspect(self):
+        rendered = render_variants(io.BytesIO(jpeg_bytes()), SIZES)
+
+        dims = {variant: (w, h) for variant, (_, w, h) in rendered.items()}
+        self.assertEqual(dims, {"thumb": (50, 25), "card": (100, 50), "full": (300, 150)})
+
+    def test_exif_orientation_applied_then_stripped(self):
+        rendered = render_variants(io.BytesIO(jpeg_bytes(orientation=6)), SIZES)
+
+        data, width, height = rendered["full"]
+        self.assertEqual((width, height), (150, 300))
+        self.assertEqual(len(Image.open(io.BytesIO(data)).getexif()), 0)
+
+    def test_transparent_images_flattened(self):
+        out = io.BytesIO()
+        Image.new("RGBA", (200, 200), (255, 0, 0, 0)).save(out, "PNG")
+
+        data, _, _ = render_variants(io.BytesIO(out.getvalue()), SIZES)["thumb"]
+
+        self.assertEqual(Image.open(io.BytesIO(data)).getpixel((0, 0)), (255, 255, 255))
+
+
+class TripUploadVariantsTests(TripImageTestCase):
+    def test_upload_renders_variants(self):
+        trip = self.upload(jpeg_bytes())
+
+        self.assertEqual(set(trip.image_variants), set(SIZES))
+        for variant in trip.image_variants.values():
+            self.assertTrue(default_storage.exists(variant["name"]))
+        self.assertEqual(trip.image_variants["card"]["width"], 100)
+
+    def test_identical_uploads_share_derivatives(self):
+        first = self.upload(jpeg_bytes())
+        second = self.upload(jpeg_bytes())
+
+        self.assertNotEqual(first.image.name, second.image.name)
+        self.assertEqual(first.image_variants, second.image_variants)
+
+    def test_list_and_detail_return_variant_urls(self):
+        trip = self.upload(jpeg_bytes())
+
+        listed = self.client.get("/api/bucket-list/").json()["trips"][0]
+        detail = self.client.get(f"/api/trips/{trip.id}/").json()["trip"]
+
+        card = trip.image_variants["card"]["name"]
+        self.assertTrue(listed["image"].endswith(card))
+        self.assertTrue(detail["image"].endswith(trip.image_variants["full"]["name"]))
+        self.assertEqual(listed["images"], detail["images"])
+
+    def test_original_never_served(self):
+        trip = Trip.objects.create(user=self.user, name="Old", location="Faro", date=date(2025, 1, 1),
+                                   image=SimpleUploadedFile("old.jpg", jpeg_bytes()))
+        self.user.bucket_list.trips.add(trip)
+
+        listed = self.client.get("/api/bucket-list/").json()["trips"][0]
+
+        self.assertEqual(listed["images"], dict.fromkeys(SIZES))
+        self.assertIsNone(listed["image"])
+
+    def test_backfill_command(self):
+        trip = Trip.objects.create(user=self.user, name="Old", location="Faro", date=date(2025, 1, 1),
+                                   image=SimpleUploadedFile("old.jpg", jpeg_bytes()))
+        Trip.objects.create(user=self.user, name="No image", location="Faro", date=date(2025, 1, 1))
+
+        call_command("generate_trip_images", stdout=io.StringIO())
+
+        trip.refresh_from_db()
+        self.assertEqual(set(trip.image_variants), set(SIZES))
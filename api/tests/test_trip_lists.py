@@ -0,0 +1,88 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from api.models import BucketList, MyTrips, Trip
+
+# Session + user lookups made by the auth middleware on every request
+AUTH_QUERIES = 2
+
+
+class TripListPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="traveller", password="pw")
+        self.client.force_login(self.user)
+        # the first request stamps the session (see api.auth_cache.SessionRefreshMiddleware)
+        self.client.get("/api/check-auth/")
+        self.bucket_list = BucketList.objects.get(user=self.user)
+
+    def add_trips(self, n, trip_list=None):
+        trips = [
+            Trip.objects.create(user=self.user, name=f"Trip {i}", location=f"City {i}", date=date(2025, 1, 1))
+            for i in range(n)
+        ]
+        (trip_list or self.bucket_list).trips.add(*trips)
+        return trips
+
+    def get_all_pages(self, url, limit):
+        ids, cursor = [], None
+        while True:
+            params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+            data = self.client.get(url, params).json()
+            ids += [t["id"] for t in data["trips"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_pages_cover_list_in_id_order(self):
+        trips = self.add_trips(7)
+
+        ids = self.get_all_pages("/api/bucket-list/", limit=3)
+
+        self.assertEqual(ids, [t.id for t in trips])
+
+    def test_page_fields(self):
+        Trip.objects.filter(pk=self.add_trips(1)[0].pk).update(
+            image="trip_images/a.jpg", image_variants={"card": {"name": "trip_images/derived/a_card.jpg"}})
+
+        trip = self.client.get("/api/bucket-list/").json()["trips"][0]
+
+        self.assertEqual(set(trip), {"id", "name", "location", "date", "image", "images"})
+        self.assertEqual(trip["date"], "2025-01-01")
+        self.assertTrue(trip["image"].startswith("http://testserver/"))
+        self.assertTrue(trip["image"].endswith("trip_images/derived/a_card.jpg"))
+
+    def test_last_page_has_no_cursor(self):
+        self.add_trips(2)
+
+        data = self.client.get("/api/bucket-list/", {"limit": 2}).json()
+
+        self.assertEqual(len(data["trips"]), 2)
+        self.assertIsNone(data["next_cursor"])
+
+    def test_my_trips_only_lists_own_completed_trips(self):
+        mine = self.add_trips(2, MyTrips.objects.get(user=self.user))
+        self.add_trips(1)
+        other = User.objects.create_user(username="other", password="pw")
+        MyTrips.objects.get(user=other).trips.add(Trip.objects.create(user=other, name="x", location="y", date=date(2025, 1, 1)))
+
+        ids = self.get_all_pages("/api/my-trips/", limit=1)
+
+        self.assertEqual(ids, [t.id for t in mine])
+
+    @override_settings(TRIP_LIST_MAX_PAGE_SIZE=10)
+    def test_invalid_paging_parameters(self):
+        for params in ({"limit": 0}, {"limit": 11}, {"limit": "many"}, {"cursor": "abc"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/bucket-list/", params).status_code, 400)
+
+    def test_query_count_independent_of_list_size(self):
+        self.add_trips(3)
+        with self.assertNumQueries(AUTH_QUERIES + 1):
+            self.client.get("/api/bucket-list/", {"limit": 2})
+
+        cursor = self.client.get("/api/bucket-list/", {"limit": 2}).json()["next_cursor"]
+        self.add_trips(50)
+        with self.assertNumQueries(AUTH_QUERIES + 1):
+            self.client.get("/api/bucket-list/", {"limit": 2, "cursor": cursor})
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import requests
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from requests.adapters import BaseAdapter
+
+from backend.ml.weather_client import (
+    AsyncWeatherClient, WeatherClient, WeatherClientError, build_url, get_async_client,
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the Open-Meteo APIs."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        self.server.requests.append((url.path, query))
+
+        if url.path == "/flaky" and len(self.server.requests) < 3:
+            self.send_response(503)
+            self.end_headers()
+            return
+        if url.path == "/broken":
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        if url.path == "/v1/search" and query["name"][0] == "Bad request":
+            payload = json.dumps({"error": True, "reason": "Parameter count must be positive"}).encode()
+            self.send_response(400)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        if url.path == "/v1/search":
+            found = query["name"][0] != "Atlantis"
+            body = {"results": [{"latitude": 38.9, "longitude": -77.0}]} if found else {}
+        else:
+            body = {"ok": True, "query": query}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class CannedTransport(BaseAdapter):
+    """Transport adapter that answers every request without a network."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b'{"results": [{"latitude": 1.5, "longitude": 2.5}]}'
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+class WeatherClientTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server.requests = []
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.client = WeatherClient(
+            geocoding_url=f"{self.base}/v1/search",
+            forecast_url=f"{self.base}/v1/forecast",
+            read_timeout=2, retries=2, backoff=0.001,
+        )
+        self.addCleanup(self.client.close)
+
+    def test_build_url_encodes_parameters(self):
+        url = build_url("https://x/v1/search", {"name": "São Paulo & Co", "count": 1, "skip": None})
+        self.assertEqual(url, "https://x/v1/search?name=S%C3%A3o+Paulo+%26+Co&count=1")
+        self.assertIn("daily=a,b", build_url("https://x", {"daily": "a,b"}))
+
+    def test_geocode_against_stand_in_server(self):
+        self.assertEqual(self.client.geocode("Washington D.C."), {"lat": 38.9, "lon": -77.0})
+        self.assertIsNone(self.client.geocode("Atlantis"))
+        path, query = self.server.requests[0]
+        self.assertEqual(query["name"], ["Washington D.C."])
+
+    def test_geocode_error_answers_raise(self):
+        # a 4xx error body must not read as "no such city"
+        with self.assertRaises(WeatherClientError):
+            self.client.geocode("Bad request")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_forecast_params_are_passed_through(self):
+        resp = self.client.forecast({"latitude": 25.77, "longitude": -80.19, "daily": "a,b"})
+        self.assertEqual(resp["query"]["daily"], ["a,b"])
+
+    def test_transient_failures_are_retried(self):
+        self.assertEqual(self.client.get_json(f"{self.base}/flaky"), {"ok": True, "query": {}})
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_retries_are_bounded(self):
+        with self.assertRaises(WeatherClientError):
+            self.client.get_json(f"{self.base}/broken")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_connection_errors_raise_after_retries(self):
+        client = WeatherClient(geocoding_url="http://127.0.0.1:9/v1/search", retries=1, backoff=0.001)
+        with self.assertRaises(WeatherClientError):
+            client.geocode("Miami")
+
+    def test_pluggable_transport(self):
+        transport = CannedTransport()
+        client = WeatherClient(transport=transport)
+        self.assertEqual(client.geocode("Miami"), {"lat": 1.5, "lon": 2.5})
+        self.assertTrue(transport.urls[0].startswith("https://geocoding-api.open-meteo.com/v1/search?"))
+
+
+class AsyncWeatherClientTests(SimpleTestCase):
+    async def test_retries_then_succeeds_on_mock_transport(self):
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            if len(seen) < 2:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"results": [{"latitude": 1.0, "longitude": 2.0}]})
+
+        client = AsyncWeatherClient(transport=httpx.MockTransport(handler), backoff=0.001)
+        self.assertEqual(await client.geocode("São Paulo"), {"lat": 1.0, "lon": 2.0})
+        self.assertEqual(len(seen), 2)
+        self.assertIn("name=S%C3%A3o+Paulo", seen[0])
+        await client.aclose()
+
+    async def test_retries_are_bounded(self):
+        client = AsyncWeatherClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)), retries=1, backoff=0.001
+        )
+        with self.assertRaises(WeatherClientError):
+            await client.forecast({"latitude": 1, "longitude": 2})
+        await client.aclose()
+
+    async def test_geocode_raises_once_rate_limit_retries_run_out(self):
+        client = AsyncWeatherClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(429, json={"error": True})),
+            retries=1, backoff=0.001,
+        )
+        with self.assertRaises(WeatherClientError):
+            await client.geocode("Miami")
+        await client.aclose()
+
+
+class AsyncClientLifetimeTests(SimpleTestCase):
+    async def current_clients(self):
+        return get_async_client(), get_async_client()
+
+    def test_one_client_per_loop_closed_with_it(self):
+        first, again = asyncio.run(self.current_clients())
+
+        self.assertIs(first, again)
+        self.assertTrue(first.client.is_closed)
+
+    def test_async_views_under_wsgi_leave_no_open_client(self):
+        # asgiref gives every sync -> async call a loop of its own
+        first, _ = async_to_sync(self.current_clients)()
+        second, _ = async_to_sync(self.current_clients)()
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.client.is_closed and second.client.is_closed)
@@ -0,0 +1,136 @@
+"""
+Resized derivatives of uploaded trip images.
+
+Uploads are kept as-is, and a background thread pool renders one JPEG per
+size in TRIP_IMAGE_VARIANTS (thumbnail, card, full). Each derivative is
+rotated upright, downscaled to fit its size, re-encoded without EXIF and
+stored under a name derived from its content hash, so it can be cached
+forever. The stored names are recorded on Trip.image_variants. Until they
+exist the APIs return no URL for them: the original upload still carries
+its EXIF data (camera, GPS position) and is never handed out.
+"""
+import hashlib
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .models import Trip
+
+logger = logging.getLogger(__name__)
+
+DERIVED_DIR = "trip_images/derived"
+
+_executor = ThreadPoolExecutor(max_workers=settings.TRIP_IMAGE_WORKERS or 1, thread_name_prefix="trip-images")
+
+
+def _open_upright(source, max_size):
+    img = Image.open(source)
+    # JPEG decoders can downscale while decoding, which is far cheaper than
+    # decoding a full-resolution photo only to shrink it
+    img.draft("RGB", (max_size, max_size))
+    img = ImageOps.exif_transpose(img)
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, "white")
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def render_variants(source, sizes=None):
+    """
+    source: path or file object of the original image
+    sizes: {variant: longest edge in px} (default: TRIP_IMAGE_VARIANTS)
+    returns: {variant: (JPEG bytes, width, height)}
+    """
+    sizes = sizes or settings.TRIP_IMAGE_VARIANTS
+    img = _open_upright(source, max(sizes.values()))
+
+    rendered = {}
+    # largest first, so each smaller variant is resized from the previous one
+    for variant, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        img = img.copy()
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        # no exif= / icc_profile= arguments: metadata is not copied
+        img.save(out, "JPEG", quality=settings.TRIP_IMAGE_QUALITY, optimize=True, progressive=True)
+        rendered[variant] = (out.getvalue(), img.width, img.height)
+    return rendered
+
+
+def derivative_name(variant, data):
+    digest = hashlib.sha256(data).hexdigest()[:20]
+    return f"{DERIVED_DIR}/{digest}_{variant}.jpg"
+
+
+def generate_trip_image_variants(trip_id):
+    """
+    Render and store the derivatives of a trip's current image.
+
+    returns: the recorded {variant: {"name", "width", "height"}} mapping,
+             or None if the trip has no image (or it changed meanwhile)
+    """
+    image_name = Trip.objects.filter(pk=trip_id).values_list("image", flat=True).first()
+    if not image_name:
+        return None
+
+    with default_storage.open(image_name, "rb") as source:
+        rendered = render_variants(source)
+
+    variants = {}
+    for variant, (data, width, height) in rendered.items():
+        name = derivative_name(variant, data)
+        # content-addressed: an existing file already has these exact bytes
+        if not default_storage.exists(name):
+            name = default_storage.save(name, ContentFile(data))
+        variants[variant] = {"name": name, "width": width, "height": height}
+
+    # only record the variants if the trip still points at the same upload
+    updated = Trip.objects.filter(pk=trip_id, image=image_name).update(image_variants=variants)
+    return variants if updated else None
+
+
+def _generate_in_background(trip_id):
+    try:
+        generate_trip_image_variants(trip_id)
+    except Exception:
+        logger.exception("Could not generate image variants for trip %s", trip_id)
+    finally:
+        # worker threads get their own DB connection; don't leak it
+        connection.close()
+
+
+def schedule_trip_image_variants(trip):
+    """Render a trip's image derivatives once the current transaction commits."""
+    if not trip.image:
+        return
+    trip_id = trip.pk
+
+    def submit():
+        if settings.TRIP_IMAGE_WORKERS:
+            _executor.submit(_generate_in_background, trip_id)
+        else:
+            generate_trip_image_variants(trip_id)
+
+    transaction.on_commit(submit)
+
+
+def trip_image_urls(request, image_name, variants):
+    """
+    Absolute URL of every variant, None for variants that haven't been
+    rendered yet. returns None without an image.
+    """
+    if not image_name:
+        return None
+    variants = variants or {}
+    return {
+        variant: request.build_absolute_uri(default_storage.url(variants[variant]["name"]))
+        if variant in variants else None
+        for variant in settings.TRIP_IMAGE_VARIANTS
+    }
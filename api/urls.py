@@ -7,8 +7,10 @@ from .views import (
     get_trip_view, update_trip_view, delete_trip_view,
     create_plan_view, delete_plan_view, create_bnb_view,
     update_bnb_view, create_rating_view, create_review_view, comfort_by_city,
-    current_weather, complete_trip_view, destinations_view
+    current_weather, complete_trip_view, destinations_view,
+    forecast_cache_stats_view
 )
+from .async_views import comfort_by_city_async, current_weather_async, compare_comfort_async
 
 urlpatterns = [
     path("login/", login_view, name="login"),
@@ -37,5 +39,9 @@ urlpatterns = [
     path("bnb/<int:bnb_id>/reviews/", create_review_view, name="create_review"),
     path("comfort-by-city/", comfort_by_city),
     path("weather/current/", current_weather, name="current_weather"),
+    path("async/comfort-by-city/", comfort_by_city_async, name="comfort_by_city_async"),
+    path("async/weather/current/", current_weather_async, name="current_weather_async"),
+    path("comfort-compare/", compare_comfort_async, name="compare_comfort"),
+    path("weather/cache-stats/", forecast_cache_stats_view, name="forecast_cache_stats"),
     path("destinations/", destinations_view, name="destinations"),
 ]
\ No newline at end of file
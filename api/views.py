@@ -8,60 +8,70 @@ from django.utils.decorators import method_decorator
 from django.contrib.auth.models import User
 from django.views.decorators.http import require_http_methods
 from functools import wraps
-from .models import BucketList, MyTrips, Trip, Plan, BNB, Rating, Review, Destination
+from .models import BucketList, MyTrips, Trip, Plan, BNB, Rating, Review
 from django.conf import settings
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.generic import TemplateView
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, prefetch_related_objects
+from .trip_images import schedule_trip_image_variants, trip_image_urls
 
-### Helper function to build image URLs ###
-def get_image_url(request, image_field):
-    """Build absolute URL for an image field"""
-    if not image_field:
-        return None
+
+### Keyset pagination for trip lists ###
+TRIP_LIST_FIELDS = ("id", "name", "location", "date", "image", "image_variants")
+
+
+def page_params(request, default_limit, max_limit):
+    """(cursor, limit) from ?cursor= and ?limit=; ValueError with a client-facing message if invalid."""
     try:
-        # Get the relative URL from the image field (e.g., /media/trip_images/photo.jpg)
-        relative_url = image_field.url
-        
-        # Use Django's build_absolute_uri which handles host/port correctly
-        # This should use the backend server's host (e.g., localhost:8000)
-        absolute_url = request.build_absolute_uri(relative_url)
-        
-        # Debug: print the URL to help diagnose issues
-        if settings.DEBUG:
-            print(f"Image URL generated: {absolute_url} (from relative: {relative_url}, host: {request.get_host()})")
-        
-        return absolute_url
-    except Exception as e:
-        # Fallback: construct URL manually if build_absolute_uri fails
-        print(f"Error in build_absolute_uri: {e}")
-        try:
-            if hasattr(image_field, 'name') and image_field.name:
-                # Ensure MEDIA_URL starts with /
-                media_url = settings.MEDIA_URL
-                if not media_url.startswith('/'):
-                    media_url = '/' + media_url
-                # Ensure proper path joining
-                if media_url.endswith('/') and image_field.name.startswith('/'):
-                    image_path = media_url.rstrip('/') + image_field.name
-                elif not media_url.endswith('/') and not image_field.name.startswith('/'):
-                    image_path = media_url + '/' + image_field.name
-                else:
-                    image_path = media_url + image_field.name
-                
-                host = request.get_host()
-                # Ensure port is included for backend server
-                if ':' not in host and settings.DEBUG:
-                    # Default to port 8000 for Django dev server
-                    host = f"{host}:8000"
-                scheme = request.scheme
-                fallback_url = f"{scheme}://{host}{image_path}"
-                if settings.DEBUG:
-                    print(f"Fallback image URL: {fallback_url}")
-                return fallback_url
-        except Exception as fallback_error:
-            print(f"Error building image URL (fallback): {fallback_error}")
-            pass
-        return None
+        limit = int(request.GET.get("limit", default_limit))
+        cursor = request.GET.get("cursor")
+        cursor = int(cursor) if cursor else None
+    except ValueError:
+        raise ValueError("limit and cursor must be integers.")
+    if not 1 <= limit <= max_limit:
+        raise ValueError(f"limit must be between 1 and {max_limit}.")
+    return cursor, limit
+
+
+def trip_list_page(request, trips):
+    """
+    One page of `trips` ordered by id, as {"success", "trips", "next_cursor"}.
+
+    ?cursor= is the next_cursor of the previous page (the last trip id it
+    returned) and ?limit= the page size. Pages are found with an indexed
+    id > cursor seek instead of an OFFSET, and only the serialized columns
+    are selected, so every page costs the same however long the list is.
+    """
+    try:
+        cursor, limit = page_params(request, settings.TRIP_LIST_PAGE_SIZE, settings.TRIP_LIST_MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    if cursor is not None:
+        trips = trips.filter(id__gt=cursor)
+    # one extra row tells us whether another page follows
+    rows = list(trips.order_by("id").values(*TRIP_LIST_FIELDS)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    trips_data = []
+    for row in rows:
+        images = trip_image_urls(request, row["image"], row["image_variants"])
+        trips_data.append({
+            "id": row["id"],
+            "name": row["name"],
+            "location": row["location"],
+            "date": row["date"].isoformat() if row["date"] else None,
+            "image": images.get(settings.TRIP_IMAGE_LIST_VARIANT) if images else None,
+            "images": images,
+        })
+
+    return JsonResponse({
+        "success": True,
+        "trips": trips_data,
+        "next_cursor": str(rows[-1]["id"]) if has_more else None,
+    })
 
 
 ### Custom decorator for JSON API endpoints that require login ###
@@ -195,7 +205,7 @@ def register_view(request):
     user = User.objects.create_user(username=username, password=password)
     
     # Automatically log the user in after registration
-    login(request, user)
+    login(request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
     
     # Force session to be saved
     request.session.modified = True
@@ -214,7 +224,6 @@ def register_view(request):
     })
     
     # Manually set the session cookie (same as login)
-    from django.conf import settings
     if session_key:
         cookie_value = session_key
         max_age = settings.SESSION_COOKIE_AGE
@@ -316,23 +325,8 @@ def logout_view(request):
 ### Check Authentication Status ###
 def check_auth_view(request):
     """Check if user is authenticated (no login required)"""
-    # Debug: Check if session exists
-    has_session = request.session.session_key is not None
-    session_key = request.session.session_key
-    
-    # Debug: Check cookies in request
-    cookies = request.COOKIES
-    has_session_cookie = 'sessionid' in cookies
-    
-    # Debug: Check origin
-    origin = request.headers.get("Origin", "No Origin header")
-    
-    print(f"Check Auth: has_session={has_session}, session_key={session_key}, has_cookie={has_session_cookie}, origin={origin}")
-    
     if request.user.is_authenticated:
-        # Ensure session is saved
-        if not request.session.modified:
-            request.session.modified = True
+        # Read-only: the session is renewed by SessionRefreshMiddleware when it nears expiry
         user = request.user
         response = JsonResponse({
             "is_authenticated": True,
@@ -341,20 +335,11 @@ def check_auth_view(request):
             "first_name": user.first_name or "",
             "last_name": user.last_name or "",
             "email": user.email or "",
-            "session_key": session_key if has_session else None,
-            "has_cookie": has_session_cookie,
         })
         # Don't set CORS headers manually - middleware handles it
         return response
     else:
-        response = JsonResponse({
-            "is_authenticated": False,
-            "has_session": has_session,
-            "session_key": session_key if has_session else None,
-            "has_cookie": has_session_cookie,
-            "cookies_received": list(cookies.keys()),
-            "origin": origin,
-        })
+        response = JsonResponse({"is_authenticated": False})
         # Don't set CORS headers manually - middleware handles it
         return response
 
@@ -376,28 +361,9 @@ def user_view(request):
 ### Get Bucket List ###
 @json_login_required
 def bucket_list_view(request):
-    """Get all trips in the user's bucket list"""
-    user = request.user
+    """Get one page of trips in the user's bucket list"""
     try:
-        bucket_list, created = BucketList.objects.get_or_create(user=user)
-        trips = bucket_list.trips.all()
-        
-        trips_data = []
-        for trip in trips:
-            image_url = get_image_url(request, trip.image)
-            
-            trips_data.append({
-                "id": trip.id,
-                "name": trip.name,
-                "location": trip.location,
-                "date": trip.date.isoformat() if trip.date else None,
-                "image": image_url,
-            })
-        
-        return JsonResponse({
-            "success": True,
-            "trips": trips_data,
-        })
+        return trip_list_page(request, Trip.objects.filter(bucketlists__user=request.user))
     except Exception as e:
         return JsonResponse({
             "success": False,
@@ -408,28 +374,9 @@ def bucket_list_view(request):
 ### Get My Trips ###
 @json_login_required
 def my_trips_view(request):
-    """Get all trips in the user's MyTrips"""
-    user = request.user
+    """Get one page of trips in the user's MyTrips"""
     try:
-        my_trips, created = MyTrips.objects.get_or_create(user=user)
-        trips = my_trips.trips.all()
-        
-        trips_data = []
-        for trip in trips:
-            image_url = get_image_url(request, trip.image)
-            
-            trips_data.append({
-                "id": trip.id,
-                "name": trip.name,
-                "location": trip.location,
-                "date": trip.date.isoformat() if trip.date else None,
-                "image": image_url,
-            })
-        
-        return JsonResponse({
-            "success": True,
-            "trips": trips_data,
-        })
+        return trip_list_page(request, Trip.objects.filter(in_mytrips__user=request.user))
     except Exception as e:
         return JsonResponse({
             "success": False,
@@ -686,8 +633,10 @@ def create_trip_for_bucket_list_view(request):
         bucket_list, created = BucketList.objects.get_or_create(user=user)
         bucket_list.trips.add(trip)
         
-        # Build image URL if image exists
-        image_url = get_image_url(request, trip.image)
+        # Resized copies are rendered in the background; until then the
+        # variant URLs are None
+        schedule_trip_image_variants(trip)
+        images = trip_image_urls(request, trip.image.name, trip.image_variants)
         
         return JsonResponse({
             "success": True,
@@ -696,7 +645,8 @@ def create_trip_for_bucket_list_view(request):
                 "name": trip.name,
                 "location": trip.location,
                 "date": trip.date.isoformat() if trip.date else None,
-                "image": image_url,
+                "image": images.get(settings.TRIP_IMAGE_LIST_VARIANT) if images else None,
+                "images": images,
             },
             "message": "Trip created and added to bucket list successfully."
         })
@@ -760,8 +710,10 @@ def create_trip_for_my_trips_view(request):
         my_trips, created = MyTrips.objects.get_or_create(user=user)
         my_trips.trips.add(trip)
         
-        # Build image URL if image exists
-        image_url = get_image_url(request, trip.image)
+        # Resized copies are rendered in the background; until then the
+        # variant URLs are None
+        schedule_trip_image_variants(trip)
+        images = trip_image_urls(request, trip.image.name, trip.image_variants)
         
         return JsonResponse({
             "success": True,
@@ -770,7 +722,8 @@ def create_trip_for_my_trips_view(request):
                 "name": trip.name,
                 "location": trip.location,
                 "date": trip.date.isoformat() if trip.date else None,
-                "image": image_url,
+                "image": images.get(settings.TRIP_IMAGE_LIST_VARIANT) if images else None,
+                "images": images,
             },
             "message": "Trip created and added to My Trips successfully."
         })
@@ -787,54 +740,62 @@ def get_trip_view(request, trip_id):
     """Get detailed information about a specific trip"""
     user = request.user
     try:
-        trip = Trip.objects.get(id=trip_id, user=user)
-        
-        # Check if trip is in MyTrips (completed) or just in BucketList (not completed)
-        my_trips, _ = MyTrips.objects.get_or_create(user=user)
-        is_completed = my_trips.trips.filter(id=trip_id).exists()
-        
-        # Get image URL
-        image_url = get_image_url(request, trip.image)
-        
+        # One query for the trip, its BNB (which carries its rating totals) and
+        # whether the trip is in the user's MyTrips (completed); plans come in a second
+        completed = MyTrips.trips.through.objects.filter(mytrips__user=user, trip_id=OuterRef("pk"))
+        trip = (
+            Trip.objects.filter(id=trip_id, user=user)
+            .select_related("bnbs")
+            .annotate(is_completed=Exists(completed))
+            .prefetch_related(Prefetch("plans", queryset=Plan.objects.order_by("id")))
+            .get()
+        )
+        is_completed = trip.is_completed
+
+        # Get image URLs (the full-size derivative doubles as "image")
+        images = trip_image_urls(request, trip.image.name, trip.image_variants)
+
         # Get plans
-        plans = trip.plans.all()
         plans_data = [{
             "id": plan.id,
             "name": plan.name,
             "activity": plan.activity or "",
-        } for plan in plans]
-        
+        } for plan in trip.plans.all()]
+
         # Get BNB if exists
         bnb_data = None
         try:
             bnb = trip.bnbs
-            # Get ratings and reviews for this BNB (only if trip is completed)
-            ratings = bnb.ratings.all()
-            reviews = bnb.reviews.all()
-            
-            avg_rating = None
-            if ratings.exists():
-                avg_rating = sum(r.value for r in ratings) / ratings.count()
-            
-            ratings_data = [{"id": r.id, "value": r.value} for r in ratings]
-            reviews_data = [{
-                "id": rev.id,
-                "statement": rev.statement,
-                "rating_id": rev.rating.id if rev.rating else None,
-            } for rev in reviews]
-            
+        except BNB.DoesNotExist:
+            bnb = None
+        if bnb is not None:
+            ratings_data = []
+            reviews_data = []
+            # Ratings and reviews are only shown (and only loaded) once the trip is completed
+            if is_completed:
+                prefetch_related_objects(
+                    [bnb],
+                    Prefetch("ratings", queryset=Rating.objects.order_by("id")),
+                    Prefetch("reviews", queryset=Review.objects.order_by("id")),
+                )
+                ratings_data = [{"id": r.id, "value": r.value} for r in bnb.ratings.all()]
+                reviews_data = [{
+                    "id": rev.id,
+                    "statement": rev.statement,
+                    "rating_id": rev.rating_id,
+                } for rev in bnb.reviews.all()]
+
+            avg_rating = bnb.average_rating
             bnb_data = {
                 "id": bnb.id,
                 "name": bnb.name,
                 "address": bnb.address,
                 "availability": bnb.availability,
-                "average_rating": round(avg_rating, 1) if avg_rating else None,
-                "ratings": ratings_data if is_completed else [],  # Only show ratings if completed
-                "reviews": reviews_data if is_completed else [],  # Only show reviews if completed
+                "average_rating": round(avg_rating, 1) if avg_rating is not None else None,
+                "ratings": ratings_data,
+                "reviews": reviews_data,
             }
-        except BNB.DoesNotExist:
-            pass
-        
+
         return JsonResponse({
             "success": True,
             "trip": {
@@ -842,7 +803,8 @@ def get_trip_view(request, trip_id):
                 "name": trip.name,
                 "location": trip.location,
                 "date": trip.date.isoformat() if trip.date else None,
-                "image": image_url,
+                "image": images.get(settings.TRIP_IMAGE_DETAIL_VARIANT) if images else None,
+                "images": images,
                 "plans": plans_data,
                 "bnb": bnb_data,
                 "is_completed": is_completed,  # Flag to indicate if trip is completed
@@ -1018,7 +980,7 @@ def update_bnb_view(request, bnb_id):
         if "availability" in data:
             bnb.availability = data.get("availability")
         
-        bnb.save()
+        bnb.save(update_fields=["name", "address", "availability"])
         
         return JsonResponse({
             "success": True,
@@ -1060,10 +1022,12 @@ def create_rating_view(request, bnb_id):
         if not value or not (1 <= value <= 5):
             return JsonResponse({"error": "Rating must be between 1 and 5."}, status=400)
         
-        rating = Rating.objects.create(
-            bnb=bnb,
-            value=value
-        )
+        # the insert and the BNB's rating totals (post_save signal) commit together
+        with transaction.atomic():
+            rating = Rating.objects.create(
+                bnb=bnb,
+                value=value
+            )
         
         return JsonResponse({
             "success": True,
@@ -1134,13 +1098,146 @@ def create_review_view(request, bnb_id):
         }, status=500)
 
 
-import requests
-import pandas as pd
+from datetime import date, timedelta
+
+import numpy as np
+from django.utils import timezone
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from backend.ml.pipeline import predict_comfort
-from backend.ml.weather_utils import geocode_city
+from backend.ml.pipeline import predict_comfort_batch
+from backend.ml.model_store import ModelNotAvailableError
+from backend.ml.climatology import ClimatologyNotAvailableError, get_climatology
+from backend.ml.weather_utils import aggregate_hourly_to_daily
+from backend.ml.training.feature_engineering import build_feature_matrix, feature_records
+from .geocoding import cached_geocode_city
+from .destinations import cached_destinations_page
+from .forecast_cache import get_forecast, forecast_cache_stats
+
+# Open-Meteo parameters shared by the sync and async weather views
+CURRENT_WEATHER_PARAMS = {
+    "current": "temperature_2m,weather_code",
+    "timezone": "auto",
+}
+
+
+def comfort_forecast_params(start, end):
+    """Open-Meteo parameters for the comfort features over a date range."""
+    return {
+        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,"
+                 "wind_speed_10m_max,cloudcover_mean",
+        "hourly": "relativehumidity_2m",
+        "start_date": start,
+        "end_date": end,
+        "timezone": "auto",
+    }
+
+
+def current_weather_payload(city, api_resp):
+    current = api_resp["current"]
+    return {
+        "city": city,
+        "temperature": current.get("temperature_2m"),
+        "weather_code": current.get("weather_code"),
+        "unit": "°C"
+    }
+
+
+def comfort_features(api_resp, lat, lon):
+    """Turn a forecast response into the model feature matrix, one row per forecast day."""
+    daily = api_resp["daily"]
+    hourly = api_resp["hourly"]
+
+    # -----------------------------
+    # Daily max humidity from the hourly series in one grouped pass
+    # -----------------------------
+    hourly_daily = aggregate_hourly_to_daily(hourly, daily["time"], [("relativehumidity_2m", "max")])
+
+    # Safe fallback for days without hourly values
+    humidity_max = np.nan_to_num(hourly_daily[:, 0], nan=50.0)
+
+    # -----------------------------
+    # Build the whole matrix in one vectorized pass
+    # -----------------------------
+    return build_feature_matrix({
+        "date": daily["time"],
+        "temp_min": daily["temperature_2m_min"],
+        "temp_max": daily["temperature_2m_max"],
+        "precipitation": daily["precipitation_sum"],
+        "humidity_max": humidity_max,
+        "wind_max": daily["wind_speed_10m_max"],
+        "cloudcover": daily["cloudcover_mean"],
+        "lat": lat,
+        "lon": lon,
+    })
+
+
+def comfort_results(city, api_resp, X, scores):
+    return [{
+        "date": day,
+        "city": city,
+        "comfort_score": float(score),
+        "source": "forecast",
+        **features,
+    } for day, features, score in zip(api_resp["daily"]["time"], feature_records(X), scores)]
+
+
+def split_comfort_range(start, end):
+    """
+    Split an ISO date range at the end of the forecast horizon.
+
+    returns: (forecast_range, climatology_range), each a (start, end) pair of
+             ISO strings or None; raises ValueError for malformed dates and
+             ranges longer than COMFORT_MAX_RANGE_DAYS
+    """
+    start, end = date.fromisoformat(start), date.fromisoformat(end)
+    if end < start:
+        # left for the forecast API to interpret, as before
+        return (start.isoformat(), end.isoformat()), None
+    if (end - start).days + 1 > settings.COMFORT_MAX_RANGE_DAYS:
+        raise ValueError(f"at most {settings.COMFORT_MAX_RANGE_DAYS} days can be requested")
+
+    last_forecast_day = timezone.localdate() + timedelta(days=settings.FORECAST_HORIZON_DAYS - 1)
+    forecast_range = climatology_range = None
+    if start <= last_forecast_day:
+        forecast_range = (start.isoformat(), min(end, last_forecast_day).isoformat())
+    if end > last_forecast_day:
+        climatology_range = (max(start, last_forecast_day + timedelta(days=1)).isoformat(), end.isoformat())
+    return forecast_range, climatology_range
+
+
+def climatology_station(climatology, city, geo):
+    """
+    (row, distance_km) of the climatology station serving a city: its own
+    row when the name matches, else the nearest station to its geocoded
+    point within CLIMATOLOGY_MAX_STATION_KM; (None, None) when neither.
+    """
+    city_idx = climatology.city_index(city)
+    if city_idx is not None:
+        return city_idx, 0.0
+    if not geo:
+        return None, None
+    return climatology.nearest_station(
+        float(geo["lat"]), float(geo["lon"]), max_distance_km=settings.CLIMATOLOGY_MAX_STATION_KM
+    )
+
+
+def climatology_results(city, climatology, city_idx, start, end, distance_km=0.0):
+    """Historical comfort statistics for each day of a range beyond the forecast."""
+    days = np.arange(np.datetime64(start), np.datetime64(end) + 1)
+    return [{
+        "date": str(day),
+        "city": city,
+        "comfort_score": stats["mean"],
+        "source": "climatology",
+        "station": climatology.cities[city_idx],
+        "station_distance_km": round(distance_km, 1),
+        "comfort_p10": stats["p10"],
+        "comfort_p50": stats["p50"],
+        "comfort_p90": stats["p90"],
+        "rain_probability": stats["rain_probability"],
+    } for day, stats in zip(days, climatology.lookup(city_idx, days))]
+
 
 @api_view(["GET"])
 
@@ -1152,34 +1249,20 @@ def current_weather(request):
             return Response({"error": "City parameter required"}, status=400)
         
         # Geocode city to get lat/lon
-        geo = geocode_city(city)
+        geo = cached_geocode_city(city)
         if not geo:
             return Response({"error": f"Could not find city: {city}"}, status=404)
         
         lat = float(geo["lat"])
         lon = float(geo["lon"])
         
-        # Get current weather from Open-Meteo
-        url = (
-            "https://api.open-meteo.com/v1/forecast"
-            f"?latitude={lat}&longitude={lon}"
-            "&current=temperature_2m,weather_code"
-            "&timezone=auto"
-        )
-        
-        api_resp = requests.get(url).json()
+        # Get current weather from Open-Meteo (cached per rounded location)
+        api_resp = get_forecast(lat, lon, CURRENT_WEATHER_PARAMS, kind="current", required=("current",))
         
         if "current" not in api_resp:
             return Response({"error": "Weather fetch failed"}, status=500)
         
-        current = api_resp["current"]
-        
-        return Response({
-            "city": city,
-            "temperature": current.get("temperature_2m"),
-            "weather_code": current.get("weather_code"),
-            "unit": "°C"
-        })
+        return Response(current_weather_payload(city, api_resp))
     except Exception as e:
         return Response({"error": str(e)}, status=500)
 
@@ -1193,122 +1276,100 @@ def comfort_by_city(request):
         if not city or not start or not end:
             return Response({"error": "Missing required fields"}, status=400)
 
+        try:
+            forecast_range, climatology_range = split_comfort_range(start, end)
+        except ValueError as e:
+            return Response({"error": f"Invalid date range: {e}"}, status=400)
+
+        # -----------------------------
+        # 1. Days past the forecast horizon come from the climatology table
         # -----------------------------
-        # 1. Geocode City -> lat/lon
+        results, geo = [], None
+        if climatology_range:
+            climatology = get_climatology()
+            if climatology.city_index(city) is None:
+                # not a dataset city: fall back to the nearest station
+                geo = cached_geocode_city(city)
+            city_idx, distance_km = climatology_station(climatology, city, geo)
+            if city_idx is None:
+                return Response({"error": f"No climatology available for {city}"}, status=404)
+            results = climatology_results(city, climatology, city_idx, *climatology_range, distance_km)
+
+        if not forecast_range:
+            return Response({"results": results}, status=200)
+
+        # -----------------------------
+        # 2. Geocode City -> lat/lon
         # -----------------------------
-        geo = geocode_city(city)
+        geo = geo or cached_geocode_city(city)
         if not geo:
             return Response({"error": "Geocoding failed"}, status=500)
 
         lat = float(geo["lat"])
         lon = float(geo["lon"])
         # -----------------------------
-        # 2. Build Open-Meteo Forecast URL
+        # 3. Fetch Open-Meteo forecast (cached per rounded location + dates)
         # -----------------------------
-        url = (
-            "https://api.open-meteo.com/v1/forecast"
-            f"?latitude={lat}&longitude={lon}"
-            "&daily=temperature_2m_max,temperature_2m_min,precipitation_sum,"
-            "wind_speed_10m_max,cloudcover_mean"
-            "&hourly=relativehumidity_2m"
-            f"&start_date={start}&end_date={end}&timezone=auto"
-        )
-
-        api_resp = requests.get(url).json()
+        api_resp = get_forecast(lat, lon, comfort_forecast_params(*forecast_range),
+                                kind="daily", required=("daily", "hourly"))
 
         if "daily" not in api_resp or "hourly" not in api_resp:
             return Response({"error": "Weather fetch failed", "raw": api_resp}, status=500)
 
-        daily = api_resp["daily"]
-        hourly = api_resp["hourly"]
-
         # -----------------------------
-        # 3. Build hourly humidity DataFrame
+        # 4. Build the feature matrix (one row per day)
         # -----------------------------
-        hourly_df = pd.DataFrame({
-            "time": pd.to_datetime(hourly["time"]),
-            "humidity": hourly["relativehumidity_2m"],
-        })
-
-        results = []
+        X = comfort_features(api_resp, lat, lon)
 
         # -----------------------------
-        # 4. Loop over days and extract features
+        # 5. Predict comfort index for every day in one batch
         # -----------------------------
-        for i, date in enumerate(daily["time"]):
-            day = pd.to_datetime(date).date()
-
-            # Get hourly humidity for that day
-            mask = hourly_df["time"].dt.date == day
-            day_values = hourly_df.loc[mask, "humidity"]
-
-            # Safe fallback
-            humidity_max = float(day_values.max()) if not day_values.empty else 50.0
-
-            # Build feature row
-            row = {
-                "temp_min": daily["temperature_2m_min"][i],
-                "temp_max": daily["temperature_2m_max"][i],
-                "precipitation": daily["precipitation_sum"][i],
-                "humidity_max": humidity_max,
-                "wind_max": daily["wind_speed_10m_max"][i],
-                "cloudcover": daily["cloudcover_mean"][i],
-                "lat": lat,
-                "lon": lon,
-                "month": pd.to_datetime(date).month,
-            }
-
-            # -----------------------------
-            # 5. Predict comfort index
-            # -----------------------------
-            score = predict_comfort(row)
-
-            results.append({
-                "date": date,
-                "city": city,
-                "comfort_score": float(score),
-                **row,
-            })
+        scores = predict_comfort_batch(X)
 
         # -----------------------------
         # 6. Return results
         # -----------------------------
+        results = comfort_results(city, api_resp, X, scores) + results
         return Response({"results": results}, status=200)
 
+    except (ModelNotAvailableError, ClimatologyNotAvailableError) as e:
+        return Response({"error": str(e)}, status=503)
     except Exception as e:
         return Response({"error": str(e)}, status=500)
 
 
+### Forecast cache counters (staff only) ###
+@json_login_required
+def forecast_cache_stats_view(request):
+    """Hit/miss/staleness counters for this worker's forecast cache."""
+    if not request.user.is_staff:
+        return JsonResponse({"error": "Staff access required."}, status=403)
+    return JsonResponse({"success": True, "stats": forecast_cache_stats()})
+
+
 @api_view(["GET"])
 def destinations_view(request):
-    """Return saved destinations from the database.
+    """Return one page of saved destinations from the database.
 
     Optional query params:
     - `region` to filter by region
     - `category` to filter by category
+    - `q` to search name and description (every word must match)
+    - `cursor` (the previous page's `next_cursor`) and `limit` to page through results
     """
     try:
-        qs = Destination.objects.all()
-        region = request.GET.get('region')
-        category = request.GET.get('category')
-        if region:
-            qs = qs.filter(region__iexact=region)
-        if category:
-            qs = qs.filter(category__iexact=category)
-
-        results = []
-        for d in qs:
-            results.append({
-                'id': d.slug,
-                'name': d.name,
-                'image': d.image_url,
-                'price': d.price,
-                'category': d.category,
-                'region': d.region,
-                'link': d.link,
-                'description': d.description,
-            })
-
-        return Response({'results': results}, status=200)
+        cursor, limit = page_params(request, settings.DESTINATIONS_PAGE_SIZE, settings.DESTINATIONS_MAX_PAGE_SIZE)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=400)
+
+    try:
+        page = cached_destinations_page(
+            region=request.GET.get('region'),
+            category=request.GET.get('category'),
+            query=request.GET.get('q'),
+            cursor=cursor,
+            limit=limit,
+        )
+        return Response(page, status=200)
     except Exception as e:
         return Response({'error': str(e)}, status=500)
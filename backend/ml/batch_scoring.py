@@ -0,0 +1,86 @@
+"""
+Out-of-core, multi-process scoring of historical weather datasets.
+
+The input is streamed in partitions of at most chunk_rows rows, each
+partition is scored and date-parsed on a process pool, and results are
+written incrementally in input order. At most max_pending partitions are
+in flight at once, so peak memory is bounded by the chunk size rather
+than the dataset size, while throughput scales with the worker count.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from backend.ml.dataset_store import ColumnStoreWriter, iter_table_chunks
+from backend.ml.pipeline import add_comfort_scores, add_dates
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+def score_chunk(df):
+    """Comfort index + parsed date/month for one partition."""
+    return add_dates(add_comfort_scores(df))
+
+
+def iter_chunks(source, chunk_rows):
+    """Partitions of a CSV file or a columnar table directory."""
+    if os.path.isdir(source):
+        return iter_table_chunks(source, chunk_rows)
+    return pd.read_csv(source, chunksize=chunk_rows)
+
+
+def score_stream(chunks, func=score_chunk, workers=None, max_pending=None):
+    """
+    Apply func to every chunk on a process pool, yielding results in input order.
+
+    workers: pool size (default: CPU count); 1 scores inline without a pool
+    max_pending: chunks submitted but not yet yielded (default: 2 per worker)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.path = path
+        self.header = True
+
+    def append(self, df):
+        df.to_csv(self.path, mode="w" if self.header else "a", header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        if self.header:
+            open(self.path, "w").close()
+
+
+def score_dataset(source, output, chunk_rows=DEFAULT_CHUNK_ROWS, workers=None):
+    """
+    source: CSV path or columnar table directory
+    output: columnar table directory, or a path ending in .csv
+    returns: number of rows written
+    """
+    sink = _CsvSink(output) if output.endswith(".csv") else ColumnStoreWriter(output)
+    rows = 0
+    try:
+        for scored in score_stream(iter_chunks(source, chunk_rows), workers=workers):
+            sink.append(scored)
+            rows += len(scored)
+    finally:
+        sink.close()
+    return rows
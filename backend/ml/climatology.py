@@ -0,0 +1,189 @@
+"""
+Per-city, per-day-of-year comfort climatology.
+
+The historical dataset is scored once offline (training/build_climatology.py)
+and reduced to a small table of comfort statistics for every city and
+calendar day. Serving loads that table once and answers dates beyond the
+forecast horizon with array lookups, without any upstream call.
+
+Days are indexed on a leap-year calendar (0 = Jan 1, 59 = Feb 29,
+365 = Dec 31) so every calendar date has a stable slot.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from backend.ml.pipeline import add_comfort_scores
+from backend.ml.spatial_index import StationIndex
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "data"))
+CLIMATOLOGY_PATH = os.path.join(DATA_DIR, "comfort_climatology.npz")
+
+DAYS_PER_YEAR = 366
+STATS = ("mean", "p10", "p50", "p90", "rain_probability")
+PERCENTILES = (10, 50, 90)
+
+# First slot of each month on the leap-year calendar
+_MONTH_OFFSETS = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+
+class ClimatologyNotAvailableError(RuntimeError):
+    """Raised when the climatology artifact has not been built."""
+
+
+def day_of_year_index(dates):
+    """
+    dates: array-like of dates / ISO strings
+    returns: int array of leap-calendar day slots (0-365)
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    month_index = months.astype(int) % 12
+    day_of_month = (dates - months.astype("datetime64[D]")).astype(int)
+    return _MONTH_OFFSETS[month_index] + day_of_month
+
+
+def _grouped_percentiles(groups, values, n_groups, percentiles):
+    """Linear-interpolated percentiles of values within each group id."""
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    out = np.full((n_groups, len(percentiles)), np.nan)
+    has = counts > 0
+    for j, q in enumerate(percentiles):
+        pos = (counts[has] - 1) * (q / 100.0)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo + 1, counts[has] - 1)
+        frac = pos - lo
+        base = starts[has]
+        out[has, j] = values[base + lo] * (1 - frac) + values[base + hi] * frac
+    return out
+
+
+class Climatology:
+    """
+    cities: station names, in row order of the tables
+    lat, lon: station coordinates
+    stats: (n_cities, 366, len(STATS)) float32 table
+    samples: (n_cities, 366) number of historical days behind each cell
+    """
+
+    def __init__(self, cities, lat, lon, stats, samples):
+        self.cities = [str(c) for c in cities]
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.stats = np.asarray(stats, dtype=np.float32)
+        self.samples = np.asarray(samples, dtype=np.int32)
+        self._index = {name.casefold(): i for i, name in enumerate(self.cities)}
+        self.stations = StationIndex(self.cities, self.lat, self.lon)
+
+    def city_index(self, city):
+        """Row of a station by (case-insensitive) name, or None."""
+        return self._index.get(" ".join(str(city).split()).casefold())
+
+    def nearest_station(self, lat, lon, max_distance_km=None):
+        """(row, distance_km) of the closest station to a point, or (None, None)."""
+        matches = self.stations.nearest(lat, lon, k=1, max_distance_km=max_distance_km)
+        if not matches:
+            return None, None
+        return matches[0]["index"], matches[0]["distance_km"]
+
+    def lookup(self, city_idx, dates):
+        """
+        city_idx: row from city_index()
+        dates: dates to look up
+        returns: list of {stat: value} dicts, one per date
+        """
+        table = self.stats[city_idx, day_of_year_index(dates)]
+        return [
+            {name: (None if np.isnan(v) else float(v)) for name, v in zip(STATS, row)}
+            for row in table
+        ]
+
+    def save(self, path=CLIMATOLOGY_PATH):
+        np.savez_compressed(
+            path,
+            cities=np.array(self.cities, dtype=str),
+            lat=self.lat,
+            lon=self.lon,
+            stats=self.stats,
+            samples=self.samples,
+        )
+
+    @classmethod
+    def load(cls, path=CLIMATOLOGY_PATH):
+        with np.load(path) as data:
+            return cls(data["cities"].tolist(), data["lat"], data["lon"], data["stats"], data["samples"])
+
+
+def build_climatology(df, window=7, rain_threshold=1.0):
+    """
+    df: historical daily weather (date, city, lat, lon and the comfort inputs)
+    window: days on either side of each calendar day pooled into its statistics
+    rain_threshold: daily precipitation (mm) that counts as a rainy day
+    returns: Climatology
+    """
+    df = add_comfort_scores(df)
+    df = df[df["comfort_index"].notna()]
+
+    cities, city_codes = np.unique(df["city"].to_numpy(dtype=str), return_inverse=True)
+    coords = df.groupby(df["city"].astype(str))[["lat", "lon"]].first().loc[cities]
+
+    slots = day_of_year_index(pd.to_datetime(df["date"]).to_numpy())
+    scores = df["comfort_index"].to_numpy(dtype=np.float64)
+    rainy = (df["precipitation"].to_numpy(dtype=np.float64) >= rain_threshold).astype(np.float64)
+
+    # every observation contributes to the calendar days within +/- window of it
+    offsets = np.arange(-window, window + 1)
+    pooled_slots = (slots[:, None] + offsets) % DAYS_PER_YEAR
+    groups = (city_codes[:, None] * DAYS_PER_YEAR + pooled_slots).ravel()
+    pooled_scores = np.repeat(scores, len(offsets))
+    pooled_rain = np.repeat(rainy, len(offsets))
+
+    n_groups = len(cities) * DAYS_PER_YEAR
+    counts = np.bincount(groups, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(groups, weights=pooled_scores, minlength=n_groups) / counts
+        rain_probability = np.bincount(groups, weights=pooled_rain, minlength=n_groups) / counts
+
+    percentiles = _grouped_percentiles(groups, pooled_scores, n_groups, PERCENTILES)
+
+    stats = np.column_stack([mean, percentiles, rain_probability])
+    return Climatology(
+        cities,
+        coords["lat"].to_numpy(),
+        coords["lon"].to_numpy(),
+        stats.reshape(len(cities), DAYS_PER_YEAR, len(STATS)),
+        counts.reshape(len(cities), DAYS_PER_YEAR),
+    )
+
+
+_climatology = None
+_climatology_lock = threading.Lock()
+
+
+def get_climatology():
+    """Return the process-wide climatology table, loading it on first use."""
+    global _climatology
+    if _climatology is None:
+        with _climatology_lock:
+            if _climatology is None:
+                if not os.path.exists(CLIMATOLOGY_PATH):
+                    raise ClimatologyNotAvailableError(
+                        f"No climatology found at {CLIMATOLOGY_PATH}; "
+                        "run backend/ml/training/build_climatology.py"
+                    )
+                _climatology = Climatology.load(CLIMATOLOGY_PATH)
+    return _climatology
+
+
+def reset_climatology():
+    """Forget the loaded table so the next get_climatology() reloads from disk."""
+    global _climatology
+    with _climatology_lock:
+        _climatology = None
@@ -0,0 +1,269 @@
+"""
+Typed, columnar storage for the historical weather datasets.
+
+A table is a directory holding one raw binary file per column and a
+_schema.json describing each column's dtype (plus the category labels of
+categorical columns) and the row count. Reads memory-map only the
+requested columns, so loading is independent of how many other columns,
+cities or years the table holds, and pages are only touched when used.
+
+Column types:
+    float32 / int8 / int32 / bool  plain little-endian arrays
+    datetime64[D]                   native NumPy day dates
+    category                        int32 codes + labels kept in the schema
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "data"))
+SCHEMA_FILE = "_schema.json"
+
+# Named datasets: CSV source (if any) and columnar store, both in DATA_DIR
+DATASETS = {
+    "master": "historical_weather_master",
+    "scored": "historical_weather_scored",
+}
+
+# Storage types for the known weather columns; others are inferred
+WEATHER_SCHEMA = {
+    "date": "datetime64[D]",
+    "city": "category",
+    "temp_max": "float32",
+    "temp_min": "float32",
+    "precipitation": "float32",
+    "wind_max": "float32",
+    "humidity_max": "float32",
+    "cloudcover": "float32",
+    "lat": "float32",
+    "lon": "float32",
+    "comfort_index": "float32",
+    "month": "int8",
+}
+
+_CODE_DTYPE = np.dtype("<i4")
+
+
+def _storage_dtype(kind):
+    if kind == "category":
+        return _CODE_DTYPE
+    return np.dtype(kind).newbyteorder("<")
+
+
+def infer_schema(df, overrides=WEATHER_SCHEMA):
+    """Column -> storage type for a DataFrame, preferring the given overrides."""
+    schema = {}
+    for name, dtype in df.dtypes.items():
+        if name in overrides:
+            schema[name] = overrides[name]
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            schema[name] = "datetime64[D]"
+        elif pd.api.types.is_bool_dtype(dtype):
+            schema[name] = "bool"
+        elif pd.api.types.is_integer_dtype(dtype):
+            schema[name] = "int32"
+        elif pd.api.types.is_float_dtype(dtype):
+            schema[name] = "float32"
+        else:
+            schema[name] = "category"
+    return schema
+
+
+class ColumnStoreWriter:
+    """
+    Appends DataFrame chunks to a columnar table.
+
+    path: table directory (created if needed)
+    schema: column -> storage type; inferred from the first chunk if None
+    mode: "w" to start a new table, "a" to append (starting a new table if
+          none exists yet at path)
+    """
+
+    def __init__(self, path, schema=None, mode="w"):
+        self.path = path
+        self.rows = 0
+        self.categories = {}
+        self.schema = dict(schema) if schema else None
+
+        if mode not in ("w", "a"):
+            raise ValueError(f"Unsupported mode: {mode}")
+
+        os.makedirs(path, exist_ok=True)
+        if mode == "a" and os.path.exists(os.path.join(path, SCHEMA_FILE)):
+            existing = read_schema(path)
+            self.rows = existing["rows"]
+            self.schema = {name: col["type"] for name, col in existing["columns"].items()}
+            self.categories = {
+                name: {label: code for code, label in enumerate(col["categories"])}
+                for name, col in existing["columns"].items() if col["type"] == "category"
+            }
+            self._files = None
+        else:
+            # new table ("w", or "a" with nothing to append to): drop any
+            # leftover column files, e.g. from an interrupted write
+            for name in os.listdir(path):
+                if name.endswith(".bin") or name == SCHEMA_FILE:
+                    os.remove(os.path.join(path, name))
+            self._files = None
+
+    def _open(self):
+        if self._files is None:
+            self._files = {name: open(os.path.join(self.path, f"{name}.bin"), "ab") for name in self.schema}
+            for name, kind in self.schema.items():
+                if kind == "category":
+                    self.categories.setdefault(name, {})
+
+    def _encode(self, name, kind, values):
+        if kind == "category":
+            codes = self.categories[name]
+            labels = values.astype(str).to_numpy()
+            uniques, inverse = np.unique(labels, return_inverse=True)
+            lookup = np.array([codes.setdefault(label, len(codes)) for label in uniques], dtype=_CODE_DTYPE)
+            return lookup[inverse]
+        if kind == "datetime64[D]":
+            return pd.to_datetime(values).to_numpy().astype("datetime64[D]")
+        return values.to_numpy(dtype=_storage_dtype(kind))
+
+    def append(self, df):
+        """Write one chunk; columns must match the table's schema."""
+        if self.schema is None:
+            self.schema = infer_schema(df)
+        missing = set(self.schema) - set(df.columns)
+        if missing:
+            raise ValueError(f"Chunk is missing columns: {sorted(missing)}")
+
+        self._open()
+        for name, kind in self.schema.items():
+            data = np.ascontiguousarray(self._encode(name, kind, df[name]), dtype=_storage_dtype(kind))
+            self._files[name].write(data.tobytes())
+        self.rows += len(df)
+        self._write_schema()
+
+    def _write_schema(self):
+        columns = {}
+        for name, kind in self.schema.items():
+            columns[name] = {"type": kind, "file": f"{name}.bin"}
+            if kind == "category":
+                columns[name]["categories"] = list(self.categories.get(name, {}))
+
+        for f in (self._files or {}).values():
+            f.flush()
+        tmp = os.path.join(self.path, SCHEMA_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"rows": self.rows, "columns": columns}, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, SCHEMA_FILE))
+
+    def close(self):
+        if self.schema is not None:
+            self._open()
+            self._write_schema()
+        for f in (self._files or {}).values():
+            f.close()
+        self._files = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_table(df, path, schema=None):
+    """Write a whole DataFrame as a new columnar table."""
+    with ColumnStoreWriter(path, schema or infer_schema(df)) as writer:
+        writer.append(df)
+
+
+def read_schema(path):
+    with open(os.path.join(path, SCHEMA_FILE)) as f:
+        return json.load(f)
+
+
+def open_columns(path, columns=None):
+    """
+    Memory-map columns of a table without copying.
+
+    returns: {name: array}; categorical columns come back as their int32
+             codes (labels are in read_schema(path))
+    """
+    schema = read_schema(path)
+    names = columns if columns is not None else list(schema["columns"])
+
+    arrays = {}
+    for name in names:
+        if name not in schema["columns"]:
+            raise KeyError(f"Column {name!r} not in table {path}")
+        col = schema["columns"][name]
+        dtype = _storage_dtype(col["type"])
+        if schema["rows"] == 0:
+            arrays[name] = np.empty(0, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(os.path.join(path, col["file"]), dtype=dtype, mode="r", shape=(schema["rows"],))
+    return arrays
+
+
+def _frame(schema, arrays):
+    data = {}
+    for name, values in arrays.items():
+        col = schema["columns"][name]
+        if col["type"] == "category":
+            data[name] = pd.Categorical.from_codes(values, categories=col["categories"])
+        elif col["type"] == "datetime64[D]":
+            # pandas has no day resolution; seconds keeps 8 bytes per value
+            data[name] = values.astype("datetime64[s]")
+        else:
+            data[name] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def read_table(path, columns=None):
+    """Load selected columns of a table as a typed DataFrame."""
+    return _frame(read_schema(path), open_columns(path, columns))
+
+
+def iter_table_chunks(path, chunk_rows, columns=None):
+    """Yield consecutive row ranges of a table as DataFrames of at most chunk_rows rows."""
+    schema = read_schema(path)
+    arrays = open_columns(path, columns)
+    for start in range(0, schema["rows"], chunk_rows):
+        yield _frame(schema, {name: np.array(values[start:start + chunk_rows]) for name, values in arrays.items()})
+
+
+def convert_csv(csv_path, path, schema=None, chunksize=100_000):
+    """Stream a CSV into a columnar table without loading it whole."""
+    with ColumnStoreWriter(path, schema) as writer:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            writer.append(chunk)
+
+
+def dataset_path(name, data_dir=DATA_DIR):
+    """Columnar store directory of a named dataset."""
+    return os.path.join(data_dir, f"{DATASETS[name]}.cols")
+
+
+def ensure_dataset(name, data_dir=DATA_DIR):
+    """
+    Path of a named dataset's columnar store.
+
+    The store is (re)built from the dataset's CSV when it is missing or
+    older than the CSV, so existing CSV workflows keep working.
+    """
+    path = dataset_path(name, data_dir)
+    csv_path = os.path.join(data_dir, f"{DATASETS[name]}.csv")
+    schema_path = os.path.join(path, SCHEMA_FILE)
+
+    if os.path.exists(csv_path) and (
+        not os.path.exists(schema_path) or os.path.getmtime(csv_path) > os.path.getmtime(schema_path)
+    ):
+        convert_csv(csv_path, path)
+
+    if not os.path.exists(schema_path):
+        raise FileNotFoundError(f"No data for dataset {name!r} in {data_dir}")
+    return path
+
+
+def load_dataset(name, columns=None, data_dir=DATA_DIR):
+    """Load a named dataset (see ensure_dataset) as a typed DataFrame."""
+    return read_table(ensure_dataset(name, data_dir), columns)
@@ -0,0 +1,176 @@
+"""
+Versioned storage and lazy, thread-safe loading of the comfort model.
+
+Training writes the booster in XGBoost's native UBJSON format next to a
+metadata file (feature list, artifact checksum, training data hash).
+Serving loads it on first use through get_model(), so importing the ML
+package costs nothing and a missing model only fails the requests that
+actually need a prediction. The legacy joblib pickle is still accepted
+when no native artifact exists.
+
+Alongside the booster, training exports the flattened tree arrays used by
+backend.ml.tree_engine. Serving prefers those, so web workers never import
+xgboost; set COMFORT_MODEL_ENGINE=xgboost to load the booster instead.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend.ml.tree_engine import TreeEnsemble
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+MODELS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "models"))
+MODEL_BASENAME = "comfort_model"
+
+
+class ModelNotAvailableError(RuntimeError):
+    """Raised when no usable comfort model artifact can be loaded."""
+
+
+def model_paths(models_dir=MODELS_DIR):
+    """Paths of the native model, its tree export, metadata and the legacy pickle."""
+    return {
+        "native": os.path.join(models_dir, f"{MODEL_BASENAME}.ubj"),
+        "trees": os.path.join(models_dir, f"{MODEL_BASENAME}.trees.npz"),
+        "metadata": os.path.join(models_dir, f"{MODEL_BASENAME}.meta.json"),
+        "pickle": os.path.join(models_dir, f"{MODEL_BASENAME}.pkl"),
+    }
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def training_data_hash(X, y):
+    """Stable hash of the exact feature matrix and targets a model was fit on."""
+    digest = hashlib.sha256()
+    digest.update(",".join(XGBoostComfortScoreModel.FEATURES).encode())
+    digest.update(np.ascontiguousarray(X, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def save_model(xgb_model, data_hash, models_dir=MODELS_DIR, extra=None):
+    """
+    xgb_model: fitted XGBRegressor
+    data_hash: training_data_hash() of the data it was fit on
+    extra: optional additional metadata (e.g. metrics)
+    returns: the metadata dict that was written
+    """
+    import xgboost as xgb
+
+    os.makedirs(models_dir, exist_ok=True)
+    paths = model_paths(models_dir)
+    xgb_model.save_model(paths["native"])
+    TreeEnsemble.from_xgboost(xgb_model).save(paths["trees"])
+
+    metadata = {
+        "format": "xgboost-ubj",
+        "artifact": os.path.basename(paths["native"]),
+        "sha256": file_sha256(paths["native"]),
+        "trees_artifact": os.path.basename(paths["trees"]),
+        "trees_sha256": file_sha256(paths["trees"]),
+        "features": list(XGBoostComfortScoreModel.FEATURES),
+        "training_data_sha256": data_hash,
+        "xgboost_version": xgb.__version__,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if extra:
+        metadata.update(extra)
+
+    with open(paths["metadata"], "w") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+
+def read_metadata(models_dir=MODELS_DIR):
+    path = model_paths(models_dir)["metadata"]
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _verified_metadata(paths, kind, checksum_key):
+    """Metadata for an artifact after checking its checksum and feature list."""
+    metadata = read_metadata(os.path.dirname(paths[kind]))
+    if metadata is None:
+        raise ModelNotAvailableError(f"Model metadata missing: {paths['metadata']}")
+
+    if file_sha256(paths[kind]) != metadata.get(checksum_key):
+        raise ModelNotAvailableError(f"Checksum mismatch for {paths[kind]}")
+    if metadata["features"] != list(XGBoostComfortScoreModel.FEATURES):
+        raise ModelNotAvailableError(
+            f"Model was trained on {metadata['features']}, "
+            f"serving expects {XGBoostComfortScoreModel.FEATURES}"
+        )
+    return metadata
+
+
+def _load_trees(paths):
+    _verified_metadata(paths, "trees", "trees_sha256")
+    return TreeEnsemble.load(paths["trees"])
+
+
+def _load_native(paths):
+    import xgboost as xgb
+
+    _verified_metadata(paths, "native", "sha256")
+    model = xgb.XGBRegressor()
+    model.load_model(paths["native"])
+    return model
+
+
+def load_model(models_dir=MODELS_DIR, engine=None):
+    """
+    Load the NumPy tree export if present, else the native booster, else
+    the legacy pickle.
+
+    engine: "numpy" (default) or "xgboost" to skip the tree export;
+            falls back to the COMFORT_MODEL_ENGINE environment variable
+    """
+    paths = model_paths(models_dir)
+    engine = engine or os.environ.get("COMFORT_MODEL_ENGINE", "numpy")
+
+    if engine == "numpy" and os.path.exists(paths["trees"]):
+        return _load_trees(paths)
+
+    if os.path.exists(paths["native"]):
+        return _load_native(paths)
+
+    if os.path.exists(paths["pickle"]):
+        import joblib
+        return joblib.load(paths["pickle"])
+
+    raise ModelNotAvailableError(
+        f"No comfort model found in {models_dir}; run backend/ml/training/train_xgboost.py"
+    )
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_model():
+    """Return the process-wide comfort model, loading it on first use."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = load_model()
+    return _model
+
+
+def reset_model():
+    """Forget the loaded model so the next get_model() reloads from disk."""
+    global _model
+    with _model_lock:
+        _model = None
@@ -1,5 +1,5 @@
 import pandas as pd
-from backend.ml.utils import compute_comfort_index
+from backend.ml.utils import compute_comfort_index_frame
 
 def add_comfort_scores(data):
     """
@@ -13,7 +13,7 @@ def add_comfort_scores(data):
     else:
         df = data.copy()
 
-    df["comfort_index"] = df.apply(compute_comfort_index, axis=1)
+    df["comfort_index"] = compute_comfort_index_frame(df)
     return df
 
 def add_dates(data):
@@ -33,35 +33,38 @@ def add_dates(data):
     return df
 
 
-import pandas as pd
-from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
-import joblib
-import os
-
-# Load model once at import time
-MODEL_PATH = os.path.join(os.path.dirname(__file__), "models", "comfort_model.pkl")
-MODEL_PATH = os.path.normpath(MODEL_PATH)
-model = joblib.load(MODEL_PATH)
+import numpy as np
+from backend.ml.model_store import get_model
+from backend.ml.training.feature_engineering import (
+    build_feature_matrix, rows_to_columns, validate_feature_matrix,
+)
 
-def predict_comfort(input_row: dict) -> float:
-    df = pd.DataFrame([input_row])
+def _feature_matrix(rows) -> np.ndarray:
+    """
+    rows: list of feature dicts, or a 2D array already in
+          XGBoostComfortScoreModel.FEATURES column order
+    returns: float64 matrix of shape (n_rows, len(FEATURES))
+    """
+    if isinstance(rows, np.ndarray):
+        return validate_feature_matrix(rows)
+    if not rows:
+        return validate_feature_matrix(np.empty((0,)))
+    return build_feature_matrix(rows_to_columns(rows))
 
-    numeric_cols = [
-        "temp_min", "temp_max", "precipitation",
-        "humidity_max", "wind_max", "cloudcover",
-        "lat", "lon", "month"
-    ]
 
-    # convert first
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+def predict_comfort_batch(rows) -> np.ndarray:
+    """
+    rows: list of feature dicts, or a (n, len(FEATURES)) NumPy matrix
+          from feature_engineering.build_feature_matrix
+    returns: 1D float array of comfort predictions, one per row
+    """
+    X = _feature_matrix(rows)
+    if len(X) == 0:
+        return np.empty(0, dtype=np.float64)
 
-    df[numeric_cols] = df[numeric_cols].astype(float)
+    # one booster call for the whole batch (model is loaded on first use)
+    return np.asarray(get_model().predict(X), dtype=np.float64)
 
-    # check for NaNs
-    if df[numeric_cols].isnull().any().any():
-        raise ValueError(f"NaNs found in input: \n{df[numeric_cols]}")
 
-    X = df[XGBoostComfortScoreModel.FEATURES]
-    pred = model.predict(X)[0]
-    return float(pred)
+def predict_comfort(input_row: dict) -> float:
+    return float(predict_comfort_batch([input_row])[0])
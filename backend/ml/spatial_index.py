@@ -0,0 +1,89 @@
+"""
+Nearest-station lookups for arbitrary coordinates.
+
+Stations (the distinct locations in the historical dataset) are projected
+onto the unit sphere and indexed with a k-d tree, so straight-line (chord)
+distance ranks them exactly like great-circle distance and there is no
+wrap-around problem at the antimeridian or the poles. Queries run in
+microseconds and need no upstream call.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _unit_vectors(lat, lon):
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def _km_to_chord(km):
+    return 2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class StationIndex:
+    """
+    names: station names
+    lat, lon: station coordinates in degrees
+    """
+
+    def __init__(self, names, lat, lon):
+        self.names = [str(n) for n in names]
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self._tree = cKDTree(_unit_vectors(self.lat, self.lon))
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_frame(cls, df, name_col="city"):
+        """One station per distinct name in a dataset with lat/lon columns."""
+        stations = df.groupby(df[name_col].astype(str), sort=True)[["lat", "lon"]].first()
+        return cls(stations.index, stations["lat"], stations["lon"])
+
+    def _matches(self, idx, chord):
+        return [{
+            "index": int(i),
+            "name": self.names[i],
+            "lat": float(self.lat[i]),
+            "lon": float(self.lon[i]),
+            "distance_km": float(_chord_to_km(c)),
+        } for i, c in zip(idx, chord)]
+
+    def nearest(self, lat, lon, k=1, max_distance_km=None):
+        """
+        returns: up to k stations closest to (lat, lon), nearest first, as
+                 {"index", "name", "lat", "lon", "distance_km"} dicts
+        """
+        k = min(k, len(self))
+        if k == 0:
+            return []
+        bound = _km_to_chord(max_distance_km) if max_distance_km is not None else np.inf
+        chord, idx = self._tree.query(_unit_vectors([lat], [lon])[0], k=[*range(1, k + 1)],
+                                      distance_upper_bound=bound)
+        found = np.isfinite(chord)
+        return self._matches(idx[found], chord[found])
+
+    def within(self, lat, lon, radius_km):
+        """All stations within radius_km of (lat, lon), nearest first."""
+        point = _unit_vectors([lat], [lon])[0]
+        idx = np.asarray(self._tree.query_ball_point(point, _km_to_chord(radius_km)), dtype=int)
+        chord = np.linalg.norm(self._tree.data[idx] - point, axis=1)
+        order = np.argsort(chord, kind="stable")
+        return self._matches(idx[order], chord[order])
+
+    def save(self, path):
+        np.savez(path, names=np.array(self.names, dtype=str), lat=self.lat, lon=self.lon)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["names"].tolist(), data["lat"], data["lon"])
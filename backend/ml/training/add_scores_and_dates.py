@@ -5,30 +5,33 @@ import sys, os
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
 sys.path.append(PROJECT_ROOT)
 
-import pandas as pd
-from backend.ml.pipeline import add_comfort_scores, add_dates
+import argparse
+import time
+from backend.ml.batch_scoring import DEFAULT_CHUNK_ROWS, score_dataset
+from backend.ml.dataset_store import dataset_path, ensure_dataset
 
 
 
 def main():
-    """Load historical weather data, add comfort scores, and save the output."""
+    """Stream historical weather data through the scoring pool and save the output."""
 
-    base_dir = os.path.dirname(os.path.abspath(__file__))   
-    data_path = os.path.join(base_dir, "..", "data", "historical_weather_master.csv")
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--input", help="CSV file or columnar table (default: the master dataset)")
+    parser.add_argument("--output", help="columnar table, or a .csv path (default: the scored dataset)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="rows per partition; bounds peak memory")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: CPU count)")
+    args = parser.parse_args()
 
-    # Normalize path
-    data_path = os.path.normpath(data_path)
+    source = args.input or ensure_dataset("master")
+    output_path = args.output or dataset_path("scored")
 
-    print(f"Loading dataset from: {data_path}")
-    master_df = pd.read_csv(data_path)
+    print(f"Loading dataset from: {source}")
+    start = time.perf_counter()
+    rows = score_dataset(source, output_path, chunk_rows=args.chunk_rows, workers=args.workers)
+    elapsed = time.perf_counter() - start
 
-    scored_df = add_comfort_scores(master_df)
-    scored_df = add_dates(scored_df)
-    # Save output
-    output_path = os.path.join(base_dir, "..", "data", "historical_weather_scored.csv")
-    output_path = os.path.normpath(output_path)
-
-    scored_df.to_csv(output_path, index=False)
+    print(f"Scored {rows} rows in {elapsed:.2f}s")
     print(f"Saved comfort-scored dataset to: {output_path}")
 
 
@@ -0,0 +1,54 @@
+import sys, os
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+sys.path.append(PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+from backend.ml.utils import compute_comfort_index, compute_comfort_index_frame
+
+
+SIZES = [1_000, 10_000, 56_000, 250_000, 1_000_000]
+# row-wise apply gets slow quickly, so stop timing it past this size
+MAX_APPLY_ROWS = 250_000
+
+
+def best_of(fn, repeats):
+    """Return the fastest wall-clock time (seconds) over `repeats` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Time df.apply(compute_comfort_index) against the vectorized engine."""
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_path = os.path.normpath(os.path.join(base_dir, "..", "data", "historical_weather_master.csv"))
+
+    print(f"Loading dataset from: {data_path}")
+    master_df = pd.read_csv(data_path)
+
+    print(f"{'rows':>10} {'apply (s)':>12} {'vectorized (s)':>15} {'speedup':>9}")
+    for size in SIZES:
+        # tile the real data to reach the target size
+        reps = -(-size // len(master_df))
+        df = pd.concat([master_df] * reps, ignore_index=True).iloc[:size]
+
+        vec_time = best_of(lambda: compute_comfort_index_frame(df), repeats=5)
+
+        if size <= MAX_APPLY_ROWS:
+            apply_time = best_of(lambda: df.apply(compute_comfort_index, axis=1), repeats=1)
+            expected = df.apply(compute_comfort_index, axis=1).to_numpy(dtype=np.float64)
+            assert np.array_equal(compute_comfort_index_frame(df), expected)
+            print(f"{size:>10} {apply_time:>12.4f} {vec_time:>15.5f} {apply_time / vec_time:>8.0f}x")
+        else:
+            print(f"{size:>10} {'-':>12} {vec_time:>15.5f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
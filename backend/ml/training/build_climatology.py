@@ -0,0 +1,24 @@
+import sys, os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+sys.path.append(PROJECT_ROOT)
+
+from backend.ml.climatology import CLIMATOLOGY_PATH, build_climatology
+from backend.ml.dataset_store import dataset_path, load_dataset
+
+
+def main():
+    """Score the historical dataset and save the per-city day-of-year comfort climatology."""
+
+    print(f"Loading dataset from: {dataset_path('master')}")
+    master_df = load_dataset("master")
+
+    climatology = build_climatology(master_df)
+    climatology.save(CLIMATOLOGY_PATH)
+
+    print(f"Cities: {len(climatology.cities)}, min samples per day: {climatology.samples.min()}")
+    print(f"Saved comfort climatology to: {CLIMATOLOGY_PATH} ({os.path.getsize(CLIMATOLOGY_PATH)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import os
+import sys
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+# -------------------------------------------------------------------
+# Add project root so we can import backend.ml.*
+# -------------------------------------------------------------------
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+sys.path.append(PROJECT_ROOT)
+
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+from backend.ml.model_store import MODELS_DIR, MODEL_BASENAME, load_model, model_paths, read_metadata
+from backend.ml.dataset_store import ensure_dataset, open_columns, read_schema
+from backend.ml.training.feature_engineering import build_feature_matrix
+
+BATCH_SIZES = (1, 16, 256, 10_000)
+# comfort_by_city scores at most one forecast window (16 days) per request
+SLO_BATCH_SIZE = 16
+SLO_P99_MS = 25.0
+
+
+# -------------------------------------------------------------------
+# Data
+# -------------------------------------------------------------------
+def load_holdout(test_size=0.2, seed=42):
+    """
+    The validation rows train_xgboost.py held out (same split settings).
+
+    returns: X, y, city labels, months
+    """
+    store = ensure_dataset("scored")
+    features = XGBoostComfortScoreModel.FEATURES
+    columns = open_columns(store, features + ["comfort_index", "city"])
+    city_labels = np.array(read_schema(store)["columns"]["city"]["categories"])
+
+    # train_test_split shuffles by position only, so splitting the row
+    # indices reproduces the training script's split
+    _, idx = train_test_split(np.arange(len(columns["comfort_index"])), test_size=test_size, random_state=seed)
+    idx.sort()
+
+    X = build_feature_matrix({name: columns[name][idx] for name in features}, dtype=np.float32, allow_nan=True)
+    y = np.asarray(columns["comfort_index"][idx], dtype=np.float64)
+    cities = city_labels[columns["city"][idx]]
+    months = X[:, features.index("month")].astype(int)
+    return X, y, cities, months
+
+
+# -------------------------------------------------------------------
+# Accuracy
+# -------------------------------------------------------------------
+def error_metrics(y, pred):
+    err = np.asarray(pred, dtype=np.float64) - y
+    return {"rows": int(len(y)), "rmse": float(np.sqrt(np.mean(err ** 2))), "mae": float(np.mean(np.abs(err)))}
+
+
+def grouped_metrics(y, pred, groups):
+    """error_metrics for every distinct group label, in one pass per group column."""
+    labels, inverse = np.unique(groups, return_inverse=True)
+    err = np.asarray(pred, dtype=np.float64) - y
+    counts = np.bincount(inverse, minlength=len(labels))
+    sq = np.bincount(inverse, weights=err ** 2, minlength=len(labels))
+    ab = np.bincount(inverse, weights=np.abs(err), minlength=len(labels))
+    return {
+        str(label): {"rows": int(n), "rmse": float(np.sqrt(s / n)), "mae": float(a / n)}
+        for label, n, s, a in zip(labels, counts, sq, ab)
+    }
+
+
+# -------------------------------------------------------------------
+# Latency / resources
+# -------------------------------------------------------------------
+def measure_latency(model, X, batch_sizes=BATCH_SIZES, min_calls=30, budget_s=2.0):
+    """
+    Per-call predict() latency percentiles (ms) for each batch size.
+
+    Each batch size gets at least min_calls timed calls, and more while
+    its time budget lasts (up to 1000), after one untimed warm-up call.
+    """
+    results = {}
+    for size in batch_sizes:
+        reps = -(-size // len(X))
+        batch = np.ascontiguousarray(np.tile(X, (reps, 1))[:size])
+        model.predict(batch)
+
+        timings = []
+        deadline = time.perf_counter() + budget_s
+        while len(timings) < min_calls or (time.perf_counter() < deadline and len(timings) < 1000):
+            start = time.perf_counter()
+            model.predict(batch)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+        results[str(size)] = {
+            "calls": len(timings),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "rows_per_s": float(size / (p50 / 1000)) if p50 else None,
+        }
+    return results
+
+
+def resident_memory_bytes():
+    """Current RSS of this process, or None where it can't be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def artifact_sizes(models_dir):
+    return {
+        kind: os.path.getsize(path)
+        for kind, path in model_paths(models_dir).items()
+        if kind != "metadata" and os.path.exists(path)
+    }
+
+
+# -------------------------------------------------------------------
+# SLO gate
+# -------------------------------------------------------------------
+def check_slo(report, batch_size=SLO_BATCH_SIZE, p99_ms=SLO_P99_MS, max_rmse=None):
+    """Pass/fail checks a model must meet before it can serve comfort_by_city."""
+    checks = []
+    latency = report["latency"].get(str(batch_size))
+    if latency is None:
+        checks.append({"check": f"p99 latency at batch {batch_size}", "passed": False, "detail": "not measured"})
+    else:
+        checks.append({
+            "check": f"p99 latency at batch {batch_size}",
+            "passed": latency["p99_ms"] <= p99_ms,
+            "value": latency["p99_ms"],
+            "limit": p99_ms,
+        })
+    if max_rmse is not None:
+        rmse = report["accuracy"]["overall"]["rmse"]
+        checks.append({"check": "holdout RMSE", "passed": rmse <= max_rmse, "value": rmse, "limit": max_rmse})
+    return {"passed": all(c["passed"] for c in checks), "checks": checks}
+
+
+# -------------------------------------------------------------------
+# CLI
+# -------------------------------------------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate accuracy and inference cost of the comfort model.")
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    parser.add_argument("--engine", choices=["numpy", "xgboost"], default="numpy",
+                        help="serving engine to evaluate (see model_store.load_model)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(BATCH_SIZES))
+    parser.add_argument("--slo-batch-size", type=int, default=SLO_BATCH_SIZE)
+    parser.add_argument("--slo-p99-ms", type=float, default=SLO_P99_MS)
+    parser.add_argument("--max-rmse", type=float, help="also fail the gate above this holdout RMSE")
+    parser.add_argument("--report", help=f"JSON report path (default: <models-dir>/{MODEL_BASENAME}.eval.json)")
+    return parser.parse_args(argv)
+
+
+def evaluate(models_dir=MODELS_DIR, engine="numpy", batch_sizes=BATCH_SIZES):
+    """Build the evaluation report for the model in models_dir."""
+    X, y, cities, months = load_holdout()
+
+    rss_before = resident_memory_bytes()
+    start = time.perf_counter()
+    model = load_model(models_dir, engine=engine)
+    load_seconds = time.perf_counter() - start
+    rss_after = resident_memory_bytes()
+
+    pred = model.predict(X)
+    metadata = read_metadata(models_dir) or {}
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "engine": engine,
+        "model_class": type(model).__name__,
+        "model_sha256": metadata.get("sha256"),
+        "accuracy": {
+            "overall": error_metrics(y, pred),
+            "by_city": grouped_metrics(y, pred, cities),
+            "by_month": grouped_metrics(y, pred, months),
+        },
+        "latency": measure_latency(model, X, batch_sizes),
+        "resources": {
+            "load_seconds": load_seconds,
+            "artifact_bytes": artifact_sizes(models_dir),
+            "rss_bytes": rss_after,
+            "model_rss_bytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        },
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    report = evaluate(args.models_dir, args.engine, args.batch_sizes)
+    report["slo"] = check_slo(report, args.slo_batch_size, args.slo_p99_ms, args.max_rmse)
+
+    report_path = args.report or os.path.join(args.models_dir, f"{MODEL_BASENAME}.eval.json")
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    overall = report["accuracy"]["overall"]
+    print(f"Holdout RMSE: {overall['rmse']:.3f}  MAE: {overall['mae']:.3f}  ({overall['rows']} rows)")
+    for size, stats in report["latency"].items():
+        print(f"batch {size:>6}: p50 {stats['p50_ms']:.3f} ms  p95 {stats['p95_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms")
+    print(f"Load time: {report['resources']['load_seconds']:.3f}s")
+    for check in report["slo"]["checks"]:
+        print(f"[{'PASS' if check['passed'] else 'FAIL'}] {check['check']}")
+    print(f"Report written to: {report_path}")
+
+    return 0 if report["slo"]["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
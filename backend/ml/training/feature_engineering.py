@@ -0,0 +1,123 @@
+"""
+Feature construction shared by training and serving.
+
+build_feature_matrix() turns raw daily weather columns into the
+XGBoostComfortScoreModel.FEATURES matrix in one vectorized pass: every
+column is converted and type-checked as a whole array, derived features
+are computed from whole columns, and rows with missing values are
+reported together. Serving and training call the same function, so a
+new derived feature only has to be added to DERIVED_FEATURES.
+
+Only NumPy is imported here; it is safe to use from the web tier.
+"""
+import numpy as np
+
+from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+
+FEATURES = XGBoostComfortScoreModel.FEATURES
+
+# Features that are whole numbers when echoed back in API responses
+INTEGER_FEATURES = frozenset({"month"})
+
+
+def month_of(dates):
+    """Calendar month (1-12) of datetime64 values or ISO date strings."""
+    months = np.asarray(dates, dtype="datetime64[M]")
+    return months.astype(np.int64) % 12 + 1
+
+
+# Features computed from other raw columns when not supplied directly:
+# name -> (input columns, vectorized function of those columns)
+DERIVED_FEATURES = {
+    "month": (("date",), lambda columns: month_of(columns["date"])),
+}
+
+
+def _feature_column(columns, name):
+    if name in columns:
+        return columns[name]
+    if name in DERIVED_FEATURES:
+        inputs, derive = DERIVED_FEATURES[name]
+        missing = [col for col in inputs if col not in columns]
+        if not missing:
+            return derive(columns)
+        raise ValueError(f"Feature {name!r} needs input columns {missing}")
+    raise ValueError(f"Missing feature column {name!r}")
+
+
+def nan_rows_error(X, allow_nan=False):
+    """Raise one ValueError naming every row (and feature) with a NaN."""
+    if allow_nan:
+        return
+    nan_mask = np.isnan(X)
+    bad_rows = np.flatnonzero(nan_mask.any(axis=1))
+    if bad_rows.size:
+        bad_features = [FEATURES[j] for j in np.flatnonzero(nan_mask[bad_rows].any(axis=0))]
+        raise ValueError(f"NaNs found in input rows {bad_rows.tolist()} (features {bad_features}): \n{X[bad_rows]}")
+
+
+def build_feature_matrix(columns, dtype=np.float64, allow_nan=False):
+    """
+    columns: mapping of raw daily weather columns (arrays or lists); scalars
+             such as a single location's lat/lon are broadcast to every row,
+             and None becomes NaN
+    dtype: matrix dtype (float64 for serving, float32 for training)
+    allow_nan: keep NaNs (XGBoost treats them as missing) instead of raising
+    returns: (n, len(FEATURES)) matrix in FEATURES column order
+    """
+    values = {}
+    for name in FEATURES:
+        column = _feature_column(columns, name)
+        try:
+            values[name] = np.asarray(column, dtype=dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Non-numeric value in comfort input column {name!r}: {e}")
+
+    lengths = {v.shape[0] for v in values.values() if v.ndim == 1}
+    if len(lengths) > 1:
+        raise ValueError(f"Feature columns have different lengths: {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+
+    X = np.empty((n, len(FEATURES)), dtype=dtype)
+    for j, name in enumerate(FEATURES):
+        if values[name].ndim > 1:
+            raise ValueError(f"Feature column {name!r} must be 1D, got shape {values[name].shape}")
+        X[:, j] = values[name]
+
+    nan_rows_error(X, allow_nan)
+    return X
+
+
+def validate_feature_matrix(X, dtype=np.float64, allow_nan=False):
+    """Check a prebuilt matrix is (n, len(FEATURES)) and numeric."""
+    try:
+        X = np.asarray(X, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Non-numeric value in comfort input: {e}")
+
+    if X.ndim == 1 and X.size == 0:
+        X = X.reshape(0, len(FEATURES))
+    if X.ndim != 2 or X.shape[1] != len(FEATURES):
+        raise ValueError(f"Expected input of shape (n, {len(FEATURES)}) in {FEATURES}, got {X.shape}")
+
+    nan_rows_error(X, allow_nan)
+    return X
+
+
+def rows_to_columns(rows):
+    """
+    Column mapping for a list of per-day feature dicts. A key present in
+    any row becomes a column (None where a row lacks it); keys in no row
+    are left out so derived features can be computed instead.
+    """
+    wanted = set(FEATURES).union(*(inputs for inputs, _ in DERIVED_FEATURES.values()))
+    present = {name for row in rows for name in row.keys() & wanted}
+    return {name: [row.get(name) for row in rows] for name in present}
+
+
+def feature_records(X):
+    """One {feature: value} dict per matrix row, for JSON responses."""
+    return [
+        {name: int(v) if name in INTEGER_FEATURES else v for name, v in zip(FEATURES, row)}
+        for row in X.tolist()
+    ]
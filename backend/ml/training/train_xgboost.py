@@ -1,5 +1,12 @@
 import os
 import sys
+import argparse
+import hashlib
+import json
+import shutil
+import time
+from contextlib import contextmanager
+
 import pandas as pd
 import numpy as np
 from sklearn.metrics import mean_squared_error
@@ -14,61 +21,197 @@ sys.path.append(PROJECT_ROOT)
 
 # Now imports from backend work
 from backend.ml.xgboost_comfort_score import XGBoostComfortScoreModel
+from backend.ml.model_store import MODELS_DIR, model_paths, save_model, training_data_hash
+from backend.ml.dataset_store import DATA_DIR, ensure_dataset, open_columns, read_schema
+from backend.ml.training.feature_engineering import build_feature_matrix
 
-# -------------------------------------------------------------------
-# Load Dataset
-# -------------------------------------------------------------------
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_PATH = os.path.join(BASE_DIR, "..", "data", "historical_weather_scored.csv")
-DATA_PATH = os.path.normpath(DATA_PATH)
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+TARGET = "comfort_index"
+SPLIT_FILES = ("X_train", "X_val", "y_train", "y_val")
+
 
-df = pd.read_csv(DATA_PATH)
+@contextmanager
+def stage(name, timings):
+    """Time a block and print its wall-clock duration."""
+    start = time.perf_counter()
+    yield
+    timings[name] = time.perf_counter() - start
+    print(f"[{name}] {timings[name]:.2f}s")
 
-# Ensure date is parsed
-df["date"] = pd.to_datetime(df["date"])
-df["month"] = df["date"].dt.month
 
 # -------------------------------------------------------------------
-# Prepare features
+# Load Dataset (cached train/validation matrices)
 # -------------------------------------------------------------------
-features = XGBoostComfortScoreModel.FEATURES
-X = df[features]
-y = df["comfort_index"]
+def _matrix_cache_key(store, test_size, seed):
+    """Changes whenever the scored data, the feature list or the split does."""
+    schema = read_schema(store)
+    files = []
+    for name in XGBoostComfortScoreModel.FEATURES + [TARGET]:
+        stat = os.stat(os.path.join(store, schema["columns"][name]["file"]))
+        files.append([name, stat.st_size, stat.st_mtime_ns])
 
-# Train/validation split
-X_train, X_val, y_train, y_val = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
+    payload = json.dumps({"files": files, "test_size": test_size, "seed": seed})
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
-# -------------------------------------------------------------------
-# Train Model
-# -------------------------------------------------------------------
-model_def = XGBoostComfortScoreModel()
-xgb_model = model_def.xgb_model
 
-xgb_model.fit(
-    X_train, y_train,
-    eval_set=[(X_val, y_val)],
-    verbose=False
-)
+def load_training_matrix(test_size=0.2, seed=42, cache_dir=CACHE_DIR, use_cache=True):
+    """
+    returns: X_train, X_val, y_train, y_val as float32 arrays
+
+    The split is saved as .npy files keyed by the scored data and split
+    settings, so later runs memory-map it instead of rebuilding it.
+    """
+    store = ensure_dataset("scored")
+    cache_path = os.path.join(cache_dir, _matrix_cache_key(store, test_size, seed))
 
-best = xgb_model.best_iteration + 1
+    if use_cache and os.path.isdir(cache_path):
+        print(f"Using cached training matrix: {cache_path}")
+        return tuple(np.load(os.path.join(cache_path, f"{name}.npy"), mmap_mode="r") for name in SPLIT_FILES)
 
-y_train_pred = xgb_model.predict(X_train, iteration_range=(0, best))
-y_val_pred   = xgb_model.predict(X_val,   iteration_range=(0, best))
+    # Only the model inputs and target are mapped in from the columnar store
+    # (run add_scores_and_dates.py first); XGBoost treats NaNs as missing
+    columns = open_columns(store, XGBoostComfortScoreModel.FEATURES + [TARGET])
+    X = build_feature_matrix(columns, dtype=np.float32, allow_nan=True)
+    y = np.asarray(columns[TARGET], dtype=np.float32)
 
-train_rmse = np.sqrt(mean_squared_error(y_train, y_train_pred))
-val_rmse   = np.sqrt(mean_squared_error(y_val,   y_val_pred))
+    split = train_test_split(X, y, test_size=test_size, random_state=seed)
+
+    if use_cache:
+        tmp_path = cache_path + ".tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        for name, array in zip(SPLIT_FILES, split):
+            np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+        os.replace(tmp_path, cache_path)
+        print(f"Cached training matrix: {cache_path}")
+
+    return tuple(split)
+
+
+def _frame(X):
+    # column names travel with the booster, so the feature order is checked at predict time
+    return pd.DataFrame(X, columns=XGBoostComfortScoreModel.FEATURES, copy=False)
 
-print(f"\nBest trees: {best}")
-print(f"Train RMSE: {train_rmse:.2f}")
-print(f"Valid RMSE: {val_rmse:.2f}")
 
 # -------------------------------------------------------------------
-# Save model
+# CLI
 # -------------------------------------------------------------------
-MODEL_PATH = os.path.join(BASE_DIR, "..", "models", "comfort_model.pkl")
-MODEL_PATH = os.path.normpath(MODEL_PATH)
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Train the comfort score model.")
+    parser.add_argument("--n-estimators", type=int, help="maximum boosting rounds")
+    parser.add_argument("--learning-rate", type=float)
+    parser.add_argument("--max-depth", type=int)
+    parser.add_argument("--tree-method", choices=["hist", "approx", "exact"],
+                        help="split finding; hist (default) is the fast histogram method")
+    parser.add_argument("--max-bin", type=int, help="histogram buckets per feature (hist/approx)")
+    parser.add_argument("--threads", type=int, help="training threads (default: all cores)")
+    parser.add_argument("--early-stopping-rounds", type=int, help="0 disables early stopping")
+    parser.add_argument("--warm-start", nargs="?", const=model_paths()["native"], metavar="MODEL",
+                        help="continue boosting from a saved native model (default: the current one)")
+    parser.add_argument("--no-cache", action="store_true", help="rebuild the training matrix and don't cache it")
+    parser.add_argument("--output-dir", default=MODELS_DIR, help="where the model artifacts are written")
+    return parser.parse_args(argv)
+
+
+def model_overrides(args):
+    """Hyperparameters given on the command line, in XGBoostComfortScoreModel terms."""
+    overrides = {
+        "n_estimators": args.n_estimators,
+        "learning_rate": args.learning_rate,
+        "max_depth": args.max_depth,
+        "tree_method": args.tree_method,
+        "max_bin": args.max_bin,
+        "n_jobs": args.threads,
+    }
+    overrides = {k: v for k, v in overrides.items() if v is not None}
+    if args.early_stopping_rounds is not None:
+        overrides["early_stopping_rounds"] = args.early_stopping_rounds or None
+    return overrides
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    timings = {}
+
+    with stage("load", timings):
+        X_train, X_val, y_train, y_val = load_training_matrix(use_cache=not args.no_cache)
+    print(f"Training rows: {len(X_train)}, validation rows: {len(X_val)}")
+
+    # -------------------------------------------------------------------
+    # Train Model
+    # -------------------------------------------------------------------
+    model_def = XGBoostComfortScoreModel(**model_overrides(args))
+    xgb_model = model_def.xgb_model
+
+    start_rounds = 0
+    if args.warm_start:
+        import xgboost as xgb
+        start_rounds = xgb.Booster(model_file=args.warm_start).num_boosted_rounds()
+        print(f"Warm start from {args.warm_start} ({start_rounds} trees)")
+
+    with stage("train", timings):
+        xgb_model.fit(
+            _frame(X_train), y_train,
+            eval_set=[(_frame(X_val), y_val)],
+            xgb_model=args.warm_start,
+            verbose=False
+        )
+
+    trees_built = xgb_model.get_booster().num_boosted_rounds() - start_rounds
+    trees_per_second = trees_built / timings["train"] if timings["train"] else float("inf")
+    print(f"Trees built: {trees_built} ({trees_per_second:.0f} trees/s)")
+
+    # -------------------------------------------------------------------
+    # Evaluate
+    # -------------------------------------------------------------------
+    with stage("evaluate", timings):
+        if model_def.params["early_stopping_rounds"]:
+            best = xgb_model.best_iteration + 1
+        else:
+            best = xgb_model.get_booster().num_boosted_rounds()
+
+        y_train_pred = xgb_model.predict(_frame(X_train), iteration_range=(0, best))
+        y_val_pred   = xgb_model.predict(_frame(X_val),   iteration_range=(0, best))
+
+        train_rmse = float(np.sqrt(mean_squared_error(y_train, y_train_pred)))
+        val_rmse   = float(np.sqrt(mean_squared_error(y_val,   y_val_pred)))
+
+    print(f"\nBest trees: {best}")
+    print(f"Train RMSE: {train_rmse:.2f}")
+    print(f"Valid RMSE: {val_rmse:.2f}")
+
+    # -------------------------------------------------------------------
+    # Save model
+    # -------------------------------------------------------------------
+    with stage("save", timings):
+        os.makedirs(args.output_dir, exist_ok=True)
+        pickle_path = model_paths(args.output_dir)["pickle"]
+        joblib.dump(xgb_model, pickle_path)
+
+        # Native XGBoost format + metadata (preferred by the serving loader)
+        metadata = save_model(
+            xgb_model,
+            training_data_hash(X_train, y_train),
+            models_dir=args.output_dir,
+            extra={
+                "best_iteration": best,
+                "train_rmse": train_rmse,
+                "val_rmse": val_rmse,
+                "params": dict(model_def.params),
+                "warm_start_trees": start_rounds,
+                "trees_per_second": trees_per_second,
+                "timings": timings.copy(),
+            },
+        )
+
+    print(f"\nModel saved to: {pickle_path}")
+    print(f"Native model saved to: {metadata['artifact']} (sha256 {metadata['sha256'][:12]})")
+    print(f"NumPy tree export saved to: {metadata['trees_artifact']} (sha256 {metadata['trees_sha256'][:12]})")
+    print("Timings: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+          + f", total {sum(timings.values()):.2f}s")
+    return metadata
+
 
-joblib.dump(xgb_model, MODEL_PATH)
-print(f"\nModel saved to: {MODEL_PATH}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Pure-NumPy inference engine for the comfort booster.
+
+The exporter flattens every tree of a trained XGBoost regressor into
+fixed-shape arrays using an implicit heap layout: node i's children are
+2i+1 and 2i+2, so no child pointers need to be stored or chased. Trees
+shallower than the deepest one are padded with pass-through nodes that
+always go left, which lets the predictor walk all trees for a whole
+batch one level at a time with a handful of vectorized gathers.
+
+Loading and predicting only need NumPy, so the web tier can serve the
+model without importing xgboost.
+"""
+import json
+
+import numpy as np
+
+# Upper bound on rows x trees evaluated at once, to cap scratch memory
+_CHUNK_ELEMENTS = 1 << 15
+
+
+def _parse_base_score(raw):
+    """base_score is stored as '5.3E1' or, since xgboost 3, as '[5.3E1]'."""
+    return float(str(raw).strip("[]").split(",")[0])
+
+
+class TreeEnsemble:
+    """
+    feature: (n_trees, 2**depth - 1) split feature index per internal node
+    threshold: (n_trees, 2**depth - 1) float32 split value (go left if x < threshold)
+    default_left: (n_trees, 2**depth - 1) direction taken for missing values
+    leaf_value: (n_trees, 2**depth) float32 leaf outputs
+    base_score: global bias added to every prediction
+    """
+
+    def __init__(self, feature, threshold, default_left, leaf_value, base_score, feature_names=None):
+        self.feature = np.ascontiguousarray(feature, dtype=np.int32)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float32)
+        self.default_left = np.ascontiguousarray(default_left, dtype=bool)
+        self.leaf_value = np.ascontiguousarray(leaf_value, dtype=np.float32)
+        self.base_score = float(base_score)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+
+        self.n_trees, n_internal = self.feature.shape
+        self.depth = int(np.log2(n_internal + 1))
+
+    # ---------------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_model_json(cls, model_json, n_trees=None):
+        """
+        model_json: decoded XGBoost JSON model (booster.save_raw("json"))
+        n_trees: only keep the first n trees (e.g. best_iteration + 1)
+        """
+        learner = model_json["learner"]
+        objective = learner["objective"]["name"]
+        if objective != "reg:squarederror":
+            raise ValueError(f"Unsupported objective for the NumPy engine: {objective}")
+
+        model = learner["gradient_booster"]["model"]
+        if int(model["gbtree_model_param"].get("num_parallel_tree", "1")) != 1:
+            raise ValueError("Forests (num_parallel_tree > 1) are not supported")
+
+        trees = model["trees"][:n_trees] if n_trees else model["trees"]
+
+        def node_depths(tree):
+            depths = [0] * len(tree["left_children"])
+            for node, left in enumerate(tree["left_children"]):
+                if left != -1:
+                    depths[left] = depths[node] + 1
+                    depths[tree["right_children"][node]] = depths[node] + 1
+            return depths
+
+        depth = max(max(node_depths(t)) for t in trees) if trees else 0
+        depth = max(depth, 1)
+        n_internal, n_leaves = 2 ** depth - 1, 2 ** depth
+
+        feature = np.zeros((len(trees), n_internal), dtype=np.int32)
+        # +inf with default-left makes padding nodes send every row left
+        threshold = np.full((len(trees), n_internal), np.inf, dtype=np.float32)
+        default_left = np.ones((len(trees), n_internal), dtype=bool)
+        leaf_value = np.zeros((len(trees), n_leaves), dtype=np.float32)
+
+        for t, tree in enumerate(trees):
+            left, right = tree["left_children"], tree["right_children"]
+            # walk the tree, mapping xgboost node ids onto heap positions
+            stack = [(0, 0, 0)]  # (xgboost node id, heap position, level)
+            while stack:
+                node, pos, level = stack.pop()
+                if left[node] == -1:
+                    # leaf above the bottom level: every heap leaf below it gets its value
+                    span = 2 ** (depth - level)
+                    first_leaf = pos * span + (span - 1) - n_internal
+                    leaf_value[t, first_leaf:first_leaf + span] = tree["split_conditions"][node]
+                    continue
+                feature[t, pos] = tree["split_indices"][node]
+                threshold[t, pos] = tree["split_conditions"][node]
+                default_left[t, pos] = bool(tree["default_left"][node])
+                stack.append((left[node], 2 * pos + 1, level + 1))
+                stack.append((right[node], 2 * pos + 2, level + 1))
+
+        base_score = _parse_base_score(learner["learner_model_param"]["base_score"])
+        return cls(feature, threshold, default_left, leaf_value, base_score, learner.get("feature_names"))
+
+    @classmethod
+    def from_xgboost(cls, xgb_model):
+        """Export a fitted XGBRegressor (or Booster), honouring early stopping."""
+        booster = xgb_model.get_booster() if hasattr(xgb_model, "get_booster") else xgb_model
+        model_json = json.loads(booster.save_raw("json"))
+
+        best = booster.attr("best_iteration")
+        n_trees = int(best) + 1 if best is not None else None
+        return cls.from_model_json(model_json, n_trees=n_trees)
+
+    # ---------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------
+    def save(self, path):
+        np.savez(
+            path,
+            feature=self.feature,
+            threshold=self.threshold,
+            default_left=self.default_left,
+            leaf_value=self.leaf_value,
+            base_score=np.float64(self.base_score),
+            feature_names=np.array(self.feature_names or [], dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            names = data["feature_names"].tolist() or None
+            return cls(
+                data["feature"], data["threshold"], data["default_left"],
+                data["leaf_value"], data["base_score"], names,
+            )
+
+    # ---------------------------------------------------------------
+    # Inference
+    # ---------------------------------------------------------------
+    def _predict_chunk(self, X):
+        n = len(X)
+        n_internal = self.feature.shape[1]
+        # flat offsets of each tree's internal nodes / leaves
+        node_base = np.arange(self.n_trees, dtype=np.intp) * n_internal
+        leaf_base = np.arange(self.n_trees, dtype=np.intp) * (n_internal + 1)
+
+        feature = self.feature.ravel()
+        threshold = self.threshold.ravel()
+        default_left = self.default_left.ravel()
+        values = X.ravel()
+        row_base = np.arange(n, dtype=np.intp)[:, None] * X.shape[1]
+
+        # every row starts at the root, so the first level is a plain column gather
+        x = X.take(self.feature[:, 0], axis=1)
+        go_left = x < self.threshold[:, 0]
+        missing = np.isnan(x)
+        if missing.any():
+            go_left |= missing & self.default_left[:, 0]
+        node = 2 - go_left.astype(np.intp)
+
+        for _ in range(1, self.depth):
+            flat = node_base + node
+            x = values.take(row_base + feature.take(flat))
+            go_left = x < threshold.take(flat)
+            missing = np.isnan(x)
+            if missing.any():
+                go_left[missing] = default_left.take(flat[missing])
+            node = 2 * node + 2 - go_left
+
+        leaves = self.leaf_value.ravel().take(leaf_base + node - n_internal)
+        return leaves.sum(axis=1, dtype=np.float64) + self.base_score
+
+    def predict(self, X):
+        """
+        X: (n, n_features) matrix in the training feature order
+        returns: (n,) float64 predictions
+        """
+        # xgboost compares float32 features against float32 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2:
+            raise ValueError(f"Expected a 2D feature matrix, got shape {X.shape}")
+
+        chunk = max(1, _CHUNK_ELEMENTS // max(self.n_trees, 1))
+        if len(X) <= chunk:
+            return self._predict_chunk(X)
+        return np.concatenate([self._predict_chunk(X[i:i + chunk]) for i in range(0, len(X), chunk)])
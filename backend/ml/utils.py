@@ -1,3 +1,4 @@
+import numpy as np
 
 def temp_comfort_score(temp_max):
     """Score temperature based on golden zone of 65-78F."""
@@ -72,4 +73,71 @@ def compute_comfort_index(row):
     )
 
     # Scale to 0–100
-    return comfort * 100
\ No newline at end of file
+    return comfort * 100
+
+# -------------------------------------------------------------------
+# Vectorized engine
+#
+# Array versions of the scoring functions above. The scalar functions
+# stay as the reference implementation; these mirror them operation
+# for operation so results are bit-for-bit identical.
+# -------------------------------------------------------------------
+
+def _clip_at_zero(score):
+    """Array form of max(0, score) (NaN falls through to 0 like the builtin)."""
+    return np.where(score > 0, score, 0.0)
+
+def temp_comfort_scores(temp_max):
+    """Vectorized temp_comfort_score."""
+    t = np.asarray(temp_max, dtype=np.float64)
+    min_diff, max_diff = np.abs(t - 65), np.abs(t - 78)
+    score = _clip_at_zero(1 - (np.minimum(min_diff, max_diff) / 25))
+    return np.where((65 <= t) & (t <= 78), 1.0, score)
+
+def rain_comfort_scores(precip_mm):
+    """Vectorized rain_comfort_score."""
+    p = np.asarray(precip_mm, dtype=np.float64)
+    return np.select([p == 0, p < 2, p < 10], [1.0, 0.6, 0.3], default=0.0)
+
+def humidity_comfort_scores(h):
+    """Vectorized humidity_comfort_score (NaN where the scalar returns None)."""
+    h = np.asarray(h, dtype=np.float64)
+    too_dry = _clip_at_zero(1 - (30 - h) / 30)
+    too_humid = _clip_at_zero(1 - (h - 60) / 40)
+    return np.select([(30 <= h) & (h <= 60), h < 30, h > 60], [1.0, too_dry, too_humid], default=np.nan)
+
+def wind_comfort_scores(wind_kmh):
+    """Vectorized wind_comfort_score."""
+    w = np.asarray(wind_kmh, dtype=np.float64)
+    decay = _clip_at_zero(1 - (w - 24) / 24)
+    return np.select([w <= 24, w <= 48], [1.0, decay], default=0.0)
+
+def cloud_comfort_scores(cloud_pct):
+    """Vectorized cloud_comfort_score."""
+    c = np.asarray(cloud_pct, dtype=np.float64)
+    return _clip_at_zero(1 - np.abs(c - 50) / 50)
+
+
+def compute_comfort_indices(temp_max, precipitation, humidity_max, wind_max, cloudcover):
+    """Compute comfort index for whole columns at once (see compute_comfort_index)."""
+
+    comfort = (
+        0.40 * temp_comfort_scores(temp_max) +
+        0.30 * rain_comfort_scores(precipitation) +
+        0.10 * humidity_comfort_scores(humidity_max) +
+        0.10 * wind_comfort_scores(wind_max) +
+        0.10 * cloud_comfort_scores(cloudcover)
+    )
+
+    # Scale to 0–100
+    return comfort * 100
+
+def compute_comfort_index_frame(df):
+    """Vectorized compute_comfort_index over every row of a DataFrame."""
+    return compute_comfort_indices(
+        df["temp_max"].to_numpy(dtype=np.float64),
+        df["precipitation"].to_numpy(dtype=np.float64),
+        df["humidity_max"].to_numpy(dtype=np.float64),
+        df["wind_max"].to_numpy(dtype=np.float64),
+        df["cloudcover"].to_numpy(dtype=np.float64),
+    )
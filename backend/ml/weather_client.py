@@ -0,0 +1,277 @@
+"""
+Shared outbound HTTP client for the Open-Meteo geocoding and forecast APIs.
+
+Every weather call goes through one pooled keep-alive requests.Session
+with connect/read deadlines and bounded, jittered retries, so a slow
+upstream can only hold a worker for a known amount of time.
+AsyncWeatherClient is the non-blocking httpx equivalent for async views.
+
+The transport is pluggable: pass any requests transport adapter (or an
+httpx transport for the async client), or point the base URLs at a local
+stand-in server, to keep tests offline.
+"""
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlencode
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Upstream statuses worth retrying; anything else is returned/raised as-is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class WeatherClientError(Exception):
+    """Raised when an upstream weather call fails after all retries."""
+
+
+def build_url(base_url, params):
+    """Encode query parameters onto a URL (commas kept readable for variable lists)."""
+    if not params:
+        return base_url
+    query = urlencode({k: v for k, v in params.items() if v is not None}, safe=",")
+    return f"{base_url}?{query}"
+
+
+def _retry_delay(backoff, attempt):
+    """Exponential backoff with +/-50% jitter so retries don't stampede."""
+    return backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _parse_geocode(resp):
+    """Reduce a geocoding response to {"lat", "lon"} of the best match, or None."""
+    if resp.get("error"):
+        raise WeatherClientError(f"Geocoding failed: {resp.get('reason')}")
+    if "results" not in resp or len(resp["results"]) == 0:
+        return None
+
+    result = resp["results"][0]
+    return {
+        "lat": result["latitude"],
+        "lon": result["longitude"],
+    }
+
+
+class WeatherClient:
+    def __init__(
+        self,
+        geocoding_url=GEOCODING_URL,
+        forecast_url=FORECAST_URL,
+        transport=None,
+        connect_timeout=3.05,
+        read_timeout=10.0,
+        retries=2,
+        backoff=0.25,
+        pool_size=20,
+    ):
+        """
+        transport: requests transport adapter to mount instead of the pooled HTTPAdapter
+        connect_timeout, read_timeout: per-attempt deadlines in seconds
+        retries: extra attempts after the first on timeouts, connection errors and 429/5xx
+        backoff: base delay in seconds, doubled per attempt with +/-50% jitter
+        """
+        self.geocoding_url = geocoding_url
+        self.forecast_url = forecast_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        adapter = transport or HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_json(self, base_url, params=None, require_ok=False):
+        """
+        GET a URL and decode its JSON body, retrying transient failures.
+
+        require_ok: raise WeatherClientError for any non-200 answer instead of
+                    decoding its (error) body
+        """
+        url = build_url(base_url, params)
+        last_error = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(_retry_delay(self.backoff, attempt - 1))
+            try:
+                resp = self.session.get(url, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+                continue
+
+            if resp.status_code in RETRY_STATUSES:
+                last_error = WeatherClientError(f"{resp.status_code} from {base_url}")
+                continue
+            if require_ok and resp.status_code != 200:
+                raise WeatherClientError(f"{resp.status_code} from {base_url}")
+
+            try:
+                return resp.json()
+            except ValueError as e:
+                raise WeatherClientError(f"Invalid JSON from {base_url}: {e}") from e
+
+        raise WeatherClientError(
+            f"{base_url} failed after {self.retries + 1} attempts: {last_error}"
+        ) from last_error
+
+    def geocode(self, city_name):
+        """
+        returns: {"lat": ..., "lon": ...} for the best match, or None if unknown
+        raises: WeatherClientError unless the lookup got a 200 answer
+        """
+        # an error body would otherwise parse as "unknown" and get cached as such
+        return _parse_geocode(self.get_json(self.geocoding_url, {"name": city_name, "count": 1}, require_ok=True))
+
+    def forecast(self, params):
+        """Fetch a forecast; params are Open-Meteo query parameters incl. latitude/longitude."""
+        return self.get_json(self.forecast_url, params)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncWeatherClient:
+    """Non-blocking counterpart of WeatherClient built on httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        geocoding_url=GEOCODING_URL,
+        forecast_url=FORECAST_URL,
+        transport=None,
+        connect_timeout=3.05,
+        read_timeout=10.0,
+        retries=2,
+        backoff=0.25,
+        pool_size=20,
+    ):
+        """
+        transport: httpx async transport to use instead of the pooled default
+        other options: as for WeatherClient; pool_size caps concurrent connections
+        """
+        self.geocoding_url = geocoding_url
+        self.forecast_url = forecast_url
+        self.retries = retries
+        self.backoff = backoff
+
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    async def get_json(self, base_url, params=None, require_ok=False):
+        """
+        GET a URL and decode its JSON body, retrying transient failures.
+
+        require_ok: raise WeatherClientError for any non-200 answer instead of
+                    decoding its (error) body
+        """
+        url = build_url(base_url, params)
+        last_error = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(_retry_delay(self.backoff, attempt - 1))
+            try:
+                resp = await self.client.get(url)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                last_error = e
+                continue
+
+            if resp.status_code in RETRY_STATUSES:
+                last_error = WeatherClientError(f"{resp.status_code} from {base_url}")
+                continue
+            if require_ok and resp.status_code != 200:
+                raise WeatherClientError(f"{resp.status_code} from {base_url}")
+
+            try:
+                return resp.json()
+            except ValueError as e:
+                raise WeatherClientError(f"Invalid JSON from {base_url}: {e}") from e
+
+        raise WeatherClientError(
+            f"{base_url} failed after {self.retries + 1} attempts: {last_error}"
+        ) from last_error
+
+    async def geocode(self, city_name):
+        """
+        returns: {"lat": ..., "lon": ...} for the best match, or None if unknown
+        raises: WeatherClientError unless the lookup got a 200 answer
+        """
+        return _parse_geocode(
+            await self.get_json(self.geocoding_url, {"name": city_name, "count": 1}, require_ok=True)
+        )
+
+    async def forecast(self, params):
+        """Fetch a forecast; params are Open-Meteo query parameters incl. latitude/longitude."""
+        return await self.get_json(self.forecast_url, params)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_client = None
+_client_lock = threading.Lock()
+_client_options = {}
+# httpx connection pools are bound to an event loop, so keep one async client
+# per loop: {loop: (client, task closing it)}. Entries remove themselves when
+# their loop shuts down (see _close_with_loop).
+_async_clients = {}
+
+
+def configure(**options):
+    """Replace the shared client's options (e.g. from Django settings or a test)."""
+    global _client
+    with _client_lock:
+        _client_options.clear()
+        _client_options.update(options)
+        if _client is not None:
+            _client.close()
+        _client = None
+        for loop, (_, closer) in list(_async_clients.items()):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(closer.cancel)
+        _async_clients.clear()
+
+
+def get_client():
+    """Return the process-wide WeatherClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = WeatherClient(**_client_options)
+    return _client
+
+
+async def _close_with_loop(loop, client):
+    """
+    Wait until cancelled, then close the loop's client. asyncio.run() cancels
+    pending tasks before closing its loop, so this runs both when a
+    long-lived server loop shuts down and after every async view served
+    under WSGI, where asgiref runs each call in a loop of its own.
+    """
+    try:
+        await loop.create_future()
+    finally:
+        if _async_clients.get(loop, (None,))[0] is client:
+            del _async_clients[loop]
+        await client.aclose()
+
+
+def get_async_client():
+    """Return the AsyncWeatherClient for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        client = AsyncWeatherClient(**_client_options)
+        # held here because the loop itself only keeps weak references to tasks
+        entry = _async_clients[loop] = (client, loop.create_task(_close_with_loop(loop, client)))
+    return entry[0]
@@ -1,17 +1,56 @@
-import requests
+import numpy as np
+from backend.ml.weather_client import get_client
+
+# Reductions available to aggregate_hourly_to_daily: (ufunc applied per day, start value)
+_DAILY_REDUCERS = {
+    "max": (np.fmax, -np.inf),
+    "min": (np.fmin, np.inf),
+    "sum": (np.add, 0.0),
+}
 
 def geocode_city(city_name):
-    url = f"https://geocoding-api.open-meteo.com/v1/search?name={city_name}&count=1"
-    resp = requests.get(url).json()
+    return get_client().geocode(city_name)
+
+def aggregate_hourly_to_daily(hourly, daily_times, aggregations):
+    """
+    hourly: Open-Meteo "hourly" block ({"time": [...], <variable>: [...]})
+    daily_times: the daily["time"] dates the output rows line up with
+    aggregations: list of (hourly_variable, how) pairs, how in "max", "min", "sum", "mean"
+    returns: float matrix of shape (len(daily_times), len(aggregations));
+             NaN where a day has no (non-null) hourly values
+
+    Every hour is bucketed to its day once, then each variable is reduced
+    in a single grouped pass, so cost is O(hours) not O(days x hours).
+    """
+    days = np.asarray(daily_times, dtype="datetime64[D]")
+    out = np.full((len(days), len(aggregations)), np.nan)
+    if len(days) == 0 or len(hourly.get("time", [])) == 0:
+        return out
+
+    hour_days = np.asarray(hourly["time"], dtype="datetime64").astype("datetime64[D]")
+
+    # day index of every hour (days are sorted); drop hours outside the daily range
+    idx = np.searchsorted(days, hour_days)
+    in_range = idx < len(days)
+    in_range[in_range] = days[idx[in_range]] == hour_days[in_range]
+
+    for col, (variable, how) in enumerate(aggregations):
+        values = np.asarray(hourly[variable], dtype=np.float64)
+        keep = in_range & ~np.isnan(values)
+        day_idx, vals = idx[keep], values[keep]
+
+        counts = np.bincount(day_idx, minlength=len(days))
+        if how == "mean":
+            totals = np.bincount(day_idx, weights=vals, minlength=len(days))
+            result = totals / np.maximum(counts, 1)
+        else:
+            ufunc, start = _DAILY_REDUCERS[how]
+            result = np.full(len(days), start)
+            ufunc.at(result, day_idx, vals)
 
-    if "results" not in resp or len(resp["results"]) == 0:
-        return None
+        out[:, col] = np.where(counts > 0, result, np.nan)
 
-    result = resp["results"][0]
-    return {
-        "lat": result["latitude"],
-        "lon": result["longitude"],
-    }
+    return out
 
 def main():
     city = "San Francisco"
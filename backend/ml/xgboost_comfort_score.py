@@ -1,5 +1,3 @@
-import xgboost as xgb
-
 class XGBoostComfortScoreModel:
     """
     Defines the comfort score regression model architecture
@@ -19,8 +17,8 @@ class XGBoostComfortScoreModel:
         "month",           
     ]
 
-    def __init__(self):
-        self.xgb_model = xgb.XGBRegressor(
+    # Default hyperparameters; any of them can be overridden per instance
+    PARAMS = dict(
         n_estimators=6000,        # deeper trees → fewer needed
         learning_rate=0.03,       # keep LR constant for stability
         max_depth=3,              # from 3 → 6 (massive improvement)
@@ -31,5 +29,19 @@ class XGBoostComfortScoreModel:
         reg_lambda=5,
         random_state=42,
         early_stopping_rounds=150,
-        )
+        tree_method="hist",       # histogram split finding
+        max_bin=256,              # histogram buckets per feature
+        n_jobs=None,              # threads; None = all cores
+    )
+
+    def __init__(self, **overrides):
+        # imported here so reading FEATURES doesn't pull in xgboost
+        import xgboost as xgb
+
+        unknown = set(overrides) - set(self.PARAMS)
+        if unknown:
+            raise ValueError(f"Unknown XGBoost parameters: {sorted(unknown)}")
+
+        self.params = {**self.PARAMS, **overrides}
+        self.xgb_model = xgb.XGBRegressor(**self.params)
         
\ No newline at end of file
@@ -60,6 +60,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "api.auth_cache.SessionRefreshMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -148,6 +149,117 @@ STORAGES = {
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Media serving (api/media.py). Files under these prefixes are content-hashed
+# and never change, so clients may cache them for a year; others revalidate.
+MEDIA_IMMUTABLE_PREFIXES = ("trip_images/derived/",)
+MEDIA_CACHE_MAX_AGE = 60 * 60
+# Let the front proxy send media bodies: "x-accel-redirect" (nginx, with an
+# internal location at MEDIA_ACCEL_REDIRECT_PREFIX aliased to MEDIA_ROOT),
+# "x-sendfile" (Apache mod_xsendfile / lighttpd), or empty to stream from Django
+MEDIA_SERVE_OFFLOAD = os.getenv("MEDIA_SERVE_OFFLOAD", "")
+MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+
+# ==============================================================
+# OUTBOUND WEATHER CLIENT
+# ==============================================================
+
+# Options for backend.ml.weather_client.WeatherClient (timeouts in seconds)
+WEATHER_CLIENT = {
+    "connect_timeout": float(os.getenv("WEATHER_CONNECT_TIMEOUT", "3.05")),
+    "read_timeout": float(os.getenv("WEATHER_READ_TIMEOUT", "10")),
+    "retries": int(os.getenv("WEATHER_RETRIES", "2")),
+    "backoff": 0.25,
+    "pool_size": 20,
+}
+
+# Threads the async weather views use for model inference
+COMFORT_INFERENCE_WORKERS = int(os.getenv("COMFORT_INFERENCE_WORKERS", "2"))
+# Multi-city comparison: cities per request, and upstream fetches in flight at once
+COMFORT_COMPARE_MAX_CITIES = 25
+COMFORT_COMPARE_CONCURRENCY = 8
+
+# ==============================================================
+# GEOCODING
+# ==============================================================
+
+# In-process LRU size, in front of the shared GeocodeCache table
+GEOCODE_CACHE_SIZE = int(os.getenv("GEOCODE_CACHE_SIZE", "2048"))
+# How long an unknown city name stays cached as "not found" (seconds)
+GEOCODE_NEGATIVE_TTL = int(os.getenv("GEOCODE_NEGATIVE_TTL", str(24 * 60 * 60)))
+
+# ==============================================================
+# CACHES
+# ==============================================================
+
+# Per-process memory cache by default; point REDIS_URL at a shared
+# Redis (needs the `redis` package) so every worker and instance
+# shares one cache.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Whether every worker sees the same cache. Caches that rely on
+# cross-process invalidation (destination pages) are only used then.
+SHARED_CACHE = bool(os.getenv("REDIS_URL"))
+
+# ==============================================================
+# FORECAST CACHE
+# ==============================================================
+
+# Seconds a forecast is served as fresh, per endpoint
+FORECAST_CACHE_TTLS = {
+    "default": 15 * 60,
+    "current": 10 * 60,
+    "daily": 60 * 60,
+}
+# Extra seconds a forecast may be served stale while one refresh runs
+FORECAST_CACHE_STALE_TTLS = {
+    "default": 60 * 60,
+    "current": 30 * 60,
+    "daily": 6 * 60 * 60,
+}
+# Decimal places lat/lon are rounded to before keying (2 ≈ 1 km)
+FORECAST_CACHE_COORD_PRECISION = 2
+# Lock lifetime so a crashed refresh doesn't block later ones forever
+FORECAST_CACHE_REFRESH_TIMEOUT = 30
+# Days (from today) Open-Meteo forecasts; later dates are answered from
+# the precomputed comfort climatology (backend/ml/climatology.py)
+FORECAST_HORIZON_DAYS = 16
+# Cities without their own climatology use the nearest station within this range
+CLIMATOLOGY_MAX_STATION_KM = 500
+# Longest date range (in days) a comfort request may ask for
+COMFORT_MAX_RANGE_DAYS = 366
+
+# Bucket list / My Trips pages (?limit=, ?cursor=)
+TRIP_LIST_PAGE_SIZE = 50
+TRIP_LIST_MAX_PAGE_SIZE = 200
+
+# Destinations API pages (api/destinations.py), cached until a Destination
+# changes or for this many seconds
+DESTINATIONS_PAGE_SIZE = 50
+DESTINATIONS_MAX_PAGE_SIZE = 200
+DESTINATIONS_CACHE_TTL = 10 * 60
+
+# Resized copies of uploaded trip images (api/trip_images.py):
+# variant -> longest edge in px
+TRIP_IMAGE_VARIANTS = {"thumb": 240, "card": 800, "full": 1920}
+# Variants returned as "image" by the trip list and trip detail APIs
+TRIP_IMAGE_LIST_VARIANT = "card"
+TRIP_IMAGE_DETAIL_VARIANT = "full"
+TRIP_IMAGE_QUALITY = 82
+# Background threads rendering them; 0 renders inline when the upload commits
+TRIP_IMAGE_WORKERS = 2
+
 # ==============================================================
 # CORS / COOKIES
 # ==============================================================
@@ -178,6 +290,24 @@ SESSION_COOKIE_SAMESITE = "Lax"
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SECURE = not DEBUG  # True in production
 SESSION_COOKIE_AGE = 1209600
+# With a SHARED_CACHE, sessions are read from the cache and written through
+# to the database (which remains the source of truth if the cache is
+# cleared). Per-process caches would let other workers keep serving a
+# session that logout or clearsessions deleted, so they use the database.
+SESSION_ENGINE = os.getenv(
+    "SESSION_ENGINE",
+    "django.contrib.sessions.backends.cached_db" if SHARED_CACHE else "django.contrib.sessions.backends.db",
+)
+# A session is only re-saved (renewing its expiry) once less than this many
+# seconds of it remain; see api.auth_cache.SessionRefreshMiddleware
+SESSION_REFRESH_WINDOW = SESSION_COOKIE_AGE // 2
+
+# With a SHARED_CACHE, per-request user lookups come from the cache (entries
+# are dropped on User save, which has to reach every worker)
+AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend"]
+if SHARED_CACHE:
+    AUTHENTICATION_BACKENDS.insert(0, "api.auth_cache.CachedModelBackend")
+AUTH_USER_CACHE_TTL = 10 * 60
 
 DJANGO_VITE = {
     "default": {
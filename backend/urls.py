@@ -14,26 +14,23 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.views.generic import TemplateView
 from django.conf import settings
-from django.conf.urls.static import static
 from django.views.decorators.csrf import ensure_csrf_cookie
 from api.views import IndexView
+from api.media import serve_media
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('api.urls')),
     path('', IndexView.as_view(), name="index"),
 ]
 
-# Serve media files in development - always serve media files
-# This ensures images are accessible even if DEBUG is False
-from django.views.static import serve
-from django.urls import re_path
-
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-# Additional catch-all for media files to ensure they're served
+# User uploads, with caching headers, range requests and optional proxy
+# offload (see api/media.py); served whatever the DEBUG setting
 urlpatterns += [
-    re_path(r'^media/(?P<path>.*)$', serve, {'document_root': settings.MEDIA_ROOT}),
+    re_path(rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.*)$", serve_media, name="media"),
 ]
@@ -153,12 +153,20 @@ export async function checkAuth() {
   }
 }
 
+function pageQuery(cursor, limit) {
+  const params = new URLSearchParams();
+  if (cursor) params.set('cursor', cursor);
+  if (limit) params.set('limit', limit);
+  const query = params.toString();
+  return query ? `?${query}` : '';
+}
+
 /**
- * Get bucket list trips
+ * Get bucket list trips (one page; pass the previous response's next_cursor for the next)
  */
-export async function getBucketList() {
+export async function getBucketList({ cursor, limit } = {}) {
   try {
-    return await apiRequest('/bucket-list/');
+    return await apiRequest('/bucket-list/' + pageQuery(cursor, limit));
   } catch (error) {
     console.error('Error fetching bucket list:', error);
     throw error;
@@ -166,11 +174,11 @@ export async function getBucketList() {
 }
 
 /**
- * Get my trips
+ * Get my trips (one page; pass the previous response's next_cursor for the next)
  */
-export async function getMyTrips() {
+export async function getMyTrips({ cursor, limit } = {}) {
   try {
-    return await apiRequest('/my-trips/');
+    return await apiRequest('/my-trips/' + pageQuery(cursor, limit));
   } catch (error) {
     console.error('Error fetching my trips:', error);
     throw error;
@@ -463,3 +471,18 @@ export async function getCurrentWeather(city) {
     throw error;
   }
 }
+
+/**
+ * Compare comfort scores for several cities over one date range
+ */
+export async function compareComfort(cities, startDate, endDate) {
+  try {
+    return await apiRequest('/comfort-compare/', {
+      method: 'POST',
+      body: JSON.stringify({ cities, start_date: startDate, end_date: endDate }),
+    });
+  } catch (error) {
+    console.error('Error comparing comfort scores:', error);
+    throw error;
+  }
+}